@@ -1,5 +1,5 @@
 import reflex as rx
-from app.state import AppState
+from app.state import AppState, LedgerState, AccountFormState, TransactionFormState
 from app.components import (
     account_form,
     transaction_form,
@@ -10,6 +10,7 @@ from app.components import (
 from app.settings import settings_modal
 from app.reports import reports_view
 from app.dashboard import dashboard_view
+from app.export import mount_export_route
 
 
 def tab_button(text: str, tab_name: str) -> rx.Component:
@@ -32,7 +33,7 @@ def chart_of_accounts_view() -> rx.Component:
             class_name="text-xl font-semibold text-gray-700 mb-6 font-['JetBrains_Mono']",
         ),
         rx.el.div(
-            rx.foreach(AppState.accounts, account_card),
+            rx.foreach(LedgerState.account_cards, account_card),
             class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6",
         ),
     )
@@ -142,20 +143,20 @@ def index() -> rx.Component:
             rx.el.div(
                 rx.el.button(
                     rx.icon("user-plus", class_name="w-6 h-6"),
-                    on_click=AppState.toggle_account_form,
+                    on_click=AccountFormState.toggle_account_form,
                     data_shortcut="new-account",
                     class_name="bg-emerald-500 text-white p-4 rounded-full shadow-lg hover:bg-emerald-600 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-emerald-500 transition-all duration-300 hover:scale-110",
                 ),
                 rx.el.button(
                     rx.icon("file-plus-2", class_name="w-6 h-6"),
-                    on_click=AppState.toggle_transaction_form,
+                    on_click=TransactionFormState.toggle_transaction_form,
                     data_shortcut="new-transaction",
                     class_name="bg-emerald-500 text-white p-4 rounded-full shadow-lg hover:bg-emerald-600 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-emerald-500 transition-all duration-300 hover:scale-110",
                 ),
                 class_name="fixed bottom-6 right-6 flex flex-col gap-4 z-20",
             ),
-            rx.cond(AppState.show_account_form, account_form(), None),
-            rx.cond(AppState.show_transaction_form, transaction_form(), None),
+            rx.cond(AccountFormState.show_account_form, account_form(), None),
+            rx.cond(TransactionFormState.show_transaction_form, transaction_form(), None),
             rx.cond(AppState.show_settings, settings_modal(), None),
         ),
         class_name="font-['JetBrains_Mono'] bg-gray-50 min-h-screen",
@@ -178,5 +179,6 @@ app = rx.App(
             rel="stylesheet",
         ),
     ],
+    api_transformer=mount_export_route,
 )
-app.add_page(index, on_load=AppState.load_from_storage)
\ No newline at end of file
+app.add_page(index, on_load=LedgerState.load_from_storage)
\ No newline at end of file
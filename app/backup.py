@@ -0,0 +1,314 @@
+"""Streaming import of JSON backups.
+
+``BackupReader`` parses a backup written by ``LedgerState.export_data``,
+``{"accounts": [...], "transactions": [...]}``, as its bytes arrive. It
+yields one record at a time, so the file is never held in memory whole.
+Accounts carry their ``balance`` and the ``opening_balance`` that no
+transaction accounts for; amounts are in currency units.
+``BackupImport`` validates and normalizes those records into a staged
+ledger. ``LedgerState.import_data`` swaps the staged ledger in only after
+the whole file has been read.
+"""
+
+import codecs
+import json
+import math
+import uuid
+from typing import Any, Collection
+
+from app.ledger import AccountIndex, transaction_error
+from app.money import from_cents, to_cents, transaction_to_cents
+
+# Sections of a backup that are streamed record by record; other keys are skipped.
+BACKUP_SECTIONS = ("accounts", "transactions")
+
+# Largest single record (or skipped value) the reader will buffer.
+MAX_RECORD_CHARS = 4 * 1024 * 1024
+
+# A decode error this close to the end of the buffer may just be a value cut
+# off mid-token (``tru``, ``-Infin``, ``"\u00``); further from the end it is
+# a syntax error whatever the next chunk holds.
+TRUNCATION_WINDOW = 16
+
+_decoder = json.JSONDecoder()
+_INCOMPLETE = object()
+_WHITESPACE = " \t\n\r"
+# Characters that can extend a number token, e.g. ``-1.`` + ``5e3``.
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+def _is_amount(value: Any) -> bool:
+    """Whether ``value`` is a currency amount ``to_cents`` reads faithfully (or empty)."""
+    if value in (None, ""):
+        return True
+    if isinstance(value, bool):
+        return False
+    try:
+        return math.isfinite(float(value))
+    except (TypeError, ValueError):
+        return False
+
+
+class BackupReader:
+    """Incremental parser yielding ``(section, record)`` pairs from a backup.
+
+    Call ``feed`` with each chunk of the file, then ``close``. Raises
+    ``ValueError`` if the file is not a JSON object, a separator is missing
+    or misplaced, a section appears twice or a record is malformed.
+    """
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0  # characters of the file before ``_buffer``
+        # start, key, colon, value, key_sep, items, item_sep, done
+        self._step = "start"
+        # Whether the cursor is just inside ``{`` or ``[``, where a closing
+        # bracket may follow without a value before it.
+        self._first = False
+        self._key = ""
+        self.sections_seen: set[str] = set()
+
+    def feed(self, data: bytes) -> list[tuple[str, dict]]:
+        """Consume ``data`` and return the records it completed."""
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(data)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list[tuple[str, dict]]:
+        """Parse what is left of the file; raises ``ValueError`` if it is truncated."""
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        records = self._parse(final=True)
+        if self._step != "done":
+            raise ValueError("unexpected end of backup file")
+        return records
+
+    def _parse(self, final: bool) -> list[tuple[str, dict]]:
+        records = []
+        while True:
+            self._skip_whitespace()
+            if self._pos == len(self._buffer):
+                return records
+            char = self._buffer[self._pos]
+            if self._step == "start":
+                self._expect(char, "{")
+                self._step, self._first = "key", True
+            elif self._step == "key":
+                if char == "}" and self._first:
+                    self._pos += 1
+                    self._step = "done"
+                    continue
+                self._expect_value(char, '"', "a key")
+                key = self._decode(final)
+                if key is _INCOMPLETE:
+                    return records
+                self._key = key
+                self._step = "colon"
+            elif self._step == "colon":
+                self._expect(char, ":")
+                self._step = "value"
+            elif self._step == "value":
+                if self._key in BACKUP_SECTIONS:
+                    if self._key in self.sections_seen:
+                        raise ValueError(f"duplicate {self._key!r} section in backup")
+                    self._expect(char, "[")
+                    self.sections_seen.add(self._key)
+                    self._step, self._first = "items", True
+                elif self._decode(final) is _INCOMPLETE:
+                    return records
+                else:
+                    self._step = "key_sep"
+            elif self._step == "key_sep":
+                if char == "}":
+                    self._pos += 1
+                    self._step = "done"
+                    continue
+                self._expect(char, ",")
+                self._step, self._first = "key", False
+            elif self._step == "items":
+                if char == "]" and self._first:
+                    self._pos += 1
+                    self._step = "key_sep"
+                    continue
+                self._expect_value(char, "{", f"a {self._key} record")
+                record = self._decode(final)
+                if record is _INCOMPLETE:
+                    return records
+                records.append((self._key, record))
+                self._step = "item_sep"
+            elif self._step == "item_sep":
+                if char == "]":
+                    self._pos += 1
+                    self._step = "key_sep"
+                    continue
+                self._expect(char, ",")
+                self._step, self._first = "items", False
+            else:
+                raise ValueError("unexpected data after the backup object")
+
+    def _skip_whitespace(self):
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+
+    def _expect(self, char: str, token: str):
+        """Consume ``token``, which must be the character at the cursor."""
+        self._expect_value(char, token, repr(token))
+        self._pos += 1
+
+    def _expect_value(self, char: str, first: str, what: str):
+        """Check that the value at the cursor starts with ``first``, without consuming it."""
+        if char != first:
+            raise ValueError(
+                f"expected {what} in backup at character {self._offset + self._pos}, found {char!r}"
+            )
+
+    def _decode(self, final: bool):
+        """Decode the JSON value at the cursor, or ``_INCOMPLETE`` if it needs more data."""
+        error = None
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if final or not self._truncated(e):
+                raise ValueError(self._describe(e)) from None
+            value, end, error = _INCOMPLETE, -1, e
+        # A value that runs to the end of the buffer may continue in the next
+        # chunk, as may a number followed only by characters that extend it.
+        if not final and (
+            end in (-1, len(self._buffer))
+            or (isinstance(value, (int, float)) and not self._buffer[end:].strip(_NUMBER_CHARS))
+        ):
+            if len(self._buffer) - self._pos > MAX_RECORD_CHARS:
+                detail = f" ({self._describe(error)})" if error else ""
+                raise ValueError(
+                    f"backup record at character {self._offset + self._pos} is larger "
+                    f"than {MAX_RECORD_CHARS} characters{detail}"
+                )
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _truncated(self, error: json.JSONDecodeError) -> bool:
+        """Whether ``error`` may only mean the value continues in the next chunk."""
+        return (
+            error.msg.startswith("Unterminated string")
+            or len(self._buffer) - error.pos <= TRUNCATION_WINDOW
+        )
+
+    def _describe(self, error: json.JSONDecodeError) -> str:
+        # Some decoder messages ("Unterminated string starting at") end in the position's preposition.
+        message = error.msg.removesuffix(" at")
+        return f"malformed JSON in backup: {message} at character {self._offset + error.pos}"
+
+
+class BackupImport:
+    """A ledger staged from backup records, validated as they arrive.
+
+    Accounts must precede transactions, as they do in exported backups.
+    Accounts are staged at their ``opening_balance`` (zero if absent), the
+    part of a balance that no transaction records; ``LedgerState.import_data``
+    posts the staged entries on top of it. A ``balance`` in the file must
+    equal that opening balance plus the account's entries, or the import is
+    rejected. Transactions are checked with the same rules as posting (see
+    ``app.ledger.transaction_error``).
+    """
+
+    def __init__(self, account_types: Collection[str]):
+        self.account_types = account_types
+        self.accounts: list[dict] = []
+        self.transactions: list[dict] = []
+        self._account_index: AccountIndex | None = None
+        self._account_ids: set[str] = set()
+        self._codes: set[str] = set()
+        self._transaction_ids: set[str] = set()
+        # Account id -> file balance (cents) and running debit - credit of staged entries.
+        self._stated_balances: dict[str, int] = {}
+        self._net: dict[str, int] = {}
+
+    def add_account(self, record: dict):
+        """Validate and stage one account; raises ``ValueError`` if it is invalid."""
+        if self._account_index is not None:
+            raise ValueError("accounts must come before transactions in the backup")
+        number = len(self.accounts) + 1
+        account = {
+            "id": str(record.get("id") or "").strip(),
+            "name": str(record.get("name") or "").strip(),
+            "code": str(record.get("code") or "").strip(),
+            "type": record.get("type"),
+            "balance": to_cents(record.get("opening_balance")),
+        }
+        if not account["id"] or not account["name"] or not account["code"]:
+            raise ValueError(f"account #{number}: missing id, name or code")
+        if account["type"] not in self.account_types:
+            raise ValueError(f"account #{number}: unknown type {account['type']!r}")
+        if account["code"] in self._codes:
+            raise ValueError(f"account #{number}: duplicate code {account['code']}")
+        for field in ("balance", "opening_balance"):
+            if not _is_amount(record.get(field)):
+                raise ValueError(f"account #{number}: invalid {field} {record.get(field)!r}")
+        if account["id"] in self._account_ids:
+            raise ValueError(f"account #{number}: duplicate id {account['id']}")
+        if record.get("balance") not in (None, ""):
+            self._stated_balances[account["id"]] = to_cents(record.get("balance"))
+        self._account_ids.add(account["id"])
+        self._codes.add(account["code"])
+        self.accounts.append(account)
+
+    def add_transaction(self, record: dict):
+        """Validate and stage one transaction (amounts in currency units).
+
+        The first transaction closes the accounts section, so its account
+        references, and every later one, are checked as the record arrives.
+        """
+        if self._account_index is None:
+            self._finish_accounts()
+        number = len(self.transactions) + 1
+        entries = record.get("entries") or record.get("lines") or []
+        if not isinstance(entries, list) or not all(
+            isinstance(e, dict) and _is_amount(e.get("debit")) and _is_amount(e.get("credit"))
+            for e in entries
+        ):
+            raise ValueError(f"transaction #{number}: malformed entries")
+        txn = transaction_to_cents(record)
+        txn = {
+            "id": str(record.get("id") or uuid.uuid4()),
+            "date": str(record.get("date") or ""),
+            "description": str(record.get("description") or "").strip(),
+            "entries": txn["entries"],
+        }
+        error = transaction_error(txn, self._account_index, self._transaction_ids)
+        if error:
+            raise ValueError(f"transaction #{number}: {error}")
+        self._transaction_ids.add(txn["id"])
+        self.transactions.append(txn)
+        for entry in txn["entries"]:
+            self._net[entry["account_id"]] = (
+                self._net.get(entry["account_id"], 0) + entry["debit"] - entry["credit"]
+            )
+
+    def finish(self) -> tuple[list[dict], list[dict]]:
+        """Return the staged ``(accounts, transactions)``, accounts sorted by code.
+
+        Accounts still hold their opening balances. Raises ``ValueError`` if
+        a balance stated in the file disagrees with opening balance plus entries.
+        """
+        if self._account_index is None:
+            self._finish_accounts()
+        for account in self.accounts:
+            stated = self._stated_balances.get(account["id"])
+            net = self._net.get(account["id"], 0)
+            expected = account["balance"] + (net if account["type"] in ("Asset", "Expense") else -net)
+            if stated is not None and stated != expected:
+                raise ValueError(
+                    f"account {account['code']}: balance {from_cents(stated):.2f} does not match "
+                    f"its opening balance plus entries ({from_cents(expected):.2f})"
+                )
+        return self.accounts, self.transactions
+
+    def _finish_accounts(self):
+        self.accounts.sort(key=lambda acc: acc["code"])
+        self._account_index = AccountIndex()
+        self._account_index.sync(self.accounts)
@@ -1,5 +1,5 @@
 import reflex as rx
-from app.state import AppState
+from app.state import AppState, LedgerState, FilterState, AccountFormState, TransactionFormState
 
 
 def transaction_list_view() -> rx.Component:
@@ -26,13 +26,13 @@ def transaction_list_view() -> rx.Component:
             ),
             rx.el.div(
                 rx.el.span(
-                    AppState.filtered_count_badge,
+                    FilterState.filtered_count_badge,
                     class_name="text-xs text-gray-500 px-2",
                 ),
                 class_name="mt-1",
             ),
             rx.cond(
-                AppState.filtered_transaction_count == 0,
+                FilterState.filtered_transaction_count == 0,
                 rx.el.div(
                     rx.el.p(
                         "No transactions match your filters.",
@@ -40,20 +40,52 @@ def transaction_list_view() -> rx.Component:
                     ),
                     rx.el.button(
                         "Reset filters",
-                        on_click=AppState.reset_filters,
+                        on_click=FilterState.reset_filters,
                         class_name="mt-2 px-3 py-1 text-sm text-white bg-gray-600 rounded-md",
                     ),
                     class_name="bg-white rounded-lg shadow-md border border-gray-200 mt-6 p-6 text-center",
                 ),
                 rx.el.div(
-                    rx.foreach(AppState.filtered_transactions_rows, transaction_list_item),
-                    class_name="bg-white rounded-lg shadow-md border border-gray-200 mt-6",
+                    rx.el.div(
+                        rx.foreach(FilterState.transaction_page_rows, transaction_list_item),
+                        class_name="bg-white rounded-lg shadow-md border border-gray-200 mt-6",
+                    ),
+                    pagination_controls(
+                        FilterState.previous_transaction_page,
+                        FilterState.next_transaction_page,
+                        FilterState.has_previous_transaction_page,
+                        FilterState.has_next_transaction_page,
+                    ),
                 ),
             ),
         ),
     )
 
 
+def pagination_controls(
+    on_previous: rx.EventHandler,
+    on_next: rx.EventHandler,
+    has_previous: rx.Var[bool],
+    has_next: rx.Var[bool],
+) -> rx.Component:
+    """Previous/Next buttons of a keyset-paged list."""
+    return rx.el.div(
+        rx.el.button(
+            AppState.t["previous_page"],
+            on_click=on_previous,
+            disabled=rx.cond(has_previous, False, True),
+            class_name="px-3 py-1 text-sm font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200 disabled:opacity-50 disabled:cursor-not-allowed",
+        ),
+        rx.el.button(
+            AppState.t["next_page"],
+            on_click=on_next,
+            disabled=rx.cond(has_next, False, True),
+            class_name="px-3 py-1 text-sm font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200 disabled:opacity-50 disabled:cursor-not-allowed",
+        ),
+        class_name="flex justify-end gap-2 mt-4",
+    )
+
+
 def filter_panel() -> rx.Component:
     return rx.el.div(
         rx.el.div(
@@ -62,8 +94,8 @@ def filter_panel() -> rx.Component:
                     AppState.t["start_date"],
                     rx.el.input(
                         type="date",
-                        default_value=AppState.filter_start_date,
-                        on_change=AppState.set_filter_start_date,
+                        default_value=FilterState.filter_start_date,
+                        on_change=FilterState.set_filter_start_date,
                         class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                     ),
                 ),
@@ -71,8 +103,8 @@ def filter_panel() -> rx.Component:
                     AppState.t["end_date"],
                     rx.el.input(
                         type="date",
-                        default_value=AppState.filter_end_date,
-                        on_change=AppState.set_filter_end_date,
+                        default_value=FilterState.filter_end_date,
+                        on_change=FilterState.set_filter_end_date,
                         class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                     ),
                 ),
@@ -81,27 +113,27 @@ def filter_panel() -> rx.Component:
             rx.el.div(
                 rx.el.button(
                     AppState.t["today"],
-                    on_click=lambda: AppState.set_date_filter_preset("today"),
+                    on_click=lambda: FilterState.set_date_filter_preset("today"),
                     class_name="px-3 py-1 text-xs font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200",
                 ),
                 rx.el.button(
                     AppState.t["this_week"],
-                    on_click=lambda: AppState.set_date_filter_preset("this_week"),
+                    on_click=lambda: FilterState.set_date_filter_preset("this_week"),
                     class_name="px-3 py-1 text-xs font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200",
                 ),
                 rx.el.button(
                     AppState.t["this_month"],
-                    on_click=lambda: AppState.set_date_filter_preset("this_month"),
+                    on_click=lambda: FilterState.set_date_filter_preset("this_month"),
                     class_name="px-3 py-1 text-xs font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200",
                 ),
                 rx.el.button(
                     AppState.t["this_year"],
-                    on_click=lambda: AppState.set_date_filter_preset("this_year"),
+                    on_click=lambda: FilterState.set_date_filter_preset("this_year"),
                     class_name="px-3 py-1 text-xs font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200",
                 ),
                 rx.el.button(
                     AppState.t["all_time"],
-                    on_click=lambda: AppState.set_date_filter_preset("all"),
+                    on_click=lambda: FilterState.set_date_filter_preset("all"),
                     class_name="px-3 py-1 text-xs font-medium text-gray-600 bg-gray-100 rounded-md hover:bg-gray-200",
                 ),
                 class_name="flex flex-wrap gap-2 mt-2",
@@ -112,8 +144,8 @@ def filter_panel() -> rx.Component:
             AppState.t["description"],
             rx.el.input(
                 placeholder=f"{AppState.t['search']}...",
-                default_value=AppState.filter_description,
-                on_change=AppState.set_filter_description.debounce(300),
+                default_value=FilterState.filter_description,
+                on_change=FilterState.set_filter_description.debounce(300),
                 class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
             ),
         ),
@@ -122,13 +154,11 @@ def filter_panel() -> rx.Component:
             rx.el.select(
                 rx.el.option(AppState.t["all_accounts"], value=""),
                 rx.foreach(
-                    AppState.accounts,
-                    lambda acc: rx.el.option(
-                        f"{acc['code']} - {acc['name']}", value=acc["id"]
-                    ),
+                    LedgerState.account_options,
+                    lambda acc: rx.el.option(acc["label"], value=acc["id"]),
                 ),
-                default_value=AppState.filter_account_id,
-                on_change=AppState.set_filter_account_id,
+                default_value=FilterState.filter_account_id,
+                on_change=FilterState.set_filter_account_id,
                 class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono'] bg-white",
             ),
         ),
@@ -138,8 +168,8 @@ def filter_panel() -> rx.Component:
                 rx.el.input(
                     type="number",
                     placeholder="0.00",
-                    default_value=AppState.filter_min_amount,
-                    on_change=AppState.set_filter_min_amount,
+                    default_value=FilterState.filter_min_amount,
+                    on_change=FilterState.set_filter_min_amount,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                 ),
             ),
@@ -148,8 +178,8 @@ def filter_panel() -> rx.Component:
                 rx.el.input(
                     type="number",
                     placeholder="1000.00",
-                    default_value=AppState.filter_max_amount,
-                    on_change=AppState.set_filter_max_amount,
+                    default_value=FilterState.filter_max_amount,
+                    on_change=FilterState.set_filter_max_amount,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                 ),
             ),
@@ -157,7 +187,7 @@ def filter_panel() -> rx.Component:
         ),
         rx.el.button(
             AppState.t["reset_filters"],
-            on_click=AppState.reset_filters,
+            on_click=FilterState.reset_filters,
             class_name="w-full mt-4 px-4 py-2 text-sm font-medium text-white bg-gray-600 border border-transparent rounded-md shadow-sm hover:bg-gray-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-gray-500 font-['JetBrains_Mono']",
         ),
         class_name="p-4 bg-white rounded-lg shadow-md border border-gray-200 grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-4 items-start",
@@ -176,19 +206,19 @@ def transaction_list_item(transaction: rx.Var[dict]) -> rx.Component:
             rx.el.button(
                 rx.icon(
                     rx.cond(
-                        AppState.expanded_transaction_id == transaction["id"],
+                        FilterState.expanded_transaction_id == transaction["id"],
                         "chevron-up",
                         "chevron-down",
                     ),
                     class_name="w-5 h-5",
                 ),
-                on_click=lambda: AppState.toggle_expand_transaction(transaction["id"]),
+                on_click=lambda: FilterState.toggle_expand_transaction(transaction["id"]),
                 class_name="justify-self-end p-1 rounded-full hover:bg-gray-100",
             ),
             class_name="grid grid-cols-10 items-center p-2 cursor-pointer border-b border-gray-100 hover:bg-gray-50 font-['JetBrains_Mono'] text-sm",
         ),
         rx.cond(
-            AppState.expanded_transaction_id == transaction["id"],
+            FilterState.expanded_transaction_id == transaction["id"],
             transaction_detail_view(transaction),
             None,
         ),
@@ -196,7 +226,7 @@ def transaction_list_item(transaction: rx.Var[dict]) -> rx.Component:
 
 
 def transaction_detail_view(transaction: rx.Var[dict]) -> rx.Component:
-    account_map = AppState.get_account_map
+    account_map = LedgerState.get_account_map
     return rx.el.div(
         rx.el.div(
             rx.el.p(
@@ -214,7 +244,7 @@ def transaction_detail_view(transaction: rx.Var[dict]) -> rx.Component:
             class_name="grid grid-cols-9 items-center px-4 pt-2",
         ),
         rx.foreach(
-            AppState.entries_for_expanded,
+            FilterState.entries_for_expanded,
             lambda entry: rx.el.div(
                 rx.el.div(
                     rx.el.p(
@@ -237,6 +267,56 @@ def transaction_detail_view(transaction: rx.Var[dict]) -> rx.Component:
                 class_name="grid grid-cols-9 items-center p-4 border-b border-gray-100",
             ),
         ),
+        rx.el.div(
+            rx.el.button(
+                rx.icon("pencil", class_name="w-4 h-4 mr-2"),
+                AppState.t["edit"],
+                on_click=lambda: TransactionFormState.start_edit_transaction(transaction["id"]),
+                class_name="px-3 py-1 text-sm text-emerald-600 font-medium flex items-center hover:bg-emerald-50 rounded-md",
+            ),
+            rx.radix.primitives.dialog.root(
+                rx.radix.primitives.dialog.trigger(
+                    rx.el.button(
+                        rx.icon("trash-2", class_name="w-4 h-4 mr-2"),
+                        AppState.t["delete"],
+                        class_name="px-3 py-1 text-sm text-red-600 font-medium flex items-center hover:bg-red-50 rounded-md",
+                    )
+                ),
+                rx.radix.primitives.dialog.portal(
+                    rx.radix.primitives.dialog.overlay(
+                        class_name="fixed inset-0 bg-black/50 backdrop-blur-sm z-[51]"
+                    ),
+                    rx.radix.primitives.dialog.content(
+                        rx.radix.primitives.dialog.title(
+                            AppState.t["confirm_deletion_title"],
+                            class_name="text-lg font-semibold text-gray-800",
+                        ),
+                        rx.radix.primitives.dialog.description(
+                            AppState.t["confirm_delete_transaction_desc"],
+                            class_name="text-sm text-gray-600 mt-2",
+                        ),
+                        rx.el.div(
+                            rx.radix.primitives.dialog.close(
+                                rx.el.button(
+                                    AppState.t["cancel"],
+                                    class_name="px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md shadow-sm hover:bg-gray-200",
+                                )
+                            ),
+                            rx.radix.primitives.dialog.close(
+                                rx.el.button(
+                                    AppState.t["delete"],
+                                    on_click=lambda: LedgerState.delete_transaction(transaction["id"]),
+                                    class_name="px-4 py-2 text-sm font-medium text-white bg-red-600 border border-transparent rounded-md shadow-sm hover:bg-red-700",
+                                )
+                            ),
+                            class_name="flex justify-end gap-4 mt-6",
+                        ),
+                        class_name="fixed top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 bg-white rounded-lg shadow-xl p-6 w-full max-w-sm z-[52]",
+                    ),
+                ),
+            ),
+            class_name="flex justify-end gap-2 pt-4",
+        ),
         class_name="bg-gray-50 p-4 font-['JetBrains_Mono'] text-sm",
     )
 
@@ -272,7 +352,7 @@ def account_form() -> rx.Component:
                 ),
                 rx.el.button(
                     rx.icon("x", class_name="w-5 h-5"),
-                    on_click=AppState.toggle_account_form,
+                    on_click=AccountFormState.toggle_account_form,
                     class_name="p-1 rounded-full hover:bg-gray-200",
                 ),
                 class_name="flex justify-between items-center mb-6 pb-4 border-b",
@@ -281,44 +361,59 @@ def account_form() -> rx.Component:
                 AppState.t["account_name"],
                 rx.el.input(
                     placeholder=AppState.t["account_name_placeholder"],
-                    default_value=AppState.new_account_name,
-                    on_change=AppState.set_new_account_name,
+                    default_value=AccountFormState.new_account_name,
+                    on_change=AccountFormState.set_new_account_name,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                 ),
-                AppState.account_name_error,
+                AccountFormState.account_name_error,
             ),
             form_field(
                 AppState.t["account_code"],
                 rx.el.input(
                     placeholder=AppState.t["account_code_placeholder"],
-                    default_value=AppState.new_account_code,
-                    on_change=AppState.set_new_account_code,
+                    value=AccountFormState.new_account_code,
+                    on_change=AccountFormState.set_new_account_code,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                 ),
-                AppState.account_code_error,
+                AccountFormState.account_code_error,
+            ),
+            rx.el.div(
+                rx.el.span(
+                    f"{AppState.t['suggested_codes']}:",
+                    class_name="text-xs text-gray-500",
+                ),
+                rx.foreach(
+                    AccountFormState.suggested_account_codes,
+                    lambda code: rx.el.button(
+                        code,
+                        on_click=lambda: AccountFormState.set_new_account_code(code),
+                        class_name="px-2 py-0.5 text-xs text-emerald-700 bg-emerald-50 rounded-md hover:bg-emerald-100",
+                    ),
+                ),
+                class_name="flex items-center gap-2 -mt-2 font-['JetBrains_Mono']",
             ),
             form_field(
                 AppState.t["account_type"],
                 rx.el.select(
                     rx.foreach(
-                        AppState.account_types,
+                        AccountFormState.account_types,
                         lambda type: rx.el.option(AppState.t[type.lower()], value=type),
                     ),
-                    value=AppState.new_account_type,
-                    on_change=AppState.set_new_account_type,
+                    value=AccountFormState.new_account_type,
+                    on_change=AccountFormState.set_new_account_type,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono'] bg-white",
                 ),
             ),
             rx.el.div(
                 rx.el.button(
                     AppState.t["cancel"],
-                    on_click=AppState.toggle_account_form,
+                    on_click=AccountFormState.toggle_account_form,
                     class_name="px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md shadow-sm hover:bg-gray-200 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-gray-500 font-['JetBrains_Mono']",
                 ),
                 rx.el.button(
                     AppState.t["create_account"],
-                    on_click=AppState.create_account,
-                    disabled=rx.cond(AppState.is_account_form_valid, False, True),
+                    on_click=AccountFormState.create_account,
+                    disabled=rx.cond(AccountFormState.is_account_form_valid, False, True),
                     class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 border border-transparent rounded-md shadow-sm hover:bg-emerald-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-emerald-500 disabled:opacity-50 disabled:cursor-not-allowed font-['JetBrains_Mono']",
                 ),
                 class_name="flex justify-end gap-4 mt-8",
@@ -335,12 +430,16 @@ def transaction_form() -> rx.Component:
             rx.el.div(
                 rx.el.div(
                     rx.el.h2(
-                        AppState.t["new_transaction_title"],
+                        rx.cond(
+                            TransactionFormState.editing_transaction_id != "",
+                            AppState.t["edit_transaction_title"],
+                            AppState.t["new_transaction_title"],
+                        ),
                         class_name="text-lg font-bold text-gray-800 font-['JetBrains_Mono']",
                     ),
                     rx.el.button(
                         rx.icon("x", class_name="w-5 h-5"),
-                        on_click=AppState.toggle_transaction_form,
+                        on_click=TransactionFormState.toggle_transaction_form,
                         class_name="p-1 rounded-full hover:bg-gray-200",
                     ),
                     class_name="flex justify-between items-center mb-6 pb-4 border-b",
@@ -350,8 +449,8 @@ def transaction_form() -> rx.Component:
                         AppState.t["date"],
                         rx.el.input(
                             type="date",
-                            default_value=AppState.new_transaction_date,
-                            on_change=AppState.set_new_transaction_date,
+                            default_value=TransactionFormState.new_transaction_date,
+                            on_change=TransactionFormState.set_new_transaction_date,
                             class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                         ),
                     ),
@@ -359,8 +458,8 @@ def transaction_form() -> rx.Component:
                         AppState.t["description"],
                         rx.el.input(
                             placeholder=AppState.t["description_placeholder"],
-                            default_value=AppState.new_transaction_description,
-                            on_change=AppState.set_new_transaction_description,
+                            default_value=TransactionFormState.new_transaction_description,
+                            on_change=TransactionFormState.set_new_transaction_description,
                             class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                         ),
                     ),
@@ -383,19 +482,17 @@ def transaction_form() -> rx.Component:
                     class_name="grid grid-cols-9 gap-x-4 items-center px-2 pb-2 mb-2 border-b",
                 ),
                 rx.foreach(
-                    AppState.new_transaction_entries,
+                    TransactionFormState.new_transaction_entries,
                     lambda entry, index: rx.el.div(
                         rx.el.select(
                             rx.el.option(
                                 AppState.t["select_account"], value="", disabled=True
                             ),
                             rx.foreach(
-                                AppState.accounts,
-                                lambda acc: rx.el.option(
-                                    f"{acc['code']} - {acc['name']}", value=acc["id"]
-                                ),
+                                LedgerState.account_options,
+                                lambda acc: rx.el.option(acc["label"], value=acc["id"]),
                             ),
-                            on_change=lambda val: AppState.update_entry(
+                            on_change=lambda val: TransactionFormState.update_entry(
                                 index, "account_id", val
                             ),
                             value=entry["account_id"].to(str),
@@ -404,7 +501,7 @@ def transaction_form() -> rx.Component:
                         rx.el.input(
                             type="number",
                             placeholder="0.00",
-                            on_change=lambda val: AppState.update_entry(
+                            on_change=lambda val: TransactionFormState.update_entry(
                                 index, "debit", val
                             ),
                             default_value=entry["debit"].to_string(),
@@ -413,7 +510,7 @@ def transaction_form() -> rx.Component:
                         rx.el.input(
                             type="number",
                             placeholder="0.00",
-                            on_change=lambda val: AppState.update_entry(
+                            on_change=lambda val: TransactionFormState.update_entry(
                                 index, "credit", val
                             ),
                             default_value=entry["credit"].to_string(),
@@ -421,8 +518,8 @@ def transaction_form() -> rx.Component:
                         ),
                         rx.el.button(
                             rx.icon("trash-2", class_name="w-4 h-4 text-gray-500"),
-                            on_click=lambda: AppState.remove_entry_row(index),
-                            disabled=AppState.new_transaction_entries.length() <= 2,
+                            on_click=lambda: TransactionFormState.remove_entry_row(index),
+                            disabled=TransactionFormState.new_transaction_entries.length() <= 2,
                             class_name="p-2 rounded-md hover:bg-gray-100 disabled:opacity-50 disabled:cursor-not-allowed justify-self-center",
                         ),
                         class_name="grid grid-cols-9 gap-x-4 items-center mb-2",
@@ -431,14 +528,14 @@ def transaction_form() -> rx.Component:
                 rx.el.button(
                     rx.icon("plus", class_name="w-4 h-4 mr-2"),
                     AppState.t["add_row"],
-                    on_click=AppState.add_entry_row,
+                    on_click=TransactionFormState.add_entry_row,
                     class_name="mt-2 px-3 py-1 text-sm text-emerald-600 font-medium flex items-center hover:bg-emerald-50 rounded-md font-['JetBrains_Mono']",
                 ),
                 rx.el.div(
                     rx.el.div(
                         rx.el.p(f"{AppState.t['debits']}:", class_name="font-semibold"),
                         rx.el.p(
-                            f"${AppState.total_debits.to_string()}",
+                            f"${TransactionFormState.total_debits.to_string()}",
                             class_name="font-mono",
                         ),
                         class_name="flex justify-between",
@@ -448,7 +545,7 @@ def transaction_form() -> rx.Component:
                             f"{AppState.t['credits']}:", class_name="font-semibold"
                         ),
                         rx.el.p(
-                            f"${AppState.total_credits.to_string()}",
+                            f"${TransactionFormState.total_credits.to_string()}",
                             class_name="font-mono",
                         ),
                         class_name="flex justify-between",
@@ -458,9 +555,9 @@ def transaction_form() -> rx.Component:
                             f"{AppState.t['balance']}:", class_name="font-semibold"
                         ),
                         rx.el.p(
-                            f"${AppState.transaction_balance.to_string()}",
+                            f"${TransactionFormState.transaction_balance.to_string()}",
                             class_name=rx.cond(
-                                AppState.transaction_balance == 0,
+                                TransactionFormState.transaction_balance == 0,
                                 "font-mono text-green-600",
                                 "font-mono text-red-600",
                             ),
@@ -472,14 +569,23 @@ def transaction_form() -> rx.Component:
                 rx.el.div(
                     rx.el.button(
                         AppState.t["cancel"],
-                        on_click=AppState.toggle_transaction_form,
+                        on_click=TransactionFormState.toggle_transaction_form,
                         class_name="px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md shadow-sm hover:bg-gray-200 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-gray-500 font-['JetBrains_Mono']",
                     ),
-                    rx.el.button(
-                        AppState.t["create_transaction"],
-                        on_click=AppState.create_transaction,
-                    disabled=rx.cond(AppState.is_transaction_form_valid, False, True),
-                        class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 border border-transparent rounded-md shadow-sm hover:bg-emerald-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-emerald-500 disabled:opacity-50 disabled:cursor-not-allowed font-['JetBrains_Mono']",
+                    rx.cond(
+                        TransactionFormState.editing_transaction_id != "",
+                        rx.el.button(
+                            AppState.t["save_changes"],
+                            on_click=TransactionFormState.update_transaction,
+                            disabled=rx.cond(TransactionFormState.is_transaction_form_valid, False, True),
+                            class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 border border-transparent rounded-md shadow-sm hover:bg-emerald-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-emerald-500 disabled:opacity-50 disabled:cursor-not-allowed font-['JetBrains_Mono']",
+                        ),
+                        rx.el.button(
+                            AppState.t["create_transaction"],
+                            on_click=TransactionFormState.create_transaction,
+                        disabled=rx.cond(TransactionFormState.is_transaction_form_valid, False, True),
+                            class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 border border-transparent rounded-md shadow-sm hover:bg-emerald-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-emerald-500 disabled:opacity-50 disabled:cursor-not-allowed font-['JetBrains_Mono']",
+                        ),
                     ),
                     class_name="flex justify-end gap-4 mt-8",
                 ),
@@ -1,5 +1,5 @@
 import reflex as rx
-from app.state import AppState
+from app.state import AppState, LedgerState, ReportState
 
 
 def dashboard_view() -> rx.Component:
@@ -16,25 +16,25 @@ def dashboard_view() -> rx.Component:
         rx.el.div(
             stat_card(
                 AppState.t["total_assets"],
-                f"${AppState.total_assets.to_string()}",
+                f"${LedgerState.current_total_assets.to_string()}",
                 "trending-up",
                 "emerald",
             ),
             stat_card(
                 AppState.t["total_liabilities"],
-                f"${AppState.total_liabilities.to_string()}",
+                f"${LedgerState.current_total_liabilities.to_string()}",
                 "trending-down",
                 "red",
             ),
             stat_card(
                 AppState.t["net_worth"],
-                f"${(AppState.total_assets - AppState.total_liabilities).to_string()}",
+                f"${(LedgerState.current_total_assets - LedgerState.current_total_liabilities).to_string()}",
                 "dollar-sign",
                 "blue",
             ),
             stat_card(
                 AppState.t["total_accounts"],
-                AppState.accounts.length().to_string(),
+                LedgerState.account_count.to_string(),
                 "layers",
                 "purple",
             ),
@@ -54,7 +54,7 @@ def dashboard_view() -> rx.Component:
                             class_name="text-sm text-gray-600",
                         ),
                         rx.el.p(
-                            f"${AppState.total_revenue.to_string()}",
+                            f"${LedgerState.lifetime_revenue.to_string()}",
                             class_name="text-2xl font-bold text-emerald-600 font-['JetBrains_Mono']",
                         ),
                         class_name="mb-4",
@@ -65,7 +65,7 @@ def dashboard_view() -> rx.Component:
                             class_name="text-sm text-gray-600",
                         ),
                         rx.el.p(
-                            f"${AppState.total_expenses.to_string()}",
+                            f"${LedgerState.lifetime_expenses.to_string()}",
                             class_name="text-2xl font-bold text-red-600 font-['JetBrains_Mono']",
                         ),
                         class_name="mb-4",
@@ -76,9 +76,9 @@ def dashboard_view() -> rx.Component:
                             class_name="text-sm text-gray-600 font-semibold",
                         ),
                         rx.el.p(
-                            f"${AppState.net_income.to_string()}",
+                            f"${LedgerState.lifetime_net_income.to_string()}",
                             class_name=rx.cond(
-                                AppState.net_income >= 0,
+                                LedgerState.lifetime_net_income >= 0,
                                 "text-3xl font-bold text-emerald-600 font-['JetBrains_Mono']",
                                 "text-3xl font-bold text-red-600 font-['JetBrains_Mono']",
                             ),
@@ -101,7 +101,7 @@ def dashboard_view() -> rx.Component:
                             class_name="text-sm text-gray-600",
                         ),
                         rx.el.p(
-                            f"${AppState.total_assets.to_string()}",
+                            f"${LedgerState.current_total_assets.to_string()}",
                             class_name="text-2xl font-bold text-gray-800 font-['JetBrains_Mono']",
                         ),
                         class_name="mb-4",
@@ -112,7 +112,7 @@ def dashboard_view() -> rx.Component:
                             class_name="text-sm text-gray-600",
                         ),
                         rx.el.p(
-                            f"${AppState.total_liabilities_equity.to_string()}",
+                            f"${LedgerState.current_total_liabilities_equity.to_string()}",
                             class_name="text-2xl font-bold text-gray-800 font-['JetBrains_Mono']",
                         ),
                         class_name="mb-4",
@@ -123,9 +123,9 @@ def dashboard_view() -> rx.Component:
                             class_name="text-sm text-gray-600 font-semibold",
                         ),
                         rx.el.p(
-                            f"${(AppState.total_assets - AppState.total_liabilities_equity).to_string()}",
+                            f"${(LedgerState.current_total_assets - LedgerState.current_total_liabilities_equity).to_string()}",
                             class_name=rx.cond(
-                                (AppState.total_assets - AppState.total_liabilities_equity) == 0,
+                                (LedgerState.current_total_assets - LedgerState.current_total_liabilities_equity) == 0,
                                 "text-3xl font-bold text-emerald-600 font-['JetBrains_Mono']",
                                 "text-3xl font-bold text-red-600 font-['JetBrains_Mono']",
                             ),
@@ -160,7 +160,7 @@ def dashboard_view() -> rx.Component:
                     class_name="grid grid-cols-10 items-center p-3 bg-gray-100 rounded-t-lg text-sm font-['JetBrains_Mono']",
                 ),
                 rx.foreach(
-                    AppState.recent_transactions,
+                    LedgerState.recent_transactions,
                     transaction_row,
                 ),
                 class_name="bg-white rounded-lg shadow-md border border-gray-200",
@@ -174,11 +174,11 @@ def dashboard_view() -> rx.Component:
                 class_name="text-lg font-semibold text-gray-800 mb-4 font-['JetBrains_Mono']",
             ),
             rx.el.div(
-                account_type_summary(AppState.t["asset"], AppState.asset_count),
-                account_type_summary(AppState.t["liability"], AppState.liability_count),
-                account_type_summary(AppState.t["equity"], AppState.equity_count),
-                account_type_summary(AppState.t["revenue"], AppState.revenue_count),
-                account_type_summary(AppState.t["expense"], AppState.expense_count),
+                account_type_summary(AppState.t["asset"], ReportState.asset_count),
+                account_type_summary(AppState.t["liability"], ReportState.liability_count),
+                account_type_summary(AppState.t["equity"], ReportState.equity_count),
+                account_type_summary(AppState.t["revenue"], ReportState.revenue_count),
+                account_type_summary(AppState.t["expense"], ReportState.expense_count),
                 class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-4",
             ),
         ),
@@ -218,13 +218,11 @@ def stat_card(label: str, value: str, icon: str, color: str) -> rx.Component:
 
 def transaction_row(txn: rx.Var[dict]) -> rx.Component:
     """Display a single transaction row."""
-    # Calculate total inline by formatting the entries
     return rx.el.div(
         rx.el.p(txn["date"], class_name="col-span-2"),
         rx.el.p(txn["description"], class_name="col-span-6 truncate"),
         rx.el.p(
-            # Simply show a placeholder for now - amounts are complex to calculate in JS
-            "-",
+            f"${txn['total'].to_string()}",
             class_name="col-span-2 text-right font-mono",
         ),
         class_name="grid grid-cols-10 items-center p-3 border-b border-gray-100 hover:bg-gray-50 text-sm font-['JetBrains_Mono']",
@@ -0,0 +1,71 @@
+"""Streaming CSV downloads for reports.
+
+An event handler registers a row iterator with ``register_export`` and points
+the browser at the returned path. ``download_export`` then writes the CSV in
+chunks of ``CHUNK_ROWS`` rows as the response is sent, so no report is ever
+held in memory as one string. Tickets are single-use and expire after
+``EXPORT_TTL_SECONDS``.
+"""
+
+import csv
+import io
+import secrets
+import time
+from typing import Iterable, Iterator
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
+from starlette.types import ASGIApp
+
+EXPORT_ROUTE = "/export/{ticket}"
+EXPORT_TTL_SECONDS = 300
+CHUNK_ROWS = 500
+
+# Ticket -> (registration time, filename, rows).
+_pending: dict[str, tuple[float, str, Iterable[list]]] = {}
+
+
+def register_export(filename: str, rows: Iterable[list]) -> str:
+    """Queue ``rows`` for download as ``filename``; returns the download path."""
+    now = time.monotonic()
+    for ticket in [t for t, (created, _, _) in _pending.items() if now - created > EXPORT_TTL_SECONDS]:
+        del _pending[ticket]
+    ticket = secrets.token_urlsafe(16)
+    _pending[ticket] = (now, filename, rows)
+    return EXPORT_ROUTE.format(ticket=ticket)
+
+
+def csv_chunks(rows: Iterable[list], chunk_rows: int = CHUNK_ROWS) -> Iterator[str]:
+    """Encode ``rows`` as CSV text, ``chunk_rows`` rows per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+async def download_export(request: Request) -> Response:
+    entry = _pending.pop(request.path_params["ticket"], None)
+    if entry is None or time.monotonic() - entry[0] > EXPORT_TTL_SECONDS:
+        return PlainTextResponse("Export not found or expired.", status_code=404)
+    _, filename, rows = entry
+    return StreamingResponse(
+        csv_chunks(rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def mount_export_route(app: ASGIApp) -> ASGIApp:
+    """``rx.App(api_transformer=...)`` hook serving ``EXPORT_ROUTE`` in front of the app."""
+    return Starlette(routes=[Route(EXPORT_ROUTE, download_export), Mount("/", app=app)])
@@ -7,6 +7,7 @@ translations = {
         "transactions": "Transactions",
         "new_account_title": "New Account",
         "new_transaction_title": "New Transaction",
+        "edit_transaction_title": "Edit Transaction",
         "settings_title": "Settings",
         "transactions_title": "Transactions",
         "date": "Date",
@@ -31,6 +32,9 @@ translations = {
         "account_name_placeholder": "e.g. Office Supplies",
         "account_code": "Account Code",
         "account_code_placeholder": "e.g. 1510",
+        "suggested_codes": "Suggested",
+        "previous_page": "Previous",
+        "next_page": "Next",
         "account_type": "Account Type",
         "asset": "Asset",
         "liability": "Liability",
@@ -45,6 +49,9 @@ translations = {
         "credits": "Credits",
         "balance": "Balance",
         "create_transaction": "Create Transaction",
+        "save_changes": "Save Changes",
+        "edit": "Edit",
+        "delete": "Delete",
         "description_placeholder": "e.g. Purchase of office supplies",
         "data_management": "Data Management",
         "export_data_title": "Export Data",
@@ -53,16 +60,22 @@ translations = {
         "import_data_title": "Import Data",
         "import_data_desc": "Upload a JSON backup file to restore your data.",
         "import": "Import",
+        "import_progress": "Transactions validated",
         "clear_data_title": "Clear All Data",
         "clear_data_desc": "Permanently delete all accounts and transactions.",
         "clear_data": "Clear Data",
         "confirm_deletion_title": "Confirm Deletion",
         "confirm_deletion_desc": "Are you sure you want to permanently delete all data? This action cannot be undone.",
+        "confirm_delete_transaction_desc": "Are you sure you want to permanently delete this transaction? This action cannot be undone.",
         "error_name_empty": "Name cannot be empty.",
         "error_code_empty": "Code cannot be empty.",
         "error_code_exists": "Code already exists.",
         "toast_account_created": "Account created successfully!",
         "toast_transaction_created": "Transaction created successfully!",
+        "toast_transaction_updated": "Transaction updated.",
+        "toast_transaction_deleted": "Transaction deleted.",
+        "toast_transactions_posted": "Transactions posted",
+        "toast_batch_rejected": "Batch rejected at transaction",
         "toast_no_file": "No file selected.",
         "toast_import_success": "Data imported successfully!",
         "toast_invalid_backup": "Invalid backup file format.",
@@ -104,6 +117,7 @@ translations = {
         "transactions": "Transacciones",
         "new_account_title": "Nueva Cuenta",
         "new_transaction_title": "Nueva Transacción",
+        "edit_transaction_title": "Editar Transacción",
         "settings_title": "Configuración",
         "transactions_title": "Transacciones",
         "date": "Fecha",
@@ -128,6 +142,9 @@ translations = {
         "account_name_placeholder": "ej. Suministros de Oficina",
         "account_code": "Código de Cuenta",
         "account_code_placeholder": "ej. 1510",
+        "suggested_codes": "Sugeridos",
+        "previous_page": "Anterior",
+        "next_page": "Siguiente",
         "account_type": "Tipo de Cuenta",
         "asset": "Activo",
         "liability": "Pasivo",
@@ -142,6 +159,9 @@ translations = {
         "credits": "Créditos",
         "balance": "Saldo",
         "create_transaction": "Crear Transacción",
+        "save_changes": "Guardar Cambios",
+        "edit": "Editar",
+        "delete": "Eliminar",
         "description_placeholder": "ej. Compra de suministros de oficina",
         "data_management": "Gestión de Datos",
         "export_data_title": "Exportar Datos",
@@ -150,16 +170,22 @@ translations = {
         "import_data_title": "Importar Datos",
         "import_data_desc": "Subir un archivo de respaldo JSON para restaurar sus datos.",
         "import": "Importar",
+        "import_progress": "Transacciones validadas",
         "clear_data_title": "Eliminar Todos los Datos",
         "clear_data_desc": "Eliminar permanentemente todas las cuentas y transacciones.",
         "clear_data": "Eliminar Datos",
         "confirm_deletion_title": "Confirmar Eliminación",
         "confirm_deletion_desc": "¿Está seguro de que desea eliminar permanentemente todos los datos? Esta acción no se puede deshacer.",
+        "confirm_delete_transaction_desc": "¿Está seguro de que desea eliminar permanentemente esta transacción? Esta acción no se puede deshacer.",
         "error_name_empty": "El nombre no puede estar vacío.",
         "error_code_empty": "El código no puede estar vacío.",
         "error_code_exists": "El código ya existe.",
         "toast_account_created": "¡Cuenta creada con éxito!",
         "toast_transaction_created": "¡Transacción creada con éxito!",
+        "toast_transaction_updated": "Transacción actualizada.",
+        "toast_transaction_deleted": "Transacción eliminada.",
+        "toast_transactions_posted": "Transacciones registradas",
+        "toast_batch_rejected": "Lote rechazado en la transacción",
         "toast_no_file": "Ningún archivo seleccionado.",
         "toast_import_success": "¡Datos importados con éxito!",
         "toast_invalid_backup": "Formato de archivo de respaldo no válido.",
@@ -201,6 +227,7 @@ translations = {
         "transactions": "Transactions",
         "new_account_title": "Nouveau Compte",
         "new_transaction_title": "Nouvelle Transaction",
+        "edit_transaction_title": "Modifier la Transaction",
         "settings_title": "Paramètres",
         "transactions_title": "Transactions",
         "date": "Date",
@@ -225,6 +252,9 @@ translations = {
         "account_name_placeholder": "ex. Fournitures de Bureau",
         "account_code": "Code de Compte",
         "account_code_placeholder": "ex. 1510",
+        "suggested_codes": "Suggestions",
+        "previous_page": "Précédent",
+        "next_page": "Suivant",
         "account_type": "Type de Compte",
         "asset": "Actif",
         "liability": "Passif",
@@ -239,6 +269,9 @@ translations = {
         "credits": "Crédits",
         "balance": "Solde",
         "create_transaction": "Créer une Transaction",
+        "save_changes": "Enregistrer",
+        "edit": "Modifier",
+        "delete": "Supprimer",
         "description_placeholder": "ex. Achat de fournitures de bureau",
         "data_management": "Gestion des Données",
         "export_data_title": "Exporter les Données",
@@ -247,16 +280,22 @@ translations = {
         "import_data_title": "Importer les Données",
         "import_data_desc": "Télécharger un fichier de sauvegarde JSON pour restaurer vos données.",
         "import": "Importer",
+        "import_progress": "Transactions validées",
         "clear_data_title": "Effacer Toutes les Données",
         "clear_data_desc": "Supprimer définitivement tous les comptes et transactions.",
         "clear_data": "Effacer les Données",
         "confirm_deletion_title": "Confirmer la Suppression",
         "confirm_deletion_desc": "Êtes-vous sûr de vouloir supprimer définitivement toutes les données ? Cette action est irréversible.",
+        "confirm_delete_transaction_desc": "Êtes-vous sûr de vouloir supprimer définitivement cette transaction ? Cette action est irréversible.",
         "error_name_empty": "Le nom ne peut pas être vide.",
         "error_code_empty": "Le code ne peut pas être vide.",
         "error_code_exists": "Le code existe déjà.",
         "toast_account_created": "Compte créé avec succès !",
         "toast_transaction_created": "Transaction créée avec succès !",
+        "toast_transaction_updated": "Transaction mise à jour.",
+        "toast_transaction_deleted": "Transaction supprimée.",
+        "toast_transactions_posted": "Transactions enregistrées",
+        "toast_batch_rejected": "Lot rejeté à la transaction",
         "toast_no_file": "Aucun fichier sélectionné.",
         "toast_import_success": "Données importées avec succès !",
         "toast_invalid_backup": "Format de fichier de sauvegarde invalide.",
@@ -298,6 +337,7 @@ translations = {
         "transactions": "交易记录",
         "new_account_title": "新账户",
         "new_transaction_title": "新交易",
+        "edit_transaction_title": "编辑交易",
         "settings_title": "设置",
         "transactions_title": "交易记录",
         "date": "日期",
@@ -322,6 +362,9 @@ translations = {
         "account_name_placeholder": "例如 办公用品",
         "account_code": "账户代码",
         "account_code_placeholder": "例如 1510",
+        "suggested_codes": "建议",
+        "previous_page": "上一页",
+        "next_page": "下一页",
         "account_type": "账户类型",
         "asset": "资产",
         "liability": "负债",
@@ -336,6 +379,9 @@ translations = {
         "credits": "贷方总计",
         "balance": "余额",
         "create_transaction": "创建交易",
+        "save_changes": "保存更改",
+        "edit": "编辑",
+        "delete": "删除",
         "description_placeholder": "例如 购买办公用品",
         "data_management": "数据管理",
         "export_data_title": "导出数据",
@@ -344,16 +390,22 @@ translations = {
         "import_data_title": "导入数据",
         "import_data_desc": "上传JSON备份文件以恢复您的数据。",
         "import": "导入",
+        "import_progress": "已验证交易",
         "clear_data_title": "清除所有数据",
         "clear_data_desc": "永久删除所有账户和交易。",
         "clear_data": "清除数据",
         "confirm_deletion_title": "确认删除",
         "confirm_deletion_desc": "您确定要永久删除所有数据吗？此操作无法撤销。",
+        "confirm_delete_transaction_desc": "您确定要永久删除此交易吗？此操作无法撤销。",
         "error_name_empty": "名称不能为空。",
         "error_code_empty": "代码不能为空。",
         "error_code_exists": "代码已存在。",
         "toast_account_created": "账户创建成功！",
         "toast_transaction_created": "交易创建成功！",
+        "toast_transaction_updated": "交易已更新。",
+        "toast_transaction_deleted": "交易已删除。",
+        "toast_transactions_posted": "已过账交易",
+        "toast_batch_rejected": "批次被拒绝，交易",
         "toast_no_file": "未选择文件。",
         "toast_import_success": "数据导入成功！",
         "toast_invalid_backup": "无效的备份文件格式。",
@@ -395,6 +447,7 @@ translations = {
         "transactions": "Transações",
         "new_account_title": "Nova Conta",
         "new_transaction_title": "Nova Transação",
+        "edit_transaction_title": "Editar Transação",
         "settings_title": "Configurações",
         "transactions_title": "Transações",
         "date": "Data",
@@ -419,6 +472,9 @@ translations = {
         "account_name_placeholder": "ex. Material de Escritório",
         "account_code": "Código da Conta",
         "account_code_placeholder": "ex. 1510",
+        "suggested_codes": "Sugestões",
+        "previous_page": "Anterior",
+        "next_page": "Próxima",
         "account_type": "Tipo de Conta",
         "asset": "Ativo",
         "liability": "Passivo",
@@ -433,6 +489,9 @@ translations = {
         "credits": "Créditos",
         "balance": "Saldo",
         "create_transaction": "Criar Transação",
+        "save_changes": "Salvar Alterações",
+        "edit": "Editar",
+        "delete": "Excluir",
         "description_placeholder": "ex. Compra de material de escritório",
         "data_management": "Gerenciamento de Dados",
         "export_data_title": "Exportar Dados",
@@ -441,16 +500,22 @@ translations = {
         "import_data_title": "Importar Dados",
         "import_data_desc": "Carregar um arquivo de backup JSON para restaurar seus dados.",
         "import": "Importar",
+        "import_progress": "Transações validadas",
         "clear_data_title": "Limpar Todos os Dados",
         "clear_data_desc": "Excluir permanentemente todas as contas e transações.",
         "clear_data": "Limpar Dados",
         "confirm_deletion_title": "Confirmar Exclusão",
         "confirm_deletion_desc": "Tem certeza de que deseja excluir permanentemente todos os dados? Esta ação não pode ser desfeita.",
+        "confirm_delete_transaction_desc": "Tem certeza de que deseja excluir permanentemente esta transação? Esta ação não pode ser desfeita.",
         "error_name_empty": "O nome não pode estar vazio.",
         "error_code_empty": "O código não pode estar vazio.",
         "error_code_exists": "O código já existe.",
         "toast_account_created": "Conta criada com sucesso!",
         "toast_transaction_created": "Transação criada com sucesso!",
+        "toast_transaction_updated": "Transação atualizada.",
+        "toast_transaction_deleted": "Transação excluída.",
+        "toast_transactions_posted": "Transações lançadas",
+        "toast_batch_rejected": "Lote rejeitado na transação",
         "toast_no_file": "Nenhum arquivo selecionado.",
         "toast_import_success": "Dados importados com sucesso!",
         "toast_invalid_backup": "Formato de arquivo de backup inválido.",
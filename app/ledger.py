@@ -0,0 +1,705 @@
+"""In-memory ledger indexes maintained alongside ``LedgerState``.
+
+These structures are backend-only: they are rebuilt from the ledger when it is
+loaded or replaced, and updated incrementally as transactions are posted,
+edited or deleted. Indexes keyed by row follow the convention that ``add``
+indexes a new or rewritten row and ``discard`` removes a row's current
+content. Rows are never renumbered in place: a deleted transaction leaves a
+tombstone row until the ledger is compacted and the indexes rebuilt.
+Sorted indexes also take ``add_many``. A batch landing at the end of an
+index is appended; a small one landing mid-index (an edit, a back-dated
+posting) is inserted key by key, a bisect plus the list's C-level shift of
+the items behind it; a batch of ``INSERT_BATCH`` or more is merged in one
+re-sort of the tail it reaches, which timsort does in a single linear merge.
+
+NumPy is optional (``pip install offline-ledger[fast]``); when it is installed
+the entry store aggregates with vectorized group-bys instead of Python loops.
+"""
+
+import calendar
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from itertools import accumulate, islice
+from operator import itemgetter, neg, sub
+from typing import Any, Callable, Hashable, Iterable, Iterator, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+
+def date_ordinal(date: str) -> int:
+    """Proleptic ordinal of an ISO ``YYYY-MM-DD`` date; 0 if it does not parse."""
+    try:
+        return datetime.date.fromisoformat(date[:10]).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+def month_end(month: str) -> str:
+    """Last ISO date of the ``YYYY-MM`` month; a month that does not parse ends on day 31."""
+    try:
+        days = calendar.monthrange(int(month[:4]), int(month[5:7]))[1]
+    except ValueError:
+        days = 31
+    return f"{month}-{days:02d}"
+
+
+# Largest batch ``add_many`` inserts key by key when it lands mid-index; a
+# larger one is merged with the tail it reaches instead.
+INSERT_BATCH = 256
+
+
+class AccountIndex:
+    """Interns account UUIDs to small integer slots.
+
+    Slots are assigned once per load and never reused, so they can be stored
+    in compact integer columns. ``positions`` maps each slot to the account's
+    index in ``LedgerState._accounts`` (``-1`` for ids no account owns) and
+    ``codes`` maps account codes to slots.
+    """
+
+    def __init__(self):
+        self.ids: list[str] = []
+        self.slots: dict[str, int] = {}
+        self.positions: list[int] = []
+        self.codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def intern(self, account_id: str) -> int:
+        """Return ``account_id``'s slot, assigning a new one if needed."""
+        slot = self.slots.get(account_id)
+        if slot is None:
+            slot = len(self.ids)
+            self.ids.append(account_id)
+            self.slots[account_id] = slot
+            self.positions.append(-1)
+        return slot
+
+    def slot(self, account_id: str) -> int | None:
+        return self.slots.get(account_id)
+
+    def position(self, account_id: str) -> int:
+        """Index of ``account_id`` in ``LedgerState._accounts``, or -1."""
+        slot = self.slots.get(account_id)
+        return self.positions[slot] if slot is not None else -1
+
+    def sync(self, accounts: list[dict]):
+        """Intern every account and refresh slot positions after a re-sort."""
+        self.positions = [-1] * len(self.ids)
+        self.codes = {}
+        for position, acc in enumerate(accounts):
+            slot = self.intern(acc["id"])
+            self.positions[slot] = position
+            self.codes.setdefault(acc["code"], slot)
+
+    def suggest_codes(self, low: int, high: int, count: int = 3, step: int = 10) -> list[str]:
+        """Up to ``count`` unused numeric codes in ``[low, high]``.
+
+        Suggestions continue after the highest code already used in the range,
+        in multiples of ``step``, and wrap around to fill gaps once the range
+        runs out.
+        """
+        used = {int(code) for code in self.codes if code.isdigit() and low <= int(code) <= high}
+        start = (max(used) // step + 1) * step if used else low + step
+        candidates = [*range(start, high + 1, step), *range(low + step, start, step)]
+        return [str(code) for code in candidates if code not in used][:count]
+
+    def insert(self, position: int, account: dict):
+        """Record ``account`` inserted at ``position``, shifting the accounts after it."""
+        self.positions = [p + 1 if p >= position else p for p in self.positions]
+        slot = self.intern(account["id"])
+        self.positions[slot] = position
+        self.codes.setdefault(account["code"], slot)
+
+
+def transaction_error(txn: dict, accounts: AccountIndex, seen_ids: set[str]) -> str:
+    """Why ``txn`` (amounts in cents) cannot be posted, or an empty string if it can.
+
+    ``seen_ids`` holds transaction ids already taken; every entry must post
+    to an account known to ``accounts``.
+    """
+    if txn["id"] in seen_ids:
+        return f"duplicate id {txn['id']}"
+    if not date_ordinal(str(txn.get("date") or "")):
+        return f"invalid date {txn.get('date')!r}"
+    if not str(txn.get("description") or "").strip():
+        return "missing description"
+    debits = credits = 0
+    for entry in txn["entries"]:
+        if accounts.position(entry["account_id"]) < 0:
+            return f"unknown account {entry['account_id']!r}"
+        if entry["debit"] < 0 or entry["credit"] < 0:
+            return "negative amount"
+        if entry["debit"] > 0 and entry["credit"] > 0:
+            return "entry has both a debit and a credit"
+        debits += entry["debit"]
+        credits += entry["credit"]
+    if debits <= 0 or debits != credits:
+        return "debits and credits do not balance"
+    return ""
+
+
+class EntryStore:
+    """Every ledger entry in parallel 64-bit columns.
+
+    Row ``i`` describes one entry: the ordinal of its transaction's date, the
+    account slot it posts to, its debit and credit in cents, and ``row`` - the
+    position of its transaction in ``LedgerState._transactions``.
+    """
+
+    def __init__(self):
+        self.date = array("q")
+        self.slot = array("q")
+        self.debit = array("q")
+        self.credit = array("q")
+        self.row = array("q")
+
+    def __len__(self) -> int:
+        return len(self.slot)
+
+    def _span(self, row: int) -> tuple[int, int]:
+        # Entries are stored in row order, so a row's entries are contiguous.
+        return bisect_left(self.row, row), bisect_right(self.row, row)
+
+    def add(self, row: int, date: str, entries: list[dict], accounts: AccountIndex):
+        """Store ``entries`` of the transaction dated ``date`` at ``row``.
+
+        Any entries already stored for ``row`` are replaced. Each entry's
+        ``account_id`` is replaced with the interned string so the ledger
+        shares one copy of every UUID.
+        """
+        ordinal = date_ordinal(date)
+        slots = array("q")
+        for entry in entries:
+            slot = accounts.intern(entry["account_id"])
+            entry["account_id"] = accounts.ids[slot]
+            slots.append(slot)
+        lo, hi = self._span(row)
+        self.date[lo:hi] = array("q", [ordinal] * len(entries))
+        self.slot[lo:hi] = slots
+        self.debit[lo:hi] = array("q", [e["debit"] for e in entries])
+        self.credit[lo:hi] = array("q", [e["credit"] for e in entries])
+        self.row[lo:hi] = array("q", [row] * len(entries))
+
+    def discard(self, row: int):
+        """Drop the entries of ``row``."""
+        lo, hi = self._span(row)
+        for column in (self.date, self.slot, self.debit, self.credit, self.row):
+            del column[lo:hi]
+
+    def net_by_slot(self, size: int, start: int = 0, end: int = 0) -> list[int]:
+        """Per-slot ``debit - credit`` totals in cents.
+
+        ``start``/``end`` are inclusive date ordinals; 0 leaves that side open.
+        """
+        if np is not None:
+            return self._net_by_slot_numpy(size, start, end)
+        totals = [0] * size
+        for ordinal, slot, debit, credit in zip(self.date, self.slot, self.debit, self.credit):
+            if (start and ordinal < start) or (end and ordinal > end):
+                continue
+            totals[slot] += debit - credit
+        return totals
+
+    def _net_by_slot_numpy(self, size: int, start: int, end: int) -> list[int]:
+        # Zero-copy views; they must not outlive this call or the arrays
+        # could no longer grow.
+        slots = np.frombuffer(self.slot, dtype=np.int64)
+        net = np.frombuffer(self.debit, dtype=np.int64) - np.frombuffer(
+            self.credit, dtype=np.int64
+        )
+        if start or end:
+            dates = np.frombuffer(self.date, dtype=np.int64)
+            mask = np.ones(len(dates), dtype=bool)
+            if start:
+                mask &= dates >= start
+            if end:
+                mask &= dates <= end
+            slots, net = slots[mask], net[mask]
+        totals = np.zeros(size, dtype=np.int64)
+        np.add.at(totals, slots, net)
+        return totals.tolist()
+
+
+class DateIndex:
+    """Transaction rows ordered by date, for range queries.
+
+    ``dates`` is kept sorted so a date range is two bisects; within one date
+    rows are stored in descending order, so walking the list backwards yields
+    newest-first with same-day transactions in posting order.
+    """
+
+    def __init__(self):
+        self.dates: list[str] = []
+        self.rows: list[int] = []
+
+    @classmethod
+    def build(cls, transactions: list[dict]) -> "DateIndex":
+        index = cls()
+        order = sorted(range(len(transactions)), key=lambda row: (transactions[row]["date"], -row))
+        index.dates = [transactions[row]["date"] for row in order]
+        index.rows = order
+        return index
+
+    def add(self, date: str, row: int):
+        self.add_many([(date, row)])
+
+    def add_many(self, dated_rows: Iterable[tuple[str, int]]):
+        """Index ``(date, row)`` pairs (see the module docstring for the cost)."""
+        # Same-day rows are descending: sort on (date, -row).
+        batch = sorted((date, -row) for date, row in dated_rows)
+        if not batch:
+            return
+        start = self._position(batch[0][0], -batch[0][1])
+        if start < len(self.dates) and len(batch) < INSERT_BATCH:
+            for date, negated in batch:
+                position = self._position(date, -negated)
+                self.dates.insert(position, date)
+                self.rows.insert(position, -negated)
+            return
+        if start < len(self.dates):
+            batch = sorted([*zip(self.dates[start:], [-r for r in self.rows[start:]]), *batch])
+        self.dates[start:] = [date for date, _ in batch]
+        self.rows[start:] = [-negated for _, negated in batch]
+
+    def _position(self, date: str, row: int) -> int:
+        """Where ``row`` dated ``date`` sits; a new row goes before the same day's older rows."""
+        lo = bisect_left(self.dates, date)
+        hi = bisect_right(self.dates, date, lo)
+        return bisect_left(self.rows, -row, lo, hi, key=neg)
+
+    def discard(self, date: str, row: int):
+        position = self._position(date, row)
+        if position < len(self.rows) and self.rows[position] == row and self.dates[position] == date:
+            del self.dates[position]
+            del self.rows[position]
+
+    def bounds(self, start_date: str, end_date: str) -> tuple[int, int]:
+        """Span of ``rows`` dated within ``[start_date, end_date]``; empty bounds are open."""
+        lo = bisect_left(self.dates, start_date) if start_date else 0
+        hi = bisect_right(self.dates, end_date) if end_date else len(self.dates)
+        return lo, max(lo, hi)
+
+    def count_between(self, start_date: str = "", end_date: str = "") -> int:
+        lo, hi = self.bounds(start_date, end_date)
+        return hi - lo
+
+    def rows_between(self, start_date: str = "", end_date: str = "") -> list[int]:
+        """Rows dated within ``[start_date, end_date]``, newest first; empty bounds are open."""
+        lo, hi = self.bounds(start_date, end_date)
+        return self.rows[lo:hi][::-1]
+
+    def newest(self, count: int) -> list[int]:
+        """The ``count`` most recent rows, newest first."""
+        return self.rows[max(0, len(self.rows) - count):][::-1]
+
+
+class AmountIndex:
+    """Transaction totals (sum of debits, in cents), by row and sorted.
+
+    ``totals[row]`` is computed once when the transaction is indexed;
+    ``amounts``/``rows`` list the same totals in ascending order for range
+    lookups.
+    """
+
+    def __init__(self):
+        self.totals: list[int] = []
+        self.amounts: list[int] = []
+        self.rows: list[int] = []
+
+    @classmethod
+    def build(cls, transactions: list[dict]) -> "AmountIndex":
+        index = cls()
+        index.totals = [sum(e["debit"] for e in txn["entries"]) for txn in transactions]
+        index.rows = sorted(range(len(index.totals)), key=index.totals.__getitem__)
+        index.amounts = [index.totals[row] for row in index.rows]
+        return index
+
+    def add(self, row: int, entries: list[dict]):
+        self.add_many([(row, entries)])
+
+    def add_many(self, rows_entries: Iterable[tuple[int, list[dict]]]):
+        """Index ``(row, entries)`` pairs (see the module docstring for the cost)."""
+        batch: list[tuple[int, int]] = []
+        for row, entries in rows_entries:
+            total = sum(e["debit"] for e in entries)
+            if row == len(self.totals):
+                self.totals.append(total)
+            else:
+                self.totals[row] = total
+            batch.append((total, row))
+        if not batch:
+            return
+        # Equal totals are kept in row order.
+        batch.sort()
+        start = self._position(*batch[0])
+        if start < len(self.amounts) and len(batch) < INSERT_BATCH:
+            for total, row in batch:
+                position = self._position(total, row)
+                self.amounts.insert(position, total)
+                self.rows.insert(position, row)
+            return
+        if start < len(self.amounts):
+            batch = sorted([*zip(self.amounts[start:], self.rows[start:]), *batch])
+        self.amounts[start:] = [total for total, _ in batch]
+        self.rows[start:] = [row for _, row in batch]
+
+    def _position(self, total: int, row: int) -> int:
+        lo = bisect_left(self.amounts, total)
+        hi = bisect_right(self.amounts, total, lo)
+        return bisect_left(self.rows, row, lo, hi)
+
+    def discard(self, row: int):
+        total = self.totals[row]
+        position = self._position(total, row)
+        if position < len(self.rows) and self.rows[position] == row and self.amounts[position] == total:
+            del self.amounts[position]
+            del self.rows[position]
+
+    def _bounds(self, min_amount: int, max_amount: float) -> tuple[int, int]:
+        lo = bisect_left(self.amounts, min_amount)
+        hi = bisect_right(self.amounts, max_amount)
+        return lo, max(lo, hi)
+
+    def count_between(self, min_amount: int, max_amount: float) -> int:
+        lo, hi = self._bounds(min_amount, max_amount)
+        return hi - lo
+
+    def rows_between(self, min_amount: int, max_amount: float) -> list[int]:
+        """Rows whose total is within ``[min_amount, max_amount]``, by ascending total."""
+        lo, hi = self._bounds(min_amount, max_amount)
+        return self.rows[lo:hi]
+
+
+class DescriptionIndex:
+    """Trigram inverted index over lowercased transaction descriptions.
+
+    ``postings[trigram]`` lists, in ascending order, the rows whose
+    description contains ``trigram``; ``lowered[row]`` caches the lowercased
+    description so candidates are verified without calling ``lower()`` again.
+    """
+
+    def __init__(self):
+        self.lowered: list[str] = []
+        self.postings: dict[str, list[int]] = {}
+
+    def add(self, row: int, description: str):
+        lowered = description.lower()
+        if row == len(self.lowered):
+            self.lowered.append(lowered)
+        else:
+            self.lowered[row] = lowered
+        for gram in _trigrams(lowered):
+            rows = self.postings.setdefault(gram, [])
+            if not rows or rows[-1] < row:
+                rows.append(row)
+            else:
+                insort(rows, row)
+
+    def discard(self, row: int):
+        for gram in _trigrams(self.lowered[row]):
+            rows = self.postings[gram]
+            del rows[bisect_left(rows, row)]
+            if not rows:
+                del self.postings[gram]
+        self.lowered[row] = ""
+
+    def candidates(self, needle: str) -> list[int] | None:
+        """Ascending rows that may contain ``needle`` (already lowercased).
+
+        Only the rarest trigram's postings are returned: callers confirm each
+        candidate with ``matches``, which is cheaper than intersecting the
+        longer lists. Returns ``None`` when ``needle`` is too short to use the
+        index.
+        """
+        grams = _trigrams(needle)
+        if not grams:
+            return None
+        return min((self.postings.get(gram, []) for gram in grams), key=len)
+
+    def matches(self, row: int, needle: str) -> bool:
+        return needle in self.lowered[row]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class BalanceIndex:
+    """Per-account postings ordered by date, with running sums.
+
+    For each slot, ``dates[i]``, ``rows[i]``, ``debits[i]`` and ``credits[i]``
+    describe the ``i``-th entry posting to it in date order (ties keep posting
+    order) and ``cumulative[i]`` the ``debit - credit`` total in cents of
+    entries up to and including it.
+
+    ``add_many`` and ``discard`` only record, per slot, the first position
+    whose running sum they invalidated; the sums from there are recomputed
+    (with ``itertools.accumulate``) when the slot is next read, so a run of
+    edits to one account pays for one walk of its tail, not one per edit.
+    """
+
+    def __init__(self):
+        self.dates: list[list[int]] = []
+        self.rows: list[list[int]] = []
+        self.debits: list[list[int]] = []
+        self.credits: list[list[int]] = []
+        self.cumulative: list[list[int]] = []
+        # Slot -> first position whose ``cumulative`` is out of date.
+        self._stale: dict[int, int] = {}
+
+    @classmethod
+    def build(cls, store: EntryStore, size: int) -> "BalanceIndex":
+        """Index every entry in ``store`` with one sort per account."""
+        index = cls()
+        postings: list[list[tuple[int, int, int, int]]] = [[] for _ in range(size)]
+        for ordinal, slot, row, debit, credit in zip(
+            store.date, store.slot, store.row, store.debit, store.credit
+        ):
+            postings[slot].append((ordinal, row, debit, credit))
+        for slot_postings in postings:
+            slot_postings.sort(key=lambda p: p[0])
+            running = 0
+            cumulative = []
+            for _, _, debit, credit in slot_postings:
+                running += debit - credit
+                cumulative.append(running)
+            index.dates.append([p[0] for p in slot_postings])
+            index.rows.append([p[1] for p in slot_postings])
+            index.debits.append([p[2] for p in slot_postings])
+            index.credits.append([p[3] for p in slot_postings])
+            index.cumulative.append(cumulative)
+        return index
+
+    def add(self, slot: int, ordinal: int, row: int, debit: int, credit: int):
+        """Record an entry of the transaction at ``row`` posted to ``slot`` on ``ordinal``."""
+        self.add_many([(slot, ordinal, row, debit, credit)])
+
+    def add_many(self, entries: Iterable[tuple[int, int, int, int, int]]):
+        """Record ``(slot, ordinal, row, debit, credit)`` entries, slot by slot.
+
+        Each slot's batch is placed as described in the module docstring and
+        its running sums are marked stale from the first position it reached.
+        """
+        by_slot: dict[int, list[tuple[int, int, int, int]]] = {}
+        for slot, ordinal, row, debit, credit in entries:
+            by_slot.setdefault(slot, []).append((ordinal, row, debit, credit))
+        while len(self.dates) <= max(by_slot, default=-1):
+            for column in (self.dates, self.rows, self.debits, self.credits, self.cumulative):
+                column.append([])
+        for slot, batch in by_slot.items():
+            # Stable on (date, row), so entries of one transaction keep their order.
+            batch.sort(key=_POSTING_ORDER)
+            columns = (self.dates[slot], self.rows[slot], self.debits[slot], self.credits[slot])
+            start = self._position(slot, batch[0][0], batch[0][1])
+            if start < len(columns[0]) and len(batch) < INSERT_BATCH:
+                for posting in batch:
+                    position = self._position(slot, posting[0], posting[1])
+                    for column, value in zip(columns, posting):
+                        column.insert(position, value)
+            else:
+                if start < len(columns[0]):
+                    tail = zip(*(column[start:] for column in columns))
+                    batch = sorted([*tail, *batch], key=_POSTING_ORDER)
+                for column, values in zip(columns, zip(*batch)):
+                    column[start:] = values
+            self._invalidate(slot, start)
+
+    def discard(self, slot: int, ordinal: int, row: int):
+        """Remove every entry of the transaction at ``row`` from ``slot``."""
+        if slot >= len(self.dates):
+            return
+        lo = bisect_left(self.rows[slot], row, *self._span(slot, ordinal))
+        hi = self._position(slot, ordinal, row)
+        if lo < hi:
+            for column in (self.dates[slot], self.rows[slot], self.debits[slot], self.credits[slot]):
+                del column[lo:hi]
+            self._invalidate(slot, lo)
+
+    def _span(self, slot: int, ordinal: int) -> tuple[int, int]:
+        dates = self.dates[slot]
+        lo = bisect_left(dates, ordinal)
+        return lo, bisect_right(dates, ordinal, lo)
+
+    def _position(self, slot: int, ordinal: int, row: int) -> int:
+        """Position just after the entries of the transaction at ``row`` in ``slot``."""
+        return bisect_right(self.rows[slot], row, *self._span(slot, ordinal))
+
+    def _invalidate(self, slot: int, position: int):
+        self._stale[slot] = min(self._stale.get(slot, position), position)
+
+    def _settle(self, slot: int):
+        """Recompute ``slot``'s running sums from its first stale position."""
+        start = self._stale.pop(slot, None)
+        if start is None:
+            return
+        cumulative = self.cumulative[slot]
+        running = cumulative[start - 1] if start else 0
+        nets = map(sub, self.debits[slot][start:], self.credits[slot][start:])
+        cumulative[start:] = islice(accumulate(nets, initial=running), 1, None)
+
+    def slot_rows(self, slot: int) -> list[int]:
+        """Rows of every entry posting to ``slot`` (a row repeats per entry)."""
+        return self.rows[slot] if slot < len(self.rows) else []
+
+    def dates_and_rows(self, slot: int) -> tuple[list[int], list[int]]:
+        """The date ordinals and rows of ``slot``'s entries, in index order."""
+        if slot >= len(self.dates):
+            return [], []
+        return self.dates[slot], self.rows[slot]
+
+    def first_position(self, slot: int, ordinal: int, row: int) -> int:
+        """Position of the first entry of the transaction at ``row`` (dated ``ordinal``) in ``slot``."""
+        dates, rows = self.dates_and_rows(slot)
+        position = bisect_left(dates, ordinal)
+        end = bisect_right(dates, ordinal, position)
+        return bisect_left(rows, row, position, end)
+
+    def postings_at(self, slot: int, positions: Iterable[int]) -> Iterator[tuple[int, int, int, int]]:
+        """``(row, debit, credit, cumulative)`` of ``slot``'s entries at ``positions``."""
+        self._settle(slot)
+        for position in positions:
+            yield (
+                self.rows[slot][position],
+                self.debits[slot][position],
+                self.credits[slot][position],
+                self.cumulative[slot][position],
+            )
+
+    def postings(self, slot: int) -> list[tuple[int, int, int, int]]:
+        """``(row, debit, credit, cumulative)`` for every entry of ``slot``, oldest first."""
+        return list(self.iter_postings(slot))
+
+    def iter_postings(self, slot: int) -> Iterator[tuple[int, int, int, int]]:
+        """Lazy form of ``postings``."""
+        if slot >= len(self.dates):
+            return iter(())
+        self._settle(slot)
+        return zip(self.rows[slot], self.debits[slot], self.credits[slot], self.cumulative[slot])
+
+    def net_as_of(self, slot: int, ordinal: int) -> int:
+        """``debit - credit`` cents posted to ``slot`` on or before ``ordinal``."""
+        if slot >= len(self.dates):
+            return 0
+        self._settle(slot)
+        position = bisect_right(self.dates[slot], ordinal)
+        return self.cumulative[slot][position - 1] if position else 0
+
+    def net_total(self, slot: int) -> int:
+        """``debit - credit`` cents ever posted to ``slot``."""
+        if slot >= len(self.cumulative):
+            return 0
+        self._settle(slot)
+        return self.cumulative[slot][-1] if self.cumulative[slot] else 0
+
+
+# Sort key of (ordinal, row, debit, credit) postings.
+_POSTING_ORDER = itemgetter(0, 1)
+
+
+class MonthlyRollup:
+    """Per-month, per-account ``debit - credit`` totals in cents.
+
+    ``totals[month][slot]`` sums every entry posting to ``slot`` in ``month``
+    (``YYYY-MM``), so period reports can add whole months without touching
+    individual transactions.
+    """
+
+    def __init__(self):
+        self.totals: dict[str, dict[int, int]] = {}
+
+    def add(self, month: str, slot: int, net: int):
+        by_slot = self.totals.setdefault(month, {})
+        by_slot[slot] = by_slot.get(slot, 0) + net
+
+    def months(self) -> list[str]:
+        return list(self.totals)
+
+    def month_totals(self, month: str) -> dict[int, int]:
+        return self.totals.get(month, {})
+
+
+class RowFilter(NamedTuple):
+    """One active transaction filter, as seen by the query planner.
+
+    ``estimate`` bounds how many rows can match, ``candidates`` produces those
+    rows from an index and ``predicate`` tests a single row.
+    """
+
+    estimate: int
+    candidates: Callable[[], Iterable[int]]
+    predicate: Callable[[int], bool]
+
+
+class RowPlan(NamedTuple):
+    """Candidate rows for a query, oldest first, plus a residual test.
+
+    ``order[lo:hi]`` holds the most selective filter's candidates sorted by
+    the list's sort key; ``predicate`` applies the remaining filters.
+    """
+
+    order: Sequence[int]
+    lo: int
+    hi: int
+    predicate: Callable[[int], bool]
+
+
+def keyset_page(
+    plan: RowPlan,
+    key: Callable[[int], Any],
+    size: int,
+    cursor: Any = None,
+    newer: bool = False,
+) -> list[int]:
+    """Up to ``size`` matching rows of ``plan``, newest first.
+
+    Without a cursor this is the newest page. Otherwise the page holds the
+    rows just older than ``cursor`` (a sort key), or with ``newer`` the rows
+    just newer than it. The cursor is found by bisecting ``plan.order`` and
+    rows are tested one at a time, so only the page itself is materialized.
+    """
+    if cursor is None:
+        positions = range(plan.hi - 1, plan.lo - 1, -1)
+    elif newer:
+        positions = range(bisect_right(plan.order, cursor, plan.lo, plan.hi, key=key), plan.hi)
+    else:
+        positions = range(bisect_left(plan.order, cursor, plan.lo, plan.hi, key=key) - 1, plan.lo - 1, -1)
+    rows: list[int] = []
+    for position in positions:
+        row = plan.order[position]
+        if plan.predicate(row):
+            rows.append(row)
+            if len(rows) == size:
+                break
+    return rows[::-1] if newer else rows
+
+
+class ResultCache:
+    """Bounded LRU map from a hashable key to a computed result.
+
+    Keys carry the ledger version, so entries for an older ledger are never
+    hit again and simply age out.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        value = compute()
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self.entries)
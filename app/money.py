@@ -0,0 +1,68 @@
+"""Fixed-point money helpers.
+
+The engine keeps every amount (entry debits/credits, account balances) as
+integer cents so that sums are exact. Floats only appear at the edges: form
+inputs, rendered values, CSV/JSON exports and the LocalStorage format, which
+stays in currency units for compatibility with existing data and backups.
+"""
+
+from typing import Any
+
+
+def to_cents(value: Any) -> int:
+    """Convert a currency amount (number or numeric string) to integer cents.
+
+    Empty or non-numeric values count as zero, matching how the forms and
+    legacy data have always been treated.
+    """
+    if value in (None, ""):
+        return 0
+    try:
+        return round(float(value) * 100)
+    except (TypeError, ValueError):
+        return 0
+
+
+def from_cents(cents: int) -> float:
+    """Convert integer cents back to a currency amount for display or export."""
+    return cents / 100
+
+
+def account_to_cents(account: dict) -> dict:
+    return {**account, "balance": to_cents(account.get("balance"))}
+
+
+def account_from_cents(account: dict) -> dict:
+    return {**account, "balance": from_cents(account["balance"])}
+
+
+def transaction_to_cents(txn: dict) -> dict:
+    """Convert a stored transaction to the in-memory form.
+
+    Legacy ``lines``/``account`` shapes are mapped onto ``entries``/``account_id``.
+    """
+    return {
+        **txn,
+        "entries": [
+            {
+                "account_id": str(e.get("account_id") or e.get("account") or ""),
+                "debit": to_cents(e.get("debit")),
+                "credit": to_cents(e.get("credit")),
+            }
+            for e in (txn.get("entries") or txn.get("lines") or [])
+        ],
+    }
+
+
+def transaction_from_cents(txn: dict) -> dict:
+    return {
+        **txn,
+        "entries": [
+            {
+                "account_id": e["account_id"],
+                "debit": from_cents(e["debit"]),
+                "credit": from_cents(e["credit"]),
+            }
+            for e in txn["entries"]
+        ],
+    }
@@ -1,6 +1,6 @@
 import reflex as rx
-from app.state import AppState
-from app.components import form_field
+from app.state import AppState, LedgerState, ReportState
+from app.components import form_field, pagination_controls
 from datetime import datetime
 
 
@@ -24,7 +24,7 @@ def reports_view() -> rx.Component:
         ),
         # Report content based on selected tab
         rx.match(
-            AppState.active_report_tab,
+            ReportState.active_report_tab,
             ("trial_balance", trial_balance_report()),
             ("balance_sheet", balance_sheet_report()),
             ("income_statement", income_statement_report()),
@@ -38,9 +38,9 @@ def report_tab_button(text: str, tab_name: str) -> rx.Component:
     """Tab button for report selection."""
     return rx.el.button(
         text,
-        on_click=lambda: AppState.set_active_report_tab(tab_name),
+        on_click=lambda: ReportState.set_active_report_tab(tab_name),
         class_name=rx.cond(
-            AppState.active_report_tab == tab_name,
+            ReportState.active_report_tab == tab_name,
             "px-4 py-2 text-sm font-semibold text-emerald-600 border-b-2 border-emerald-600 font-['JetBrains_Mono']",
             "px-4 py-2 text-sm font-semibold text-gray-600 hover:text-gray-800 font-['JetBrains_Mono']",
         ),
@@ -93,8 +93,8 @@ def report_date_filter() -> rx.Component:
                 AppState.t["as_of_date"],
                 rx.el.input(
                     type="date",
-                    value=AppState.report_date,
-                    on_change=AppState.set_report_date,
+                    value=ReportState.report_date,
+                    on_change=ReportState.set_report_date,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                 ),
             ),
@@ -104,7 +104,7 @@ def report_date_filter() -> rx.Component:
             rx.el.button(
                 rx.icon("download", class_name="w-4 h-4 mr-2"),
                 AppState.t["export_csv"],
-                on_click=AppState.export_report_csv,
+                on_click=ReportState.export_report_csv,
                 class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 rounded-md shadow-sm hover:bg-emerald-700 flex items-center font-['JetBrains_Mono']",
             ),
             rx.el.button(
@@ -129,7 +129,7 @@ def trial_balance_report() -> rx.Component:
                     class_name="text-lg font-semibold text-center mb-2",
                 ),
                 rx.el.p(
-                    f"{AppState.t['as_of']} {AppState.report_date}",
+                    f"{AppState.t['as_of']} {ReportState.report_date}",
                     class_name="text-sm text-gray-600 text-center mb-4",
                 ),
                 class_name="border-b pb-4",
@@ -156,7 +156,7 @@ def trial_balance_report() -> rx.Component:
             ),
             # Account rows
             rx.foreach(
-                AppState.trial_balance_data,
+                ReportState.trial_balance_data,
                 trial_balance_row,
             ),
             # Totals row
@@ -167,11 +167,11 @@ def trial_balance_report() -> rx.Component:
                     class_name="col-span-4 font-bold",
                 ),
                 rx.el.p(
-                    f"${AppState.trial_balance_total_debits.to_string()}",
+                    f"${ReportState.trial_balance_total_debits.to_string()}",
                     class_name="col-span-2 text-right font-mono font-bold",
                 ),
                 rx.el.p(
-                    f"${AppState.trial_balance_total_credits.to_string()}",
+                    f"${ReportState.trial_balance_total_credits.to_string()}",
                     class_name="col-span-2 text-right font-mono font-bold",
                 ),
                 class_name="grid grid-cols-10 gap-4 p-3 bg-emerald-50 text-sm font-['JetBrains_Mono'] border-t-2 border-emerald-600",
@@ -192,7 +192,7 @@ def balance_sheet_report() -> rx.Component:
                     class_name="text-lg font-semibold text-center mb-2",
                 ),
                 rx.el.p(
-                    f"{AppState.t['as_of']} {AppState.report_date}",
+                    f"{AppState.t['as_of']} {ReportState.report_date}",
                     class_name="text-sm text-gray-600 text-center mb-4",
                 ),
                 class_name="border-b pb-4",
@@ -204,7 +204,7 @@ def balance_sheet_report() -> rx.Component:
                     class_name="text-md font-bold text-emerald-700 mb-3 uppercase",
                 ),
                 rx.foreach(
-                    AppState.balance_sheet_assets,
+                    ReportState.balance_sheet_assets,
                     lambda acc: rx.el.div(
                         rx.el.p(
                             f"{acc['code']} - {acc['name']}",
@@ -223,7 +223,7 @@ def balance_sheet_report() -> rx.Component:
                         class_name="col-span-3 font-bold",
                     ),
                     rx.el.p(
-                        f"${AppState.total_assets.to_string()}",
+                        f"${ReportState.total_assets.to_string()}",
                         class_name="text-right font-mono font-bold",
                     ),
                     class_name="grid grid-cols-4 gap-4 px-4 py-2 mt-2 bg-emerald-50 text-sm font-['JetBrains_Mono'] border-t border-emerald-200",
@@ -237,7 +237,7 @@ def balance_sheet_report() -> rx.Component:
                     class_name="text-md font-bold text-emerald-700 mb-3 uppercase",
                 ),
                 rx.foreach(
-                    AppState.balance_sheet_liabilities,
+                    ReportState.balance_sheet_liabilities,
                     lambda acc: rx.el.div(
                         rx.el.p(
                             f"{acc['code']} - {acc['name']}",
@@ -256,7 +256,7 @@ def balance_sheet_report() -> rx.Component:
                         class_name="col-span-3 font-bold",
                     ),
                     rx.el.p(
-                        f"${AppState.total_liabilities.to_string()}",
+                        f"${ReportState.total_liabilities.to_string()}",
                         class_name="text-right font-mono font-bold",
                     ),
                     class_name="grid grid-cols-4 gap-4 px-4 py-2 mt-2 bg-emerald-50 text-sm font-['JetBrains_Mono'] border-t border-emerald-200",
@@ -270,7 +270,7 @@ def balance_sheet_report() -> rx.Component:
                     class_name="text-md font-bold text-emerald-700 mb-3 uppercase",
                 ),
                 rx.foreach(
-                    AppState.balance_sheet_equity,
+                    ReportState.balance_sheet_equity,
                     lambda acc: rx.el.div(
                         rx.el.p(
                             f"{acc['code']} - {acc['name']}",
@@ -289,7 +289,7 @@ def balance_sheet_report() -> rx.Component:
                         class_name="col-span-3 font-bold",
                     ),
                     rx.el.p(
-                        f"${AppState.total_equity.to_string()}",
+                        f"${ReportState.total_equity.to_string()}",
                         class_name="text-right font-mono font-bold",
                     ),
                     class_name="grid grid-cols-4 gap-4 px-4 py-2 mt-2 bg-emerald-50 text-sm font-['JetBrains_Mono'] border-t border-emerald-200",
@@ -303,7 +303,7 @@ def balance_sheet_report() -> rx.Component:
                     class_name="col-span-3 font-bold text-lg",
                 ),
                 rx.el.p(
-                    f"${AppState.total_liabilities_equity.to_string()}",
+                    f"${ReportState.total_liabilities_equity.to_string()}",
                     class_name="text-right font-mono font-bold text-lg",
                 ),
                 class_name="grid grid-cols-4 gap-4 px-4 py-3 bg-emerald-100 text-sm font-['JetBrains_Mono'] border-t-2 border-emerald-600",
@@ -322,8 +322,8 @@ def income_statement_report() -> rx.Component:
                     AppState.t["start_date"],
                     rx.el.input(
                         type="date",
-                        value=AppState.report_start_date,
-                        on_change=AppState.set_report_start_date,
+                        value=ReportState.report_start_date,
+                        on_change=ReportState.set_report_start_date,
                         class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                     ),
                 ),
@@ -331,8 +331,8 @@ def income_statement_report() -> rx.Component:
                     AppState.t["end_date"],
                     rx.el.input(
                         type="date",
-                        value=AppState.report_end_date,
-                        on_change=AppState.set_report_end_date,
+                        value=ReportState.report_end_date,
+                        on_change=ReportState.set_report_end_date,
                         class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono']",
                     ),
                 ),
@@ -342,7 +342,7 @@ def income_statement_report() -> rx.Component:
                 rx.el.button(
                     rx.icon("download", class_name="w-4 h-4 mr-2"),
                     AppState.t["export_csv"],
-                    on_click=AppState.export_report_csv,
+                    on_click=ReportState.export_report_csv,
                     class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 rounded-md shadow-sm hover:bg-emerald-700 flex items-center font-['JetBrains_Mono']",
                 ),
                 rx.el.button(
@@ -361,7 +361,7 @@ def income_statement_report() -> rx.Component:
                     class_name="text-lg font-semibold text-center mb-2",
                 ),
                 rx.el.p(
-                    f"{AppState.report_start_date} {AppState.t['to']} {AppState.report_end_date}",
+                    f"{ReportState.report_start_date} {AppState.t['to']} {ReportState.report_end_date}",
                     class_name="text-sm text-gray-600 text-center mb-4",
                 ),
                 class_name="border-b pb-4",
@@ -373,7 +373,7 @@ def income_statement_report() -> rx.Component:
                     class_name="text-md font-bold text-emerald-700 mb-3 uppercase",
                 ),
                 rx.foreach(
-                    AppState.income_statement_revenue,
+                    ReportState.income_statement_revenue,
                     lambda acc: rx.el.div(
                         rx.el.p(
                             f"{acc['code']} - {acc['name']}",
@@ -392,7 +392,7 @@ def income_statement_report() -> rx.Component:
                         class_name="col-span-3 font-bold",
                     ),
                     rx.el.p(
-                        f"${AppState.total_revenue.to_string()}",
+                        f"${ReportState.total_revenue.to_string()}",
                         class_name="text-right font-mono font-bold",
                     ),
                     class_name="grid grid-cols-4 gap-4 px-4 py-2 mt-2 bg-emerald-50 text-sm font-['JetBrains_Mono'] border-t border-emerald-200",
@@ -406,7 +406,7 @@ def income_statement_report() -> rx.Component:
                     class_name="text-md font-bold text-red-700 mb-3 uppercase",
                 ),
                 rx.foreach(
-                    AppState.income_statement_expenses,
+                    ReportState.income_statement_expenses,
                     lambda acc: rx.el.div(
                         rx.el.p(
                             f"{acc['code']} - {acc['name']}",
@@ -425,7 +425,7 @@ def income_statement_report() -> rx.Component:
                         class_name="col-span-3 font-bold",
                     ),
                     rx.el.p(
-                        f"${AppState.total_expenses.to_string()}",
+                        f"${ReportState.total_expenses.to_string()}",
                         class_name="text-right font-mono font-bold",
                     ),
                     class_name="grid grid-cols-4 gap-4 px-4 py-2 mt-2 bg-red-50 text-sm font-['JetBrains_Mono'] border-t border-red-200",
@@ -439,9 +439,9 @@ def income_statement_report() -> rx.Component:
                     class_name="col-span-3 font-bold text-lg",
                 ),
                 rx.el.p(
-                    f"${AppState.net_income.to_string()}",
+                    f"${ReportState.net_income.to_string()}",
                     class_name=rx.cond(
-                        AppState.net_income >= 0,
+                        ReportState.net_income >= 0,
                         "text-right font-mono font-bold text-lg text-emerald-600",
                         "text-right font-mono font-bold text-lg text-red-600",
                     ),
@@ -462,51 +462,57 @@ def general_ledger_report() -> rx.Component:
                 rx.el.select(
                     rx.el.option(AppState.t["all_accounts"], value=""),
                     rx.foreach(
-                        AppState.accounts,
-                        lambda acc: rx.el.option(
-                            f"{acc['code']} - {acc['name']}", value=acc["id"]
-                        ),
+                        LedgerState.account_options,
+                        lambda acc: rx.el.option(acc["label"], value=acc["id"]),
                     ),
-                    value=AppState.general_ledger_account_id,
-                    on_change=AppState.set_general_ledger_account_id,
+                    value=ReportState.general_ledger_account_id,
+                    on_change=ReportState.set_general_ledger_account_id,
                     class_name="w-full px-3 py-2 border border-gray-300 rounded-md text-sm shadow-sm focus:outline-none focus:ring-1 focus:ring-emerald-500 focus:border-emerald-500 font-['JetBrains_Mono'] bg-white",
                 ),
             ),
             class_name="mb-6 p-4 bg-gray-50 rounded-lg",
         ),
         rx.cond(
-            AppState.general_ledger_account_id != "",
+            ReportState.general_ledger_account_id != "",
             rx.el.div(
-                # Header
                 rx.el.div(
-                    rx.el.p(
-                        AppState.t["date"],
-                        class_name="font-semibold col-span-2",
-                    ),
-                    rx.el.p(
-                        AppState.t["description"],
-                        class_name="font-semibold col-span-4",
-                    ),
-                    rx.el.p(
-                        AppState.t["debit"],
-                        class_name="font-semibold col-span-2 text-right",
-                    ),
-                    rx.el.p(
-                        AppState.t["credit"],
-                        class_name="font-semibold col-span-2 text-right",
+                    # Header
+                    rx.el.div(
+                        rx.el.p(
+                            AppState.t["date"],
+                            class_name="font-semibold col-span-2",
+                        ),
+                        rx.el.p(
+                            AppState.t["description"],
+                            class_name="font-semibold col-span-4",
+                        ),
+                        rx.el.p(
+                            AppState.t["debit"],
+                            class_name="font-semibold col-span-2 text-right",
+                        ),
+                        rx.el.p(
+                            AppState.t["credit"],
+                            class_name="font-semibold col-span-2 text-right",
+                        ),
+                        rx.el.p(
+                            AppState.t["balance"],
+                            class_name="font-semibold col-span-2 text-right",
+                        ),
+                        class_name="grid grid-cols-12 gap-4 p-3 bg-gray-100 rounded-t-lg text-sm font-['JetBrains_Mono']",
                     ),
-                    rx.el.p(
-                        AppState.t["balance"],
-                        class_name="font-semibold col-span-2 text-right",
+                    # Transaction entries
+                    rx.foreach(
+                        ReportState.general_ledger_entries,
+                        general_ledger_row,
                     ),
-                    class_name="grid grid-cols-12 gap-4 p-3 bg-gray-100 rounded-t-lg text-sm font-['JetBrains_Mono']",
+                    class_name="bg-white rounded-lg shadow-md border border-gray-200",
                 ),
-                # Transaction entries
-                rx.foreach(
-                    AppState.general_ledger_entries,
-                    general_ledger_row,
+                pagination_controls(
+                    ReportState.earlier_general_ledger_page,
+                    ReportState.later_general_ledger_page,
+                    ReportState.has_earlier_general_ledger_page,
+                    ReportState.has_later_general_ledger_page,
                 ),
-                class_name="bg-white rounded-lg shadow-md border border-gray-200",
             ),
             rx.el.div(
                 rx.el.p(
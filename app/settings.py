@@ -1,5 +1,5 @@
 import reflex as rx
-from app.state import AppState
+from app.state import AppState, LedgerState
 from app.components import form_field
 
 
@@ -36,7 +36,7 @@ def settings_modal() -> rx.Component:
                     ),
                     rx.el.button(
                         AppState.t["export"],
-                        on_click=AppState.export_data,
+                        on_click=LedgerState.export_data,
                         class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 rounded-md shadow-sm hover:bg-emerald-700",
                     ),
                     class_name="flex items-center justify-between p-4 bg-gray-50 rounded-lg",
@@ -58,11 +58,19 @@ def settings_modal() -> rx.Component:
                             class_name="px-4 py-2 text-sm font-medium text-white bg-emerald-600 rounded-md shadow-sm hover:bg-emerald-700",
                         ),
                         id="import-upload",
-                        on_drop=AppState.import_data,
+                        on_drop=LedgerState.import_data,
                         class_name="flex items-center justify-center",
                     ),
                     class_name="flex items-center justify-between p-4 bg-gray-50 rounded-lg mt-4",
                 ),
+                rx.cond(
+                    LedgerState.import_progress != "",
+                    rx.el.p(
+                        LedgerState.import_progress,
+                        class_name="text-sm text-gray-500 mt-2 px-4",
+                    ),
+                    None,
+                ),
                 rx.el.div(
                     rx.el.div(
                         rx.el.p(
@@ -78,12 +86,12 @@ def settings_modal() -> rx.Component:
                     rx.el.div(
                         rx.el.button(
                             "Normalize Data",
-                            on_click=AppState.normalize_data,
+                            on_click=LedgerState.normalize_data,
                             class_name="px-3 py-2 text-sm font-medium text-white bg-emerald-600 rounded-md shadow-sm hover:bg-emerald-700 mr-2",
                         ),
                         rx.el.button(
                             "Recompute Balances",
-                            on_click=AppState.recompute_balances_from_transactions,
+                            on_click=LedgerState.recompute_balances_from_transactions,
                             class_name="px-3 py-2 text-sm font-medium text-white bg-indigo-600 rounded-md shadow-sm hover:bg-indigo-700",
                         ),
                     ),
@@ -117,7 +125,7 @@ def settings_modal() -> rx.Component:
                                     rx.radix.primitives.dialog.close(
                                         rx.el.button(
                                             AppState.t["clear_data"],
-                                            on_click=AppState.clear_all_data,
+                                            on_click=LedgerState.clear_all_data,
                                             class_name="px-4 py-2 text-sm font-medium text-white bg-red-600 border border-transparent rounded-md shadow-sm hover:bg-red-700",
                                         )
                                     ),
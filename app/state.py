@@ -1,26 +1,105 @@
 import reflex as rx
-from typing import TypedDict, Literal, cast
+from typing import Any, Callable, Iterable, Iterator, TypedDict, Literal, cast
 import datetime
 import uuid
+from bisect import bisect_right
 import logging
 import json
-from typing import Any
+
+from app.ledger import (
+    AccountIndex,
+    AmountIndex,
+    BalanceIndex,
+    DateIndex,
+    DescriptionIndex,
+    EntryStore,
+    MonthlyRollup,
+    ResultCache,
+    RowFilter,
+    RowPlan,
+    date_ordinal,
+    keyset_page,
+    month_end,
+    transaction_error,
+)
+from app.backup import BACKUP_SECTIONS, BackupImport, BackupReader
+from app.export import register_export
+from app.money import (
+    account_from_cents,
+    account_to_cents,
+    from_cents,
+    to_cents,
+    transaction_from_cents,
+    transaction_to_cents,
+)
+from app.storage import (
+    get_ledger_store,
+    month_key,
+    months_in_range,
+    read_shards_script,
+    shard_digest,
+    write_shards_script,
+)
 
 AccountType = Literal["Asset", "Liability", "Equity", "Revenue", "Expense"]
 
+# Numbering range of account codes for each type, used for code suggestions.
+ACCOUNT_CODE_RANGES: dict[str, tuple[int, int]] = {
+    "Asset": (1000, 1999),
+    "Liability": (2000, 2999),
+    "Equity": (3000, 3999),
+    "Revenue": (4000, 4999),
+    "Expense": (5000, 5999),
+}
+
+# Rows per page of the transaction list and of the General Ledger report.
+TRANSACTION_PAGE_SIZE = 50
+GENERAL_LEDGER_PAGE_SIZE = 50
+
+# FilterState fields that select transactions, in LedgerState._row_plan order.
+FILTER_FIELDS = (
+    "filter_start_date",
+    "filter_end_date",
+    "filter_description",
+    "filter_account_id",
+    "filter_min_amount",
+    "filter_max_amount",
+)
+
+# Number of journaled postings kept in the delta segment before they are
+# folded into the base snapshot.
+JOURNAL_COMPACTION_THRESHOLD = 100
+
+# Deleted transactions leave tombstone rows (see LedgerState.delete_transaction);
+# the ledger is compacted once they make up this share of its rows.
+TOMBSTONE_COMPACTION_SHARE = 0.25
+
+# Backup imports read the upload in chunks and report progress every batch of transactions.
+IMPORT_CHUNK_BYTES = 256 * 1024
+IMPORT_BATCH_SIZE = 5000
+
+
+def _unproxied(value: Any) -> Any:
+    """``value`` without Reflex's MutableProxy, for bulk work on backend vars.
+
+    Mutations through the result do not mark the state dirty, so callers
+    also change a tracked var (``ledger_version``) in the same event.
+    """
+    return getattr(value, "__wrapped__", value)
+
 
 class Account(TypedDict):
     id: str
     name: str
     code: str
     type: AccountType
-    balance: float
+    balance: int  # cents
 
 
 class Entry(TypedDict):
     account_id: str
-    debit: float
-    credit: float
+    debit: int  # cents
+    credit: int  # cents
 
 
 class Transaction(TypedDict):
@@ -30,57 +109,25 @@ class Transaction(TypedDict):
     entries: list[Entry]
 
 
+class ReportSummary(TypedDict):
+    """Every report figure derived from the chart of accounts, in cents."""
+    # Accounts as of ``report_date``, by type
+    as_of: dict[str, list[Account]]
+    as_of_totals: dict[str, int]
+    trial_balance: list[dict]
+    trial_debits: int
+    trial_credits: int
+    # Revenue and expense activity for the report period, by type
+    period: dict[str, list[Account]]
+    period_totals: dict[str, int]
+    counts: dict[str, int]
+
+
 class AppState(rx.State):
-    """The main state for the accounting app."""
+    """The main state for the accounting app: UI preferences shared by every view."""
 
     active_tab: Literal["accounts", "transactions", "reports", "dashboard"] = "accounts"
-    accounts_json: str = rx.LocalStorage(
-        '[{"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Cash", "code": "1010", "type": "Asset", "balance": 10000.0}, {"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Accounts Receivable", "code": "1200", "type": "Asset", "balance": 5000.0}, {"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Office Supplies", "code": "1510", "type": "Asset", "balance": 500.0}, {"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Accounts Payable", "code": "2010", "type": "Liability", "balance": -2000.0}, {"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Owner\'s Equity", "code": "3010", "type": "Equity", "balance": -13500.0}, {"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Sales Revenue", "code": "4010", "type": "Revenue", "balance": 0.0}, {"id": "'
-        + str(uuid.uuid4())
-        + '", "name": "Rent Expense", "code": "5010", "type": "Expense", "balance": 0.0}]',
-        name="accounts",
-    )
-    transactions_json: str = rx.LocalStorage("[]", name="transactions")
-    accounts: list[Account] = []
-    transactions: list[Transaction] = []
-    new_account_name: str = ""
-    new_account_code: str = ""
-    new_account_type: AccountType = "Asset"
-    show_account_form: bool = False
-    new_transaction_date: str = datetime.date.today().isoformat()
-    new_transaction_description: str = ""
-    new_transaction_entries: list[dict[str, str | float]] = [
-        {"account_id": "", "debit": 0.0, "credit": 0.0},
-        {"account_id": "", "debit": 0.0, "credit": 0.0},
-    ]
-    show_transaction_form: bool = False
-    filter_start_date: str = ""
-    filter_end_date: str = ""
-    filter_description: str = ""
-    filter_account_id: str = ""
-    filter_min_amount: str = ""
-    filter_max_amount: str = ""
-    expanded_transaction_id: str = ""
     show_settings: bool = False
-    account_types: list[AccountType] = [
-        "Asset",
-        "Liability",
-        "Equity",
-        "Revenue",
-        "Expense",
-    ]
     language: str = rx.LocalStorage("en", name="language")
     available_languages: list[dict[str, str]] = [
         {"code": "en", "name": "English", "flag": "🇬🇧"},
@@ -89,13 +136,6 @@ class AppState(rx.State):
         {"code": "zh", "name": "中文", "flag": "🇨🇳"},
         {"code": "pt", "name": "Português", "flag": "🇵🇹"},
     ]
-    # Report-related state
-    active_report_tab: Literal["trial_balance", "balance_sheet", "income_statement", "general_ledger"] = "trial_balance"
-    report_date: str = datetime.date.today().isoformat()
-    report_start_date: str = datetime.date.today().replace(day=1).isoformat()
-    report_end_date: str = datetime.date.today().isoformat()
-    general_ledger_account_id: str = ""
-    # UI state
     # Persisted as string to avoid type-mismatch with LocalStorage
     dark_mode_str: str = rx.LocalStorage("false", name="dark_mode")
 
@@ -116,30 +156,876 @@ class AppState(rx.State):
     @rx.event
     def toggle_settings(self):
         self.show_settings = not self.show_settings
-    
+
     @rx.event
     def toggle_dark_mode(self):
         # Flip the stored string value
         current = str(self.dark_mode_str).lower() == "true"
         self.dark_mode_str = "true" if not current else "false"
-    
+
+    @rx.event
+    def set_active_tab(self, tab_name: Literal["accounts", "transactions", "reports", "dashboard"]):
+        self.active_tab = tab_name
+
+
+class LedgerState(AppState):
+    """The ledger: accounts, transactions, their indexes and persistence."""
+
+    accounts_json: str = rx.LocalStorage(
+        '[{"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Cash", "code": "1010", "type": "Asset", "balance": 10000.0}, {"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Accounts Receivable", "code": "1200", "type": "Asset", "balance": 5000.0}, {"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Office Supplies", "code": "1510", "type": "Asset", "balance": 500.0}, {"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Accounts Payable", "code": "2010", "type": "Liability", "balance": -2000.0}, {"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Owner\'s Equity", "code": "3010", "type": "Equity", "balance": -13500.0}, {"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Sales Revenue", "code": "4010", "type": "Revenue", "balance": 0.0}, {"id": "'
+        + str(uuid.uuid4())
+        + '", "name": "Rent Expense", "code": "5010", "type": "Expense", "balance": 0.0}]',
+        name="accounts",
+    )
+    # Legacy single-key layout; migrated into month shards on load.
+    transactions_json: str = rx.LocalStorage("[]", name="transactions")
+    # Month shard -> digest of its stored JSON. Each shard lives in its own
+    # LocalStorage key (see app.storage.shard_key) so writes stay per-month.
+    manifest_json: str = rx.LocalStorage("{}", name="transactions_manifest")
+    # Month -> {transaction id: transaction}, in posting order.
+    _month_shards: dict[str, dict[str, Transaction]] = {}
+    # Slot-indexed compact form of the ledger, see app.ledger.
+    _account_index: AccountIndex = AccountIndex()
+    # Bumped whenever the chart of accounts changes (not on balance updates),
+    # so views that only need account names and codes skip posting churn.
+    accounts_version: int = 0
+    # Bumped by every data mutation (accounts, balances or transactions) and
+    # by nothing else; heavy computed vars are memoized against it, and
+    # substate vars derived from the ledger declare it as a dependency.
+    ledger_version: int = 0
+    _result_cache: ResultCache = ResultCache()
+    _entry_store: EntryStore = EntryStore()
+    _balance_index: BalanceIndex = BalanceIndex()
+    _monthly_rollup: MonthlyRollup = MonthlyRollup()
+    _date_index: DateIndex = DateIndex()
+    _description_index: DescriptionIndex = DescriptionIndex()
+    _amount_index: AmountIndex = AmountIndex()
+    # Transaction id -> position in ``_transactions``.
+    _row_by_id: dict[str, int] = {}
+    # Rows of ``_transactions`` left as ``None`` by deletes since the last compaction.
+    _deleted_rows: int = 0
+    _pending_months: set[str] = set()
+    # Append-only delta segment: postings since the last compaction. The
+    # base snapshot above (accounts + transactions) excludes them.
+    journal_json: str = rx.LocalStorage("[]", name="transactions_journal")
+    _journal: list[Transaction] = []
+    # Progress line shown in the settings modal while a backup is imported.
+    import_progress: str = ""
+    # The ledger itself is backend-only; the browser gets the render-ready
+    # slices exposed by the computed vars below.
+    _accounts: list[Account] = []
+    # Deleted transactions are ``None`` until the next compaction, so rows
+    # (the positions every index refers to) stay stable.
+    _transactions: list[Transaction | None] = []
+
+    def _memoized(self, name: str, params: tuple, compute: Callable[[], Any]) -> Any:
+        """Return ``compute()``, cached on (name, ledger version, params).
+
+        ``params`` must hold every non-ledger input of ``compute``. Cached
+        results are shared, so callers must not mutate them.
+        """
+        return self._result_cache.get((name, self.ledger_version, *params), compute)
+
+    @rx.var
+    def total_transaction_count(self) -> int:
+        return len(self._transactions) - self._deleted_rows
+
+    def _transaction_row(self, row: int) -> dict:
+        """The list-view fields of one transaction, with its total in currency units."""
+        t = self._transactions[row]
+        return {
+            "id": t["id"],
+            "date": t["date"],
+            "description": t["description"],
+            "total": from_cents(self._amount_index.totals[row]),
+        }
+
+    @rx.var(deps=["accounts_version"], auto_deps=False)
+    def get_account_map(self) -> dict[str, dict[str, str]]:
+        """Account id -> code, name and type; rebuilt only when the chart changes."""
+        return {
+            acc["id"]: {"code": acc["code"], "name": acc["name"], "type": acc["type"]}
+            for acc in self._accounts
+        }
+
+    @rx.var(deps=["accounts_version"], auto_deps=False)
+    def account_options(self) -> list[dict[str, str]]:
+        """Id and "code - name" label of each account, for the account selects."""
+        return [
+            {"id": acc["id"], "label": f"{acc['code']} - {acc['name']}"}
+            for acc in self._accounts
+        ]
+
+    @rx.var
+    def account_cards(self) -> list[Account]:
+        """The chart of accounts with current balances, for display."""
+        return self._memoized(
+            "account_cards", (), lambda: [account_from_cents(acc) for acc in self._accounts]
+        )
+
+    @rx.var
+    def account_count(self) -> int:
+        return len(self._accounts)
+
+    # Dashboard figures: current balances and lifetime revenue and expenses,
+    # independent of the Reports page's dates.
+    def _balance_totals(self) -> dict[str, int]:
+        """Current balance (cents) of each account type, summed in one pass."""
+        def totals() -> dict[str, int]:
+            by_type = dict.fromkeys(ACCOUNT_CODE_RANGES, 0)
+            for acc in self._accounts:
+                by_type[acc["type"]] += acc["balance"]
+            return by_type
+
+        return self._memoized("balance_totals", (), totals)
+
+    @rx.var
+    def current_total_assets(self) -> float:
+        return from_cents(self._balance_totals()["Asset"])
+
+    @rx.var
+    def current_total_liabilities(self) -> float:
+        return from_cents(abs(self._balance_totals()["Liability"]))
+
+    @rx.var
+    def current_total_liabilities_equity(self) -> float:
+        totals = self._balance_totals()
+        return from_cents(abs(totals["Liability"]) + abs(totals["Equity"]))
+
+    @rx.var
+    def lifetime_revenue(self) -> float:
+        return from_cents(abs(self._balance_totals()["Revenue"]))
+
+    @rx.var
+    def lifetime_expenses(self) -> float:
+        return from_cents(self._balance_totals()["Expense"])
+
+    @rx.var
+    def lifetime_net_income(self) -> float:
+        totals = self._balance_totals()
+        return from_cents(abs(totals["Revenue"]) - totals["Expense"])
+
+    def _add_account(self, account: Account):
+        """Insert a new account at its sorted position and persist it."""
+        position = bisect_right(self._accounts, account["code"], key=lambda acc: acc["code"])
+        self._accounts.insert(position, account)
+        self._account_index.insert(position, account)
+        self.accounts_version += 1
+        self.ledger_version += 1
+        # Account balances in the snapshot must exclude journaled postings,
+        # so fold the journal in before rewriting the chart of accounts.
+        self._write_local_snapshot()
+        if (store := get_ledger_store()) is not None:
+            store.save_accounts([account])
+
+    def _replace_transaction(self, row: int, new: Transaction):
+        """Swap the transaction at ``row`` for ``new``, moving its balance effects."""
+        old = self._transactions[row]
+        self._unindex_transaction(row, old)
+        self._apply_entries_to_balances(old["entries"], sign=-1)
+        self._transactions[row] = new
+        self.ledger_version += 1
+        self._index_transactions([(row, new)])
+        self._apply_entries_to_balances(new["entries"])
+        self._persist_rewrite(old, new)
+
+    @rx.event
+    def delete_transaction(self, transaction_id: str):
+        row = self._row_by_id.get(transaction_id)
+        if row is None:
+            return
+        old = self._transactions[row]
+        self._unindex_transaction(row, old)
+        self._apply_entries_to_balances(old["entries"], sign=-1)
+        # A tombstone keeps the later rows' numbers; compaction drops it.
+        self._transactions[row] = None
+        del self._row_by_id[transaction_id]
+        self._deleted_rows += 1
+        self.ledger_version += 1
+        self._persist_rewrite(old)
+        if self._deleted_rows >= TOMBSTONE_COMPACTION_SHARE * len(self._transactions):
+            self._compact()
+        return [
+            *self._storage_events(),
+            rx.toast(self.t["toast_transaction_deleted"], duration=3000),
+        ]
+
+    @rx.event
+    def post_transactions(self, transactions: list[dict]):
+        """Post a batch of transactions, with amounts in currency units as in backups.
+
+        Every transaction is validated against the account index before any
+        is posted, so an invalid one rejects the whole batch. Balances then
+        receive one aggregated delta per account and the batch is persisted
+        in a single write.
+        """
+        batch = [
+            transaction_to_cents({**t, "id": str(t.get("id") or uuid.uuid4())})
+            for t in transactions
+        ]
+        batch_ids: set[str] = set()
+        for number, txn in enumerate(batch, start=1):
+            error = self._transaction_error(txn, batch_ids)
+            if error:
+                return rx.toast(f"{self.t['toast_batch_rejected']} #{number}: {error}", duration=5000)
+            batch_ids.add(txn["id"])
+        self._post_batch(batch)
+        return [
+            *self._storage_events(),
+            rx.toast(f"{self.t['toast_transactions_posted']}: {len(batch)}", duration=3000),
+        ]
+
+    def _transaction_error(self, txn: Transaction, batch_ids: set[str]) -> str:
+        """Why ``txn`` cannot be posted, or an empty string if it can."""
+        if txn["id"] in self._row_by_id:
+            return f"duplicate id {txn['id']}"
+        return transaction_error(txn, self._account_index, batch_ids)
+
+    def _post_batch(self, batch: list[Transaction]):
+        """Append validated transactions, update balances and persist them once."""
+        first_row = len(self._transactions)
+        self._transactions.extend(batch)
+        self.ledger_version += 1
+        net_by_slot: dict[int, int] = {}
+        self._index_transactions(list(enumerate(batch, start=first_row)))
+        for txn in batch:
+            for entry in txn["entries"]:
+                slot = self._account_index.intern(entry["account_id"])
+                net_by_slot[slot] = net_by_slot.get(slot, 0) + entry["debit"] - entry["credit"]
+        self._apply_net_to_balances(net_by_slot)
+        self._persist_postings(batch)
+
+    def _apply_entries_to_balances(self, entries: list[Entry], sign: int = 1):
+        """Add (or with ``sign=-1``, reverse) the balance effect of ``entries``."""
+        net_by_slot: dict[int, int] = {}
+        for entry in entries:
+            slot = self._account_index.intern(entry["account_id"])
+            net_by_slot[slot] = net_by_slot.get(slot, 0) + sign * (entry["debit"] - entry["credit"])
+        self._apply_net_to_balances(net_by_slot)
+
+    def _apply_net_to_balances(self, net_by_slot: dict[int, int]):
+        """Add per-slot ``debit - credit`` deltas (cents) to the account balances."""
+        for slot, net in net_by_slot.items():
+            position = self._account_index.positions[slot]
+            if position < 0:
+                continue
+            acc = self._accounts[position]
+            acc["balance"] += net if acc["type"] in ["Asset", "Expense"] else -net
+
+    def _read_storage(self, shards: dict[str, str]):
+        """Load the ledger from the server store, or from LocalStorage.
+
+        The LocalStorage path assembles the base snapshot from the month
+        ``shards`` (plus the legacy single ``transactions`` key, which is
+        migrated) and replays the journal on top of it. It also seeds an
+        empty server store.
+        """
+        store = get_ledger_store()
+        if store is not None and not store.is_empty():
+            self._accounts, self._transactions = store.load()
+            self._rebuild_indexes()
+            # Resync the offline copy with the store; only shards whose
+            # digest differs from the manifest are actually rewritten.
+            self._journal = []
+            self._write_local_snapshot(full=True)
+            return
+        try:
+            self._accounts = [account_to_cents(a) for a in json.loads(self.accounts_json)]
+        except json.JSONDecodeError as e:
+            logging.exception(f"Error decoding accounts_json: {e}")
+            self._accounts = []
+        transactions: list[Transaction] = []
+        for month in sorted(shards):
+            try:
+                transactions.extend(json.loads(shards[month]))
+            except json.JSONDecodeError as e:
+                logging.exception(f"Error decoding transaction shard {month}: {e}")
+        try:
+            legacy = json.loads(self.transactions_json)
+        except json.JSONDecodeError as e:
+            logging.exception(f"Error decoding transactions_json: {e}")
+            legacy = []
+        transactions.extend(legacy)
+        transactions = [transaction_to_cents(t) for t in transactions]
+        # A journal that was already folded into the snapshot (e.g. the
+        # compaction write landed but the journal reset did not) is skipped.
+        snapshot_ids = {t["id"] for t in transactions}
+        journal = [t for t in self._decode_journal() if t["id"] not in snapshot_ids]
+        self._transactions = transactions + journal
+        self._accounts = sorted(self._accounts, key=lambda acc: acc["code"])
+        self._rebuild_indexes()
+        self._journal = journal
+        # Snapshot balances exclude the journal, so replay its entries on top.
+        self._apply_entries_to_balances([e for txn in journal for e in txn["entries"]])
+        if legacy:
+            self._write_local_snapshot(full=True)
+        if store is not None:
+            store.replace_all(self._accounts, self._transactions)
+
+    def _decode_journal(self) -> list[Transaction]:
+        try:
+            return [transaction_to_cents(t) for t in json.loads(self.journal_json)]
+        except json.JSONDecodeError as e:
+            logging.exception(f"Error decoding journal_json: {e}")
+            return []
+
+    def _decode_manifest(self) -> dict[str, str]:
+        try:
+            return json.loads(self.manifest_json)
+        except json.JSONDecodeError as e:
+            logging.exception(f"Error decoding manifest_json: {e}")
+            return {}
+
+    def _rebuild_indexes(self):
+        """Rebuild every in-memory index after the ledger was loaded or replaced.
+
+        Everything is built in locals from the unproxied ledger and each
+        backend var is assigned once at the end.
+        """
+        transactions = _unproxied(self._transactions)
+        account_index = AccountIndex()
+        account_index.sync(_unproxied(self._accounts))
+        entry_store = EntryStore()
+        monthly_rollup = MonthlyRollup()
+        description_index = DescriptionIndex()
+        month_shards: dict[str, dict[str, Transaction]] = {}
+        row_by_id: dict[str, int] = {}
+        for row, txn in enumerate(transactions):
+            month = month_key(txn["date"])
+            month_shards.setdefault(month, {})[txn["id"]] = txn
+            row_by_id.setdefault(txn["id"], row)
+            description_index.add(row, txn["description"])
+            entry_store.add(row, txn["date"], txn["entries"], account_index)
+            for entry in txn["entries"]:
+                monthly_rollup.add(
+                    month,
+                    account_index.intern(entry["account_id"]),
+                    entry["debit"] - entry["credit"],
+                )
+        self._account_index = account_index
+        self._entry_store = entry_store
+        self._monthly_rollup = monthly_rollup
+        self._description_index = description_index
+        self._month_shards = month_shards
+        self._row_by_id = row_by_id
+        self._deleted_rows = 0
+        self._balance_index = BalanceIndex.build(entry_store, len(account_index))
+        self._date_index = DateIndex.build(transactions)
+        self._amount_index = AmountIndex.build(transactions)
+        self.accounts_version += 1
+        self.ledger_version += 1
+
+    def _index_transactions(self, indexed: list[tuple[int, Transaction]]):
+        """Add each ``(row, txn)``, stored at ``self._transactions[row]``, to the indexes.
+
+        The sorted indexes (date, amount, per-account balances) merge the
+        whole batch at once rather than inserting row by row.
+        """
+        account_index = self._account_index
+        entry_store = self._entry_store
+        description_index = self._description_index
+        monthly_rollup = self._monthly_rollup
+        month_shards = _unproxied(self._month_shards)
+        row_by_id = _unproxied(self._row_by_id)
+        dated_rows: list[tuple[str, int]] = []
+        rows_entries: list[tuple[int, list[Entry]]] = []
+        postings: list[tuple[int, int, int, int, int]] = []
+        for row, txn in indexed:
+            txn = _unproxied(txn)
+            month = month_key(txn["date"])
+            month_shards.setdefault(month, {})[txn["id"]] = txn
+            row_by_id.setdefault(txn["id"], row)
+            entry_store.add(row, txn["date"], txn["entries"], account_index)
+            description_index.add(row, txn["description"])
+            dated_rows.append((txn["date"], row))
+            rows_entries.append((row, txn["entries"]))
+            ordinal = date_ordinal(txn["date"])
+            for entry in txn["entries"]:
+                slot = account_index.intern(entry["account_id"])
+                postings.append((slot, ordinal, row, entry["debit"], entry["credit"]))
+                monthly_rollup.add(month, slot, entry["debit"] - entry["credit"])
+        self._date_index.add_many(dated_rows)
+        self._amount_index.add_many(rows_entries)
+        self._balance_index.add_many(postings)
+
+    def _unindex_transaction(self, row: int, txn: Transaction):
+        """Remove ``txn``, stored at ``self._transactions[row]``, from the indexes.
+
+        Only the entries, dates and months of ``txn`` are touched; rows keep
+        their numbers, so ``_index_transactions`` can re-add an edited version
+        at the same ``row``.
+        """
+        month = month_key(txn["date"])
+        _unproxied(self._month_shards).get(month, {}).pop(txn["id"], None)
+        self._entry_store.discard(row)
+        self._date_index.discard(txn["date"], row)
+        self._description_index.discard(row)
+        self._amount_index.discard(row)
+        ordinal = date_ordinal(txn["date"])
+        for entry in txn["entries"]:
+            slot = self._account_index.intern(entry["account_id"])
+            self._balance_index.discard(slot, ordinal, row)
+            self._monthly_rollup.add(month, slot, entry["credit"] - entry["debit"])
+
+    def _compact(self):
+        """Drop the tombstones of deleted transactions, renumbering rows, and rebuild the indexes."""
+        self._transactions = [t for t in _unproxied(self._transactions) if t is not None]
+        self._rebuild_indexes()
+
+    def _persist_rewrite(self, old: Transaction, new: Transaction | None = None):
+        """Persist an edit (or, without ``new``, a delete) of ``old``.
+
+        Only the month shards holding the old and new versions are rewritten;
+        the server store moves the balances by the change in entries.
+        """
+        if (store := get_ledger_store()) is not None:
+            if new is None:
+                store.delete_transaction(old["id"])
+            else:
+                store.update_transaction(new)
+        self._write_local_snapshot()
+        self._pending_months.add(month_key(old["date"]))
+        if new is not None:
+            self._pending_months.add(month_key(new["date"]))
+
+    def _persist_postings(self, transactions: list[Transaction]):
+        """Append postings to the journal, compacting once it grows large."""
+        if (store := get_ledger_store()) is not None:
+            store.append_transactions(transactions)
+        self._journal.extend(transactions)
+        if len(self._journal) >= JOURNAL_COMPACTION_THRESHOLD:
+            self._write_local_snapshot()
+        else:
+            self.journal_json = json.dumps([transaction_from_cents(t) for t in _unproxied(self._journal)])
+
+    def _persist_snapshot(self):
+        """Rewrite the whole ledger in every configured storage backend."""
+        self._write_local_snapshot(full=True)
+        if (store := get_ledger_store()) is not None:
+            store.replace_all(self._accounts, self._transactions)
+
+    def _write_local_snapshot(self, full: bool = False):
+        """Fold the journal into the LocalStorage base snapshot.
+
+        Only the month shards touched by journaled postings are queued for
+        rewriting, unless ``full`` is set. Queued shards are written by
+        ``_storage_events``.
+        """
+        if full:
+            self._pending_months |= set(self._decode_manifest()) | set(self._month_shards)
+        else:
+            self._pending_months |= {month_key(t["date"]) for t in self._journal}
+        self.accounts_json = json.dumps([account_from_cents(a) for a in self._accounts])
+        self.transactions_json = "[]"
+        self.journal_json = "[]"
+        self._journal = []
+
+    def _storage_events(self) -> list[rx.event.EventSpec]:
+        """Return the script that writes queued month shards to LocalStorage.
+
+        The manifest maps each written shard to its digest, so it only ever
+        lists months that are in LocalStorage, and a queued shard whose
+        content is unchanged is not written again.
+        """
+        if not self._pending_months:
+            return []
+        manifest = self._decode_manifest()
+        month_shards = _unproxied(self._month_shards)
+        shards: dict[str, str] = {}
+        removed: list[str] = []
+        for month in sorted(self._pending_months):
+            if not month_shards.get(month):
+                removed.append(month)
+                manifest.pop(month, None)
+                continue
+            data = json.dumps([transaction_from_cents(t) for t in month_shards[month].values()])
+            digest = shard_digest(data)
+            if manifest.get(month) != digest:
+                shards[month] = data
+                manifest[month] = digest
+        self.manifest_json = json.dumps(dict(sorted(manifest.items())))
+        self._pending_months = set()
+        if not shards and not removed:
+            return []
+        return [rx.call_script(write_shards_script(shards, removed))]
+
+    @rx.event
+    async def load_from_storage(self):
+        manifest = self._decode_manifest()
+        store = get_ledger_store()
+        if manifest and (store is None or store.is_empty()):
+            return rx.call_script(
+                read_shards_script(sorted(manifest)), callback=LedgerState.load_shards
+            )
+        return await self.load_shards({})
+
+    @rx.event
+    async def load_shards(self, shards: dict[str, str]):
+        self._read_storage(shards)
+        # Default preset to All Time on first load if there are transactions and no date filter
+        filters = await self.get_state(FilterState)
+        if self._transactions and not (filters.filter_start_date or filters.filter_end_date):
+            filters.set_date_filter_preset("all")
+        return self._storage_events()
+
+    @rx.event
+    def export_data(self) -> rx.event.EventSpec:
+        """Download the ledger as a JSON backup (see ``app.backup`` for the format)."""
+        net_by_slot = self._entry_store.net_by_slot(len(self._account_index))
+        data_to_export = {
+            "accounts": [
+                {
+                    **account_from_cents(a),
+                    "opening_balance": from_cents(self._opening_balance(a, net_by_slot)),
+                }
+                for a in self._accounts
+            ],
+            "transactions": [
+                transaction_from_cents(t) for t in _unproxied(self._transactions) if t is not None
+            ],
+        }
+        return rx.download(
+            data=json.dumps(data_to_export, indent=2),
+            filename=f"accounting_backup_{datetime.date.today().isoformat()}.json",
+        )
+
+    def _opening_balance(self, account: Account, net_by_slot: list[int]) -> int:
+        """The part of ``account``'s balance (cents) that no transaction records."""
+        net = net_by_slot[self._account_index.intern(account["id"])]
+        return account["balance"] - (net if account["type"] in ["Asset", "Expense"] else -net)
+
+    @rx.event
+    async def import_data(self, files: list[rx.UploadFile]):
+        """Replace the ledger with an uploaded backup.
+
+        The file is read ``IMPORT_CHUNK_BYTES`` at a time and each record is
+        validated into a staged ledger as it is parsed, with progress shown
+        every ``IMPORT_BATCH_SIZE`` transactions. The current ledger is only replaced
+        once the whole file has been read and validated; any error leaves it
+        untouched. Balances are rebuilt by posting the imported entries onto
+        each account's opening balance.
+        """
+        if not files:
+            yield rx.toast(self.t["toast_no_file"], duration=3000)
+            return
+        reader = BackupReader()
+        staged = BackupImport(ACCOUNT_CODE_RANGES)
+        try:
+            while True:
+                chunk = await files[0].read(IMPORT_CHUNK_BYTES)
+                for section, record in reader.feed(chunk) if chunk else reader.close():
+                    if section == "accounts":
+                        staged.add_account(record)
+                        continue
+                    staged.add_transaction(record)
+                    if len(staged.transactions) % IMPORT_BATCH_SIZE == 0:
+                        self.import_progress = f"{self.t['import_progress']}: {len(staged.transactions)}"
+                        yield
+                if not chunk:
+                    break
+            if reader.sections_seen != set(BACKUP_SECTIONS):
+                yield rx.toast(self.t["toast_invalid_backup"], duration=3000)
+                return
+            accounts, transactions = staged.finish()
+        except Exception as e:
+            logging.exception(f"Error importing data: {e}")
+            yield rx.toast(f"{self.t['toast_import_error']}: {e}", duration=5000)
+            return
+        finally:
+            self.import_progress = ""
+        # Accounts arrive at their opening balances; post the entries on top.
+        self._accounts, self._transactions = accounts, transactions
+        self._rebuild_indexes()
+        net_by_slot = self._entry_store.net_by_slot(len(self._account_index))
+        self._apply_net_to_balances(dict(enumerate(net_by_slot)))
+        self._persist_snapshot()
+        self.show_settings = False
+        yield [
+            *self._storage_events(),
+            rx.toast(self.t["toast_import_success"], duration=3000),
+        ]
+
+    @rx.event
+    def clear_all_data(self):
+        self._accounts = []
+        self._transactions = []
+        self._rebuild_indexes()
+        self._persist_snapshot()
+        self.show_settings = False
+        return [
+            *self._storage_events(),
+            rx.toast(self.t["toast_data_cleared"], duration=3000),
+        ]
+
+    @rx.event
+    def normalize_data(self):
+        """Coerce legacy transaction shapes to the expected schema and persist."""
+        try:
+            normalized: list[Transaction] = []
+            for txn in self._transactions or []:
+                if txn is None:
+                    continue
+                # Basic fields
+                txn_id = str(txn.get("id") or uuid.uuid4())
+                # Coerce date to ISO yyyy-mm-dd if possible
+                raw_date = txn.get("date") or txn.get("created_at") or datetime.date.today().isoformat()
+                try:
+                    # Accept already-ISO or parseable dates
+                    date_iso = str(raw_date)
+                    if len(date_iso) >= 10 and date_iso[4] == '-' and date_iso[7] == '-':
+                        pass
+                    else:
+                        date_iso = datetime.date.fromisoformat(str(raw_date)).isoformat()
+                except Exception:
+                    date_iso = datetime.date.today().isoformat()
+                description = str(txn.get("description") or txn.get("memo") or "")
+
+                # Legacy "lines"/"account" shapes were mapped onto entries (in
+                # cents) by transaction_to_cents when the ledger was loaded.
+                entries = txn.get("entries") or []
+                fixed_entries: list[Entry] = []
+                for e in entries:
+                    account_id = str(e.get("account_id") or "")
+                    # Coerce debit/credit to non-negative cents
+                    debit = abs(int(e.get("debit") or 0))
+                    credit = abs(int(e.get("credit") or 0))
+                    # If both present, keep the larger and zero the other
+                    if debit > 0 and credit > 0:
+                        if debit >= credit:
+                            credit = 0
+                        else:
+                            debit = 0
+                    fixed_entries.append({
+                        "account_id": account_id,
+                        "debit": debit,
+                        "credit": credit,
+                    })
+
+                normalized.append({
+                    "id": txn_id,
+                    "date": date_iso,
+                    "description": description,
+                    "entries": fixed_entries,
+                })
+
+            self._transactions = normalized
+            # Keep accounts list persisted and sorted
+            try:
+                self._accounts = sorted(self._accounts, key=lambda acc: acc["code"]) if self._accounts else []
+            except Exception:
+                pass
+            self._rebuild_indexes()
+            self._persist_snapshot()
+            return [*self._storage_events(), rx.toast("Data normalized.", duration=3000)]
+        except Exception as e:
+            logging.exception(f"Error normalizing data: {e}")
+            return rx.toast(f"Normalize failed: {e}", duration=5000)
+
+    @rx.event
+    def recompute_balances_from_transactions(self):
+        """Re-derive all account balances strictly from transactions."""
+        try:
+            # Accumulate every entry by account slot
+            net_by_slot = self._entry_store.net_by_slot(len(self._account_index))
+
+            # Write back balances
+            updated_accounts: list[Account] = []
+            for acc in self._accounts:
+                net = net_by_slot[self._account_index.intern(acc["id"])]
+                updated = dict(acc)
+                updated["balance"] = net if acc["type"] in ["Asset", "Expense"] else -net
+                updated_accounts.append(updated)
+            self._accounts = updated_accounts
+            self.ledger_version += 1
+            self._write_local_snapshot()
+            if (store := get_ledger_store()) is not None:
+                store.recompute_balances()
+            return [
+                *self._storage_events(),
+                rx.toast("Balances recomputed from transactions.", duration=3000),
+            ]
+        except Exception as e:
+            logging.exception(f"Error recomputing balances: {e}")
+            return rx.toast(f"Recompute failed: {e}", duration=5000)
+
+    def _chart_snapshot(self) -> AccountIndex:
+        """A detached copy of the account index, for the form states to validate against."""
+        chart = AccountIndex()
+        chart.sync(_unproxied(self._accounts))
+        return chart
+
+    def _rows_of(self, transaction_ids: Iterable[str]) -> list[int]:
+        """Rows of ``transaction_ids``; ids this session has not loaded are skipped."""
+        row_by_id = _unproxied(self._row_by_id)
+        return [row for row in map(row_by_id.get, transaction_ids) if row is not None]
+
+    def _row_sort_key(self, row: int) -> tuple[str, int]:
+        """Transaction list order: by date, same-day rows in posting order (newest last)."""
+        return self._transactions[row]["date"], -row
+
+    def _row_plan(self, params: tuple) -> RowPlan:
+        """Candidate rows for the filter ``params``, planned by index selectivity.
+
+        ``params`` are the values of ``FILTER_FIELDS``. The most selective
+        filter (smallest estimate, earliest on ties) supplies the candidates;
+        the others are tested per row, most selective first. Estimates come
+        from the in-memory indexes; with the SQLite store, date, account and
+        amount candidates are fetched with an indexed query on it.
+        """
+        start, end, description, account_id, min_text, max_text = params
+        transactions = self._transactions
+        store = get_ledger_store()
+        min_amount = to_cents(min_text)
+        max_amount = to_cents(max_text) if max_text else float("inf")
+        # The date filter is always present: with open bounds it is the full
+        # scan, and its candidates already come out newest first.
+        date_filter = RowFilter(
+            self._date_index.count_between(start, end),
+            (lambda: self._rows_of(store.transaction_ids_between(start, end)))
+            if store is not None
+            else (lambda: self._date_index.rows_between(start, end)),
+            lambda row: (not start or transactions[row]["date"] >= start)
+            and (not end or transactions[row]["date"] <= end),
+        )
+        filters = [date_filter]
+        if account_id:
+            slot = self._account_index.slot(account_id)
+            slot_rows = self._balance_index.slot_rows(slot) if slot is not None else []
+            filters.append(RowFilter(
+                len(slot_rows),
+                (lambda: self._rows_of(store.account_transaction_ids(account_id)))
+                if store is not None
+                else (lambda: slot_rows),
+                lambda row: any(e["account_id"] == account_id for e in transactions[row]["entries"]),
+            ))
+        if description:
+            needle = description.lower()
+            candidates = self._description_index.candidates(needle)
+            filters.append(RowFilter(
+                len(candidates) if candidates is not None else len(transactions),
+                lambda: [
+                    row
+                    for row in (candidates if candidates is not None else range(len(transactions)))
+                    if self._description_index.matches(row, needle)
+                ],
+                lambda row: self._description_index.matches(row, needle),
+            ))
+        if min_amount > 0 or max_amount < float("inf"):
+            totals = self._amount_index.totals
+            filters.append(RowFilter(
+                self._amount_index.count_between(min_amount, max_amount),
+                (lambda: self._rows_of(store.transaction_ids_by_amount(min_amount, max_amount)))
+                if store is not None
+                else (lambda: self._amount_index.rows_between(min_amount, max_amount)),
+                lambda row: min_amount <= totals[row] <= max_amount,
+            ))
+        driver, *rest = sorted(filters, key=lambda f: f.estimate)
+        if driver is date_filter and (store is None or not (start or end)):
+            # The date index is already in list order; no candidate is copied.
+            order: list[int] = self._date_index.rows
+            lo, hi = self._date_index.bounds(start, end)
+        else:
+            order = sorted(set(driver.candidates()), key=self._row_sort_key)
+            lo, hi = 0, len(order)
+        return RowPlan(order, lo, hi, lambda row: all(f.predicate(row) for f in rest))
+
+    def _filtered_count(self, params: tuple) -> int:
+        """Number of transactions matching the filter ``params``."""
+        def count() -> int:
+            plan = self._row_plan(params)
+            return sum(1 for position in range(plan.lo, plan.hi) if plan.predicate(plan.order[position]))
+
+        return self._memoized("filtered_count", params, count)
+
+    def _transaction_page(self, params: tuple, cursor: tuple) -> tuple[list[int], bool, bool]:
+        """Rows of a transaction list page, newest first, and whether newer/older pages exist.
+
+        ``cursor`` is ``(date, transaction id, newer)``: the page holds the
+        rows just older than that transaction, or just newer with ``newer``.
+        An empty cursor, or one whose transaction was since deleted, means
+        page one.
+        """
+        return self._memoized(
+            "transaction_page", (params, *cursor), lambda: self._build_transaction_page(params, cursor)
+        )
+
+    def _build_transaction_page(self, params: tuple, cursor: tuple) -> tuple[list[int], bool, bool]:
+        plan = self._row_plan(params)
+        key = self._row_sort_key
+        rows: list[int] = []
+        if cursor:
+            date, transaction_id, newer = cursor
+            row = self._row_by_id.get(transaction_id)
+            if row is not None and self._transactions[row]["date"] == date:
+                rows = keyset_page(plan, key, TRANSACTION_PAGE_SIZE, key(row), newer)
+                if newer and len(rows) < TRANSACTION_PAGE_SIZE:
+                    rows = []
+        if not rows:
+            rows = keyset_page(plan, key, TRANSACTION_PAGE_SIZE)
+        if not rows:
+            return [], False, False
+        has_newer = bool(keyset_page(plan, key, 1, key(rows[0]), newer=True))
+        has_older = bool(keyset_page(plan, key, 1, key(rows[-1])))
+        return rows, has_newer, has_older
+
+    # Dashboard computed properties
+    @rx.var
+    def recent_transactions(self) -> list[dict]:
+        """Returns list rows for the 10 most recent transactions."""
+        return self._memoized(
+            "recent_transactions",
+            (),
+            lambda: [self._transaction_row(row) for row in self._date_index.newest(10)],
+        )
+
+
+class FilterState(AppState):
+    """Transaction list filters, pagination and the expanded row.
+
+    A sibling of ``LedgerState`` rather than a substate, so editing a filter
+    only loads the ledger for the vars that read it.
+    """
+
+    filter_start_date: str = ""
+    filter_end_date: str = ""
+    filter_description: str = ""
+    filter_account_id: str = ""
+    filter_min_amount: str = ""
+    filter_max_amount: str = ""
+    # Keyset cursor of the transaction list: (filter params, date, id, newer),
+    # see LedgerState._transaction_page. A cursor for other filters means page one.
+    _page_cursor: tuple = ()
+    expanded_transaction_id: str = ""
+
     # Explicit setters for filter fields (to avoid deprecation warnings)
     @rx.event
     def set_filter_start_date(self, value: str):
         self.filter_start_date = value
-    
+
     @rx.event
     def set_filter_end_date(self, value: str):
         self.filter_end_date = value
-    
+
     @rx.event
     def set_filter_description(self, value: str):
         self.filter_description = value
-    
+
     @rx.event
     def set_filter_account_id(self, value: str):
         self.filter_account_id = value
-    
+
     @rx.event
     def set_filter_min_amount(self, value: float):
         # Store as string for consistent filtering and UI binding
@@ -153,7 +1039,7 @@ class AppState(rx.State):
                 self.filter_min_amount = "" if numeric == 0.0 else str(numeric)
         except (ValueError, TypeError):
             self.filter_min_amount = ""
-    
+
     @rx.event
     def set_filter_max_amount(self, value: float):
         # Store as string for consistent filtering and UI binding
@@ -165,41 +1051,145 @@ class AppState(rx.State):
                 self.filter_max_amount = "" if numeric == 0.0 else str(numeric)
         except (ValueError, TypeError):
             self.filter_max_amount = ""
-    
-    # Explicit setters for report fields
+
+    def _filter_params(self) -> tuple:
+        return tuple(getattr(self, field) for field in FILTER_FIELDS)
+
+    def _cursor(self) -> tuple:
+        """The page cursor without its filter params, or ``()`` if they are stale."""
+        if self._page_cursor and self._page_cursor[0] == self._filter_params():
+            return self._page_cursor[1:]
+        return ()
+
+    async def _page(self) -> tuple[LedgerState, list[int], bool, bool]:
+        ledger = await self.get_state(LedgerState)
+        return ledger, *ledger._transaction_page(self._filter_params(), self._cursor())
+
+    @rx.var(deps=[*FILTER_FIELDS, LedgerState.ledger_version], auto_deps=False)
+    async def filtered_transaction_count(self) -> int:
+        ledger = await self.get_state(LedgerState)
+        return ledger._filtered_count(self._filter_params())
+
+    @rx.var(deps=[*FILTER_FIELDS, LedgerState.ledger_version], auto_deps=False)
+    async def filtered_count_badge(self) -> str:
+        ledger = await self.get_state(LedgerState)
+        return f"{ledger._filtered_count(self._filter_params())}/{ledger.total_transaction_count}"
+
+    @rx.var(deps=[*FILTER_FIELDS, "_page_cursor", LedgerState.ledger_version], auto_deps=False)
+    async def transaction_page_rows(self) -> list[dict]:
+        """List rows of the current transaction page."""
+        ledger, rows, _, _ = await self._page()
+        return [ledger._transaction_row(row) for row in rows]
+
+    @rx.var(deps=[*FILTER_FIELDS, "_page_cursor", LedgerState.ledger_version], auto_deps=False)
+    async def has_previous_transaction_page(self) -> bool:
+        return (await self._page())[2]
+
+    @rx.var(deps=[*FILTER_FIELDS, "_page_cursor", LedgerState.ledger_version], auto_deps=False)
+    async def has_next_transaction_page(self) -> bool:
+        return (await self._page())[3]
+
+    def _set_page_cursor(self, ledger: LedgerState, row: int, newer: bool):
+        txn = ledger._transactions[row]
+        self._page_cursor = (self._filter_params(), txn["date"], txn["id"], newer)
+
     @rx.event
-    def set_report_date(self, value: str):
-        self.report_date = value
-    
+    async def next_transaction_page(self):
+        ledger, rows, _, has_older = await self._page()
+        if has_older:
+            self._set_page_cursor(ledger, rows[-1], newer=False)
+
     @rx.event
-    def set_report_start_date(self, value: str):
-        self.report_start_date = value
-    
+    async def previous_transaction_page(self):
+        ledger, rows, has_newer, _ = await self._page()
+        if has_newer:
+            self._set_page_cursor(ledger, rows[0], newer=True)
+
     @rx.event
-    def set_report_end_date(self, value: str):
-        self.report_end_date = value
-    
+    def set_date_filter_preset(self, preset: str):
+        today = datetime.date.today()
+        if preset == "today":
+            self.filter_start_date = today.isoformat()
+            self.filter_end_date = today.isoformat()
+        elif preset == "this_week":
+            start_of_week = today - datetime.timedelta(days=today.weekday())
+            self.filter_start_date = start_of_week.isoformat()
+            self.filter_end_date = (
+                start_of_week + datetime.timedelta(days=6)
+            ).isoformat()
+        elif preset == "this_month":
+            self.filter_start_date = today.replace(day=1).isoformat()
+            self.filter_end_date = today.isoformat()
+        elif preset == "this_year":
+            self.filter_start_date = today.replace(month=1, day=1).isoformat()
+            self.filter_end_date = today.isoformat()
+        else:
+            self.filter_start_date = ""
+            self.filter_end_date = ""
+
+    @rx.event
+    def reset_filters(self):
+        self.filter_start_date = ""
+        self.filter_end_date = ""
+        self.filter_description = ""
+        self.filter_account_id = ""
+        self.filter_min_amount = ""
+        self.filter_max_amount = ""
+
+    @rx.event
+    def toggle_expand_transaction(self, transaction_id: str):
+        if self.expanded_transaction_id == transaction_id:
+            self.expanded_transaction_id = ""
+        else:
+            self.expanded_transaction_id = transaction_id
+
+    @rx.var(deps=["expanded_transaction_id", LedgerState.ledger_version], auto_deps=False)
+    async def entries_for_expanded(self) -> list[Entry]:
+        if not self.expanded_transaction_id:
+            return []
+        ledger = await self.get_state(LedgerState)
+        row = ledger._row_by_id.get(self.expanded_transaction_id)
+        if row is None:
+            return []
+        return transaction_from_cents(ledger._transactions[row])["entries"]
+
+
+class AccountFormState(AppState):
+    """The new-account form.
+
+    A sibling of ``LedgerState``: keystrokes are validated against a copy
+    of the chart of accounts, so they never load the ledger. The copy is
+    taken again whenever ``LedgerState.accounts_version`` has moved since,
+    checked when the form opens and on submit.
+    """
+
+    new_account_name: str = ""
+    new_account_code: str = ""
+    new_account_type: AccountType = "Asset"
+    show_account_form: bool = False
+    account_types: list[AccountType] = [
+        "Asset",
+        "Liability",
+        "Equity",
+        "Revenue",
+        "Expense",
+    ]
+    _chart: AccountIndex = AccountIndex()
+    # ``LedgerState.accounts_version`` that ``_chart`` was copied at.
+    _chart_version: int = -1
+
     # Explicit setters for account form fields
     @rx.event
     def set_new_account_name(self, value: str):
         self.new_account_name = value
-    
+
     @rx.event
     def set_new_account_code(self, value: str):
         self.new_account_code = value
-    
+
     @rx.event
     def set_new_account_type(self, value: AccountType):
         self.new_account_type = value
-    
-    # Explicit setters for transaction form fields
-    @rx.event
-    def set_new_transaction_date(self, value: str):
-        self.new_transaction_date = value
-    
-    @rx.event
-    def set_new_transaction_description(self, value: str):
-        self.new_transaction_description = value
 
     @rx.var
     def account_name_error(self) -> str:
@@ -207,20 +1197,35 @@ class AppState(rx.State):
 
     @rx.var
     def account_code_error(self) -> str:
-        if not self.new_account_code.strip():
+        code = self.new_account_code.strip()
+        if not code:
             return self.t["error_code_empty"]
-        if any((acc["code"] == self.new_account_code for acc in self.accounts)):
+        if code in self._chart.codes:
             return self.t["error_code_exists"]
         return ""
 
+    @rx.var
+    def suggested_account_codes(self) -> list[str]:
+        """Next free codes in the numbering range of the selected account type."""
+        low, high = ACCOUNT_CODE_RANGES[self.new_account_type]
+        return self._chart.suggest_codes(low, high)
+
     @rx.var
     def is_account_form_valid(self) -> bool:
         return not self.account_name_error and (not self.account_code_error)
 
     @rx.event
-    def toggle_account_form(self):
+    async def toggle_account_form(self):
         self.show_account_form = not self.show_account_form
         self._reset_account_form()
+        if self.show_account_form:
+            self._sync_chart(await self.get_state(LedgerState))
+
+    def _sync_chart(self, ledger: LedgerState):
+        """Copy the ledger's chart if it changed since ``_chart`` was taken."""
+        if self._chart_version != ledger.accounts_version:
+            self._chart = ledger._chart_snapshot()
+            self._chart_version = ledger.accounts_version
 
     def _reset_account_form(self):
         self.new_account_name = ""
@@ -228,190 +1233,83 @@ class AppState(rx.State):
         self.new_account_type = "Asset"
 
     @rx.event
-    def set_active_tab(self, tab_name: Literal["accounts", "transactions", "reports", "dashboard"]):
-        self.active_tab = tab_name
-    
-    @rx.event
-    def set_active_report_tab(self, tab_name: Literal["trial_balance", "balance_sheet", "income_statement", "general_ledger"]):
-        self.active_report_tab = tab_name
-    
-    @rx.event
-    def set_general_ledger_account_id(self, account_id: str):
-        self.general_ledger_account_id = account_id
-
-    @rx.event
-    def create_account(self):
-        if self.is_account_form_valid:
-            new_account: Account = {
-                "id": str(uuid.uuid4()),
-                "name": self.new_account_name.strip(),
-                "code": self.new_account_code.strip(),
-                "type": self.new_account_type,
-                "balance": 0.0,
-            }
-            self.accounts.append(new_account)
-            self.accounts = sorted(self.accounts, key=lambda acc: acc["code"])
-            self.accounts_json = json.dumps(self.accounts)
-            self.show_account_form = False
-            self._reset_account_form()
-            return rx.toast(self.t["toast_account_created"], duration=3000)
-
-    @rx.var
-    def filtered_transactions(self) -> list[Transaction]:
-        """Filters transactions based on the current filter state."""
-        transactions_to_filter = self.transactions
-        if self.filter_start_date:
-            transactions_to_filter = [
-                t for t in transactions_to_filter if t["date"] >= self.filter_start_date
-            ]
-        if self.filter_end_date:
-            transactions_to_filter = [
-                t for t in transactions_to_filter if t["date"] <= self.filter_end_date
-            ]
-        if self.filter_description:
-            transactions_to_filter = [
-                t
-                for t in transactions_to_filter
-                if self.filter_description.lower() in t["description"].lower()
-            ]
-        if self.filter_account_id:
-            transactions_to_filter = [
-                t
-                for t in transactions_to_filter
-                if any(
-                    (e["account_id"] == self.filter_account_id for e in t["entries"])
-                )
-            ]
-        min_amount = float(self.filter_min_amount) if self.filter_min_amount else 0.0
-        max_amount = (
-            float(self.filter_max_amount) if self.filter_max_amount else float("inf")
-        )
-        if min_amount > 0 or max_amount < float("inf"):
-            transactions_to_filter = [
-                t
-                for t in transactions_to_filter
-                if min_amount <= sum((e["debit"] for e in t["entries"])) <= max_amount
-            ]
-        return sorted(transactions_to_filter, key=lambda t: t["date"], reverse=True)
-
-    @rx.var
-    def filtered_transaction_count(self) -> int:
-        return len(self.filtered_transactions)
-
-    @rx.var
-    def total_transaction_count(self) -> int:
-        return len(self.transactions)
-
-    @rx.var
-    def filtered_count_badge(self) -> str:
-        return f"{self.filtered_transaction_count}/{self.total_transaction_count}"
-
-    @rx.var
-    def filtered_transactions_rows(self) -> list[dict]:
-        rows: list[dict] = []
-        for t in self.filtered_transactions:
-            total = sum(float(e.get("debit", 0.0) or 0.0) for e in t.get("entries", []))
-            rows.append({
-                "id": t["id"],
-                "date": t["date"],
-                "description": t["description"],
-                "entries": t["entries"],
-                "total": round(total, 2),
-            })
-        return rows
-
-    @rx.event
-    def set_date_filter_preset(self, preset: str):
-        today = datetime.date.today()
-        if preset == "today":
-            self.filter_start_date = today.isoformat()
-            self.filter_end_date = today.isoformat()
-        elif preset == "this_week":
-            start_of_week = today - datetime.timedelta(days=today.weekday())
-            self.filter_start_date = start_of_week.isoformat()
-            self.filter_end_date = (
-                start_of_week + datetime.timedelta(days=6)
-            ).isoformat()
-        elif preset == "this_month":
-            self.filter_start_date = today.replace(day=1).isoformat()
-            self.filter_end_date = today.isoformat()
-        elif preset == "this_year":
-            self.filter_start_date = today.replace(month=1, day=1).isoformat()
-            self.filter_end_date = today.isoformat()
-        else:
-            self.filter_start_date = ""
-            self.filter_end_date = ""
+    async def create_account(self):
+        ledger = await self.get_state(LedgerState)
+        self._sync_chart(ledger)
+        if self.is_account_form_valid:
+            ledger._add_account({
+                "id": str(uuid.uuid4()),
+                "name": self.new_account_name.strip(),
+                "code": self.new_account_code.strip(),
+                "type": self.new_account_type,
+                "balance": 0,
+            })
+            self.show_account_form = False
+            self._reset_account_form()
+            return [
+                *ledger._storage_events(),
+                rx.toast(self.t["toast_account_created"], duration=3000),
+            ]
+
+
+class TransactionFormState(AppState):
+    """The transaction form, for new and edited transactions.
+
+    Like ``AccountFormState``, a sibling of ``LedgerState`` that validates
+    keystrokes against a copy of the chart, taken again when the form opens,
+    on submit and when an entry names an account the copy lacks, if
+    ``LedgerState.accounts_version`` has moved. The submit handlers also
+    validate against the ledger.
+    """
+
+    new_transaction_date: str = datetime.date.today().isoformat()
+    new_transaction_description: str = ""
+    new_transaction_entries: list[dict[str, str | float]] = [
+        {"account_id": "", "debit": 0.0, "credit": 0.0},
+        {"account_id": "", "debit": 0.0, "credit": 0.0},
+    ]
+    show_transaction_form: bool = False
+    # Id of the transaction loaded into the form for editing; empty for a new one.
+    editing_transaction_id: str = ""
+    _chart: AccountIndex = AccountIndex()
+    # ``LedgerState.accounts_version`` that ``_chart`` was copied at.
+    _chart_version: int = -1
 
+    # Explicit setters for transaction form fields
     @rx.event
-    def reset_filters(self):
-        self.filter_start_date = ""
-        self.filter_end_date = ""
-        self.filter_description = ""
-        self.filter_account_id = ""
-        self.filter_min_amount = ""
-        self.filter_max_amount = ""
+    def set_new_transaction_date(self, value: str):
+        self.new_transaction_date = value
 
     @rx.event
-    def toggle_expand_transaction(self, transaction_id: str):
-        if self.expanded_transaction_id == transaction_id:
-            self.expanded_transaction_id = ""
-        else:
-            self.expanded_transaction_id = transaction_id
+    def set_new_transaction_description(self, value: str):
+        self.new_transaction_description = value
 
     @rx.var
-    def entries_for_expanded(self) -> list[Entry]:
-        if not self.expanded_transaction_id:
-            return []
-        txn = next((t for t in self.transactions if t["id"] == self.expanded_transaction_id), None)
-        if not txn:
-            return []
-        # Ensure types are normalized
-        fixed: list[Entry] = []
-        for e in txn.get("entries", []):
-            try:
-                debit = float(e.get("debit", 0.0) or 0.0)
-            except Exception:
-                debit = 0.0
-            try:
-                credit = float(e.get("credit", 0.0) or 0.0)
-            except Exception:
-                credit = 0.0
-            fixed.append({
-                "account_id": str(e.get("account_id", "")),
-                "debit": debit,
-                "credit": credit,
-            })
-        return fixed
+    def total_debits_cents(self) -> int:
+        return sum(to_cents(entry.get("debit")) for entry in self.new_transaction_entries)
 
     @rx.var
-    def get_account_map(self) -> dict[str, Account]:
-        return {acc["id"]: acc for acc in self.accounts}
+    def total_credits_cents(self) -> int:
+        return sum(to_cents(entry.get("credit")) for entry in self.new_transaction_entries)
 
     @rx.var
     def total_debits(self) -> float:
-        return sum(
-            (
-                float(entry.get("debit", 0.0) or 0.0)
-                for entry in self.new_transaction_entries
-            )
-        )
+        return from_cents(self.total_debits_cents)
 
     @rx.var
     def total_credits(self) -> float:
-        return sum(
-            (
-                float(entry.get("credit", 0.0) or 0.0)
-                for entry in self.new_transaction_entries
-            )
-        )
+        return from_cents(self.total_credits_cents)
 
     @rx.var
     def transaction_balance(self) -> float:
-        return self.total_debits - self.total_credits
+        return from_cents(self.total_debits_cents - self.total_credits_cents)
 
     @rx.var
     def is_transaction_balanced(self) -> bool:
-        return self.transaction_balance == 0 and self.total_debits > 0
+        return (
+            self.total_debits_cents == self.total_credits_cents
+            and self.total_debits_cents > 0
+        )
 
     @rx.var
     def is_transaction_form_valid(self) -> bool:
@@ -421,24 +1319,28 @@ class AppState(rx.State):
         ):
             return False
         for entry in self.new_transaction_entries:
-            if not entry["account_id"]:
+            if self._chart.position(cast(str, entry["account_id"])) < 0:
                 return False
-            if (
-                float(entry.get("debit", 0.0) or 0.0) < 0
-                or float(entry.get("credit", 0.0) or 0.0) < 0
-            ):
+            debit = to_cents(entry.get("debit"))
+            credit = to_cents(entry.get("credit"))
+            if debit < 0 or credit < 0:
                 return False
-            if (
-                float(entry.get("debit", 0.0) or 0.0) > 0
-                and float(entry.get("credit", 0.0) or 0.0) > 0
-            ):
+            if debit > 0 and credit > 0:
                 return False
         return True
 
     @rx.event
-    def toggle_transaction_form(self):
+    async def toggle_transaction_form(self):
         self.show_transaction_form = not self.show_transaction_form
         self._reset_transaction_form()
+        if self.show_transaction_form:
+            self._sync_chart(await self.get_state(LedgerState))
+
+    def _sync_chart(self, ledger: LedgerState):
+        """Copy the ledger's chart if it changed since ``_chart`` was taken."""
+        if self._chart_version != ledger.accounts_version:
+            self._chart = ledger._chart_snapshot()
+            self._chart_version = ledger.accounts_version
 
     def _reset_transaction_form(self):
         self.new_transaction_date = datetime.date.today().isoformat()
@@ -447,6 +1349,7 @@ class AppState(rx.State):
             {"account_id": "", "debit": 0.0, "credit": 0.0},
             {"account_id": "", "debit": 0.0, "credit": 0.0},
         ]
+        self.editing_transaction_id = ""
 
     @rx.event
     def add_entry_row(self):
@@ -460,8 +1363,11 @@ class AppState(rx.State):
             self.new_transaction_entries.pop(index)
 
     @rx.event
-    def update_entry(self, index: int, field: str, value: str):
+    async def update_entry(self, index: int, field: str, value: str):
         entry = self.new_transaction_entries[index]
+        if field == "account_id" and value and self._chart.position(value) < 0:
+            # An account added since the chart was copied.
+            self._sync_chart(await self.get_state(LedgerState))
         if field in ["debit", "credit"]:
             try:
                 entry[field] = float(value)
@@ -476,439 +1382,495 @@ class AppState(rx.State):
             entry[field] = value
 
     @rx.event
-    def create_transaction(self):
+    async def create_transaction(self):
+        ledger = await self.get_state(LedgerState)
+        self._sync_chart(ledger)
         if self.is_transaction_form_valid:
-            valid_entries = [
-                e
-                for e in self.new_transaction_entries
-                if float(e.get("debit", 0) or 0) > 0
-                or float(e.get("credit", 0) or 0) > 0
-            ]
-            new_transaction: Transaction = {
-                "id": str(uuid.uuid4()),
-                "date": self.new_transaction_date,
-                "description": self.new_transaction_description.strip(),
-                "entries": [
-                    {
-                        "account_id": cast(str, entry["account_id"]),
-                        "debit": float(entry.get("debit", 0.0) or 0.0),
-                        "credit": float(entry.get("credit", 0.0) or 0.0),
-                    }
-                    for entry in valid_entries
-                ],
-            }
-            self.transactions.append(new_transaction)
-            self.transactions_json = json.dumps(self.transactions)
-            for entry in new_transaction["entries"]:
-                for i, acc in enumerate(self.accounts):
-                    if acc["id"] == entry["account_id"]:
-                        if acc["type"] in ["Asset", "Expense"]:
-                            self.accounts[i]["balance"] += (
-                                entry["debit"] - entry["credit"]
-                            )
-                        else:
-                            self.accounts[i]["balance"] += (
-                                entry["credit"] - entry["debit"]
-                            )
-                        break
-            self.accounts_json = json.dumps(self.accounts)
+            txn = self._transaction_from_form(str(uuid.uuid4()))
+            error = ledger._transaction_error(txn, set())
+            if error:
+                return rx.toast(error, duration=5000)
+            ledger._post_batch([txn])
             self.show_transaction_form = False
             self._reset_transaction_form()
-            return rx.toast(self.t["toast_transaction_created"], duration=3000)
+            return [
+                *ledger._storage_events(),
+                rx.toast(self.t["toast_transaction_created"], duration=3000),
+            ]
+
+    def _transaction_from_form(self, transaction_id: str) -> Transaction:
+        entries: list[Entry] = [
+            {
+                "account_id": cast(str, e["account_id"]),
+                "debit": to_cents(e.get("debit")),
+                "credit": to_cents(e.get("credit")),
+            }
+            for e in self.new_transaction_entries
+        ]
+        return {
+            "id": transaction_id,
+            "date": self.new_transaction_date,
+            "description": self.new_transaction_description.strip(),
+            "entries": [e for e in entries if e["debit"] > 0 or e["credit"] > 0],
+        }
 
     @rx.event
-    def load_from_storage(self):
-        try:
-            self.accounts = json.loads(self.accounts_json)
-        except json.JSONDecodeError as e:
-            logging.exception(f"Error decoding accounts_json: {e}")
-            self.accounts = []
-        try:
-            self.transactions = json.loads(self.transactions_json)
-        except json.JSONDecodeError as e:
-            logging.exception(f"Error decoding transactions_json: {e}")
-            self.transactions = []
-        self.accounts = sorted(self.accounts, key=lambda acc: acc["code"])
-        # Default preset to All Time on first load if there are transactions and no date filter
-        if self.transactions and not (self.filter_start_date or self.filter_end_date):
-            self.set_date_filter_preset("all")
+    async def start_edit_transaction(self, transaction_id: str):
+        """Load a posted transaction into the form for editing."""
+        ledger = await self.get_state(LedgerState)
+        row = ledger._row_by_id.get(transaction_id)
+        if row is None:
+            return
+        txn = transaction_from_cents(ledger._transactions[row])
+        self._sync_chart(ledger)
+        self.new_transaction_date = txn["date"]
+        self.new_transaction_description = txn["description"]
+        self.new_transaction_entries = [dict(e) for e in txn["entries"]]
+        while len(self.new_transaction_entries) < 2:
+            self.new_transaction_entries.append({"account_id": "", "debit": 0.0, "credit": 0.0})
+        self.editing_transaction_id = transaction_id
+        self.show_transaction_form = True
 
     @rx.event
-    def export_data(self) -> rx.event.EventSpec:
-        data_to_export = {"accounts": self.accounts, "transactions": self.transactions}
-        return rx.download(
-            data=json.dumps(data_to_export, indent=2),
-            filename=f"accounting_backup_{datetime.date.today().isoformat()}.json",
-        )
+    async def update_transaction(self):
+        """Replace the transaction being edited with the form contents."""
+        ledger = await self.get_state(LedgerState)
+        self._sync_chart(ledger)
+        row = ledger._row_by_id.get(self.editing_transaction_id)
+        if row is None or not self.is_transaction_form_valid:
+            return
+        txn = self._transaction_from_form(self.editing_transaction_id)
+        error = transaction_error(txn, ledger._account_index, set())
+        if error:
+            return rx.toast(error, duration=5000)
+        ledger._replace_transaction(row, txn)
+        self.show_transaction_form = False
+        self._reset_transaction_form()
+        return [
+            *ledger._storage_events(),
+            rx.toast(self.t["toast_transaction_updated"], duration=3000),
+        ]
+
+
+class ReportState(LedgerState):
+    """Report parameters and the report and dashboard figures."""
+
+    # Report-related state
+    active_report_tab: Literal["trial_balance", "balance_sheet", "income_statement", "general_ledger"] = "trial_balance"
+    report_date: str = datetime.date.today().isoformat()
+    report_start_date: str = datetime.date.today().replace(day=1).isoformat()
+    report_end_date: str = datetime.date.today().isoformat()
+    general_ledger_account_id: str = ""
+    # Keyset cursor of the General Ledger: (account id, date, transaction id,
+    # entry offset, newer), see _general_ledger_page. A cursor for another
+    # account means the latest page.
+    _general_ledger_cursor: tuple = ()
 
+    # Explicit setters for report fields
     @rx.event
-    async def import_data(self, files: list[rx.UploadFile]):
-        if not files:
-            return rx.toast(self.t["toast_no_file"], duration=3000)
-        try:
-            file_content = await files[0].read()
-            data = json.loads(file_content)
-            if "accounts" in data and "transactions" in data:
-                self.accounts = data["accounts"]
-                self.transactions = data["transactions"]
-                self.accounts_json = json.dumps(self.accounts)
-                self.transactions_json = json.dumps(self.transactions)
-                self.accounts = sorted(self.accounts, key=lambda acc: acc["code"])
-                self.show_settings = False
-                return rx.toast(self.t["toast_import_success"], duration=3000)
-            return rx.toast(self.t["toast_invalid_backup"], duration=3000)
-        except Exception as e:
-            logging.exception(f"Error importing data: {e}")
-            return rx.toast(f"{self.t['toast_import_error']}: {e}", duration=5000)
+    def set_report_date(self, value: str):
+        self.report_date = value
 
     @rx.event
-    def clear_all_data(self):
-        self.accounts = []
-        self.transactions = []
-        self.accounts_json = "[]"
-        self.transactions_json = "[]"
-        self.show_settings = False
-        return rx.toast(self.t["toast_data_cleared"], duration=3000)
-    
+    def set_report_start_date(self, value: str):
+        self.report_start_date = value
+
     @rx.event
-    def normalize_data(self):
-        """Coerce legacy transaction shapes to the expected schema and persist."""
-        try:
-            # Ensure in-memory data is up to date with storage
-            try:
-                self.accounts = json.loads(self.accounts_json)
-            except Exception:
-                pass
-            try:
-                self.transactions = json.loads(self.transactions_json)
-            except Exception:
-                pass
+    def set_report_end_date(self, value: str):
+        self.report_end_date = value
 
-            normalized: list[Transaction] = []
-            for txn in self.transactions or []:
-                # Basic fields
-                txn_id = str(txn.get("id") or uuid.uuid4())
-                # Coerce date to ISO yyyy-mm-dd if possible
-                raw_date = txn.get("date") or txn.get("created_at") or datetime.date.today().isoformat()
-                try:
-                    # Accept already-ISO or parseable dates
-                    date_iso = str(raw_date)
-                    if len(date_iso) >= 10 and date_iso[4] == '-' and date_iso[7] == '-':
-                        pass
-                    else:
-                        date_iso = datetime.date.fromisoformat(str(raw_date)).isoformat()
-                except Exception:
-                    date_iso = datetime.date.today().isoformat()
-                description = str(txn.get("description") or txn.get("memo") or "")
+    @rx.event
+    def set_active_report_tab(self, tab_name: Literal["trial_balance", "balance_sheet", "income_statement", "general_ledger"]):
+        self.active_report_tab = tab_name
 
-                entries = txn.get("entries") or txn.get("lines") or []
-                fixed_entries: list[Entry] = []
-                for e in entries:
-                    account_id = str(e.get("account_id") or e.get("account") or "")
-                    # Coerce debit/credit to non-negative floats
-                    def to_amount(x: Any) -> float:
-                        try:
-                            if x in (None, ""):
-                                return 0.0
-                            return float(x)
-                        except Exception:
-                            return 0.0
-
-                    debit = abs(to_amount(e.get("debit")))
-                    credit = abs(to_amount(e.get("credit")))
-                    # If both present, keep the larger and zero the other
-                    if debit > 0 and credit > 0:
-                        if debit >= credit:
-                            credit = 0.0
-                        else:
-                            debit = 0.0
-                    fixed_entries.append({
-                        "account_id": account_id,
-                        "debit": debit,
-                        "credit": credit,
-                    })
+    @rx.event
+    def set_general_ledger_account_id(self, account_id: str):
+        self.general_ledger_account_id = account_id
+        self._general_ledger_cursor = ()
 
-                normalized.append({
-                    "id": txn_id,
-                    "date": date_iso,
-                    "description": description,
-                    "entries": fixed_entries,
-                })
+    # Report computed properties
+    def _period_net_by_slot(self, start_date: str, end_date: str) -> dict[int, int]:
+        """Per-slot ``debit - credit`` cents posted between the two dates, inclusive.
 
-            self.transactions = normalized
-            self.transactions_json = json.dumps(self.transactions)
-            # Keep accounts list persisted and sorted
-            try:
-                self.accounts = sorted(self.accounts, key=lambda acc: acc["code"]) if self.accounts else []
-                self.accounts_json = json.dumps(self.accounts)
-            except Exception:
-                pass
-            return rx.toast("Data normalized.", duration=3000)
-        except Exception as e:
-            logging.exception(f"Error normalizing data: {e}")
-            return rx.toast(f"Normalize failed: {e}", duration=5000)
-    
-    @rx.event
-    def recompute_balances_from_transactions(self):
-        """Re-derive all account balances strictly from transactions."""
-        try:
-            # Ensure in-memory mirrors persisted data
-            try:
-                self.accounts = json.loads(self.accounts_json)
-            except Exception:
-                pass
-            try:
-                self.transactions = json.loads(self.transactions_json)
-            except Exception:
-                pass
+        Months wholly inside the period come from the monthly rollup; only the
+        partially covered edge months are scanned transaction by transaction,
+        or with the SQLite store, summed by an indexed date-range query.
+        """
+        store = get_ledger_store()
+        totals: dict[int, int] = {}
+        for month in months_in_range(self._monthly_rollup.months(), start_date, end_date):
+            first, last = f"{month}-01", month_end(month)
+            if (not start_date or start_date <= first) and (not end_date or end_date >= last):
+                for slot, net in self._monthly_rollup.month_totals(month).items():
+                    totals[slot] = totals.get(slot, 0) + net
+                continue
+            if store is not None:
+                lo = max(start_date, first)
+                hi = min(end_date, last) if end_date else last
+                for account_id, net in store.net_between(lo, hi).items():
+                    slot = self._account_index.intern(account_id)
+                    totals[slot] = totals.get(slot, 0) + net
+                continue
+            for txn in self._month_shards.get(month, {}).values():
+                if (start_date and txn["date"] < start_date) or (end_date and txn["date"] > end_date):
+                    continue
+                for entry in txn["entries"]:
+                    slot = self._account_index.intern(entry["account_id"])
+                    totals[slot] = totals.get(slot, 0) + entry["debit"] - entry["credit"]
+        return totals
 
-            # Initialize per-account balances
-            account_type_by_id: dict[str, str] = {acc["id"]: acc["type"] for acc in self.accounts}
-            new_balance_by_id: dict[str, float] = {acc_id: 0.0 for acc_id in account_type_by_id.keys()}
+    def _report_summary(self) -> ReportSummary:
+        """All report lists, totals and counts, built in one pass over the accounts.
 
-            # Accumulate from every transaction entry
-            for txn in self.transactions or []:
-                for e in txn.get("entries", []):
-                    acc_id = str(e.get("account_id") or "")
-                    if not acc_id or acc_id not in new_balance_by_id:
-                        # Skip entries that reference unknown accounts
-                        continue
-                    try:
-                        debit = float(e.get("debit", 0.0) or 0.0)
-                    except Exception:
-                        debit = 0.0
-                    try:
-                        credit = float(e.get("credit", 0.0) or 0.0)
-                    except Exception:
-                        credit = 0.0
-                    acc_type = account_type_by_id.get(acc_id, "Asset")
-                    if acc_type in ["Asset", "Expense"]:
-                        delta = debit - credit
-                    else:
-                        delta = credit - debit
-                    new_balance_by_id[acc_id] += delta
+        The result is memoized on ``ledger_version`` (not ``accounts_version``:
+        balances move with every posting) and the report dates, so the report
+        vars below are plain lookups.
+        """
+        return self._memoized(
+            "report_summary",
+            (self.report_date, self.report_start_date, self.report_end_date),
+            self._build_report_summary,
+        )
 
-            # Write back rounded balances
-            updated_accounts: list[Account] = []
-            for acc in self.accounts:
-                updated = dict(acc)
-                updated["balance"] = round(new_balance_by_id.get(acc["id"], 0.0), 2)
-                updated_accounts.append(updated)
-            self.accounts = updated_accounts
-            self.accounts_json = json.dumps(self.accounts)
-            return rx.toast("Balances recomputed from transactions.", duration=3000)
-        except Exception as e:
-            logging.exception(f"Error recomputing balances: {e}")
-            return rx.toast(f"Recompute failed: {e}", duration=5000)
-        
-    # Report computed properties
-    @rx.var
-    def trial_balance_data(self) -> list[dict]:
-        """Returns trial balance data with debit/credit columns."""
-        result = []
-        for acc in self.accounts:
+    def _build_report_summary(self) -> ReportSummary:
+        # Balances as of ``report_date`` back out the postings dated after it,
+        # so any opening balance carried by the account is kept.
+        as_of_ordinal = date_ordinal(self.report_date)
+        period_net = self._period_net_by_slot(self.report_start_date, self.report_end_date)
+        summary: ReportSummary = {
+            "as_of": {account_type: [] for account_type in ACCOUNT_CODE_RANGES},
+            "as_of_totals": dict.fromkeys(ACCOUNT_CODE_RANGES, 0),
+            "trial_balance": [],
+            "trial_debits": 0,
+            "trial_credits": 0,
+            "period": {"Revenue": [], "Expense": []},
+            "period_totals": {"Revenue": 0, "Expense": 0},
+            "counts": dict.fromkeys(ACCOUNT_CODE_RANGES, 0),
+        }
+        for acc in self._accounts:
+            account_type = acc["type"]
+            slot = self._account_index.intern(acc["id"])
+            sign = 1 if account_type in ["Asset", "Expense"] else -1
             balance = acc["balance"]
-            debit = balance if balance > 0 else 0.0
-            credit = abs(balance) if balance < 0 else 0.0
-            result.append({
+            if as_of_ordinal:
+                later = self._balance_index.net_total(slot) - self._balance_index.net_as_of(slot, as_of_ordinal)
+                balance -= sign * later
+            summary["counts"][account_type] += 1
+            summary["as_of"][account_type].append({**acc, "balance": balance})
+            summary["as_of_totals"][account_type] += balance
+            summary["trial_balance"].append({
                 "code": acc["code"],
                 "name": acc["name"],
-                "type": acc["type"],
-                "debit": debit,
-                "credit": credit,
+                "type": account_type,
+                "debit": from_cents(balance) if balance > 0 else 0.0,
+                "credit": from_cents(-balance) if balance < 0 else 0.0,
             })
-        return result
-    
-    @rx.var
+            if balance > 0:
+                summary["trial_debits"] += balance
+            else:
+                summary["trial_credits"] -= balance
+            if account_type in ["Revenue", "Expense"]:
+                activity = sign * period_net.get(slot, 0)
+                summary["period"][account_type].append({**acc, "balance": activity})
+                summary["period_totals"][account_type] += activity
+        return summary
+
+    @rx.var(deps=[LedgerState.ledger_version])
+    def trial_balance_data(self) -> list[dict]:
+        """Returns trial balance data with debit/credit columns as of ``report_date``."""
+        return self._report_summary()["trial_balance"]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def trial_balance_total_debits(self) -> float:
-        return sum(item["debit"] for item in self.trial_balance_data)
-    
-    @rx.var
+        return from_cents(self._report_summary()["trial_debits"])
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def trial_balance_total_credits(self) -> float:
-        return sum(item["credit"] for item in self.trial_balance_data)
-    
-    @rx.var
+        return from_cents(self._report_summary()["trial_credits"])
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def balance_sheet_assets(self) -> list[Account]:
-        return [acc for acc in self.accounts if acc["type"] == "Asset"]
-    
-    @rx.var
+        return [account_from_cents(acc) for acc in self._report_summary()["as_of"]["Asset"]]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def balance_sheet_liabilities(self) -> list[Account]:
-        return [acc for acc in self.accounts if acc["type"] == "Liability"]
-    
-    @rx.var
+        return [account_from_cents(acc) for acc in self._report_summary()["as_of"]["Liability"]]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def balance_sheet_equity(self) -> list[Account]:
-        return [acc for acc in self.accounts if acc["type"] == "Equity"]
-    
-    @rx.var
+        return [account_from_cents(acc) for acc in self._report_summary()["as_of"]["Equity"]]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def total_assets(self) -> float:
-        return sum(acc["balance"] for acc in self.balance_sheet_assets)
-    
-    @rx.var
+        return from_cents(self._report_summary()["as_of_totals"]["Asset"])
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def total_liabilities(self) -> float:
-        return abs(sum(acc["balance"] for acc in self.balance_sheet_liabilities))
-    
-    @rx.var
+        return from_cents(abs(self._report_summary()["as_of_totals"]["Liability"]))
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def total_equity(self) -> float:
-        return abs(sum(acc["balance"] for acc in self.balance_sheet_equity))
-    
-    @rx.var
+        return from_cents(abs(self._report_summary()["as_of_totals"]["Equity"]))
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def total_liabilities_equity(self) -> float:
-        return self.total_liabilities + self.total_equity
-    
-    @rx.var
+        totals = self._report_summary()["as_of_totals"]
+        return from_cents(abs(totals["Liability"]) + abs(totals["Equity"]))
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def income_statement_revenue(self) -> list[Account]:
-        return [acc for acc in self.accounts if acc["type"] == "Revenue"]
-    
-    @rx.var
+        return [account_from_cents(acc) for acc in self._report_summary()["period"]["Revenue"]]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def income_statement_expenses(self) -> list[Account]:
-        return [acc for acc in self.accounts if acc["type"] == "Expense"]
-    
-    @rx.var
+        return [account_from_cents(acc) for acc in self._report_summary()["period"]["Expense"]]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def total_revenue(self) -> float:
-        return abs(sum(acc["balance"] for acc in self.income_statement_revenue))
-    
-    @rx.var
+        return from_cents(abs(self._report_summary()["period_totals"]["Revenue"]))
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def total_expenses(self) -> float:
-        return sum(acc["balance"] for acc in self.income_statement_expenses)
-    
-    @rx.var
+        return from_cents(self._report_summary()["period_totals"]["Expense"])
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def net_income(self) -> float:
-        return self.total_revenue - self.total_expenses
-    
-    @rx.var
+        totals = self._report_summary()["period_totals"]
+        return from_cents(abs(totals["Revenue"]) - totals["Expense"])
+
+    def _general_ledger_page(self) -> tuple[list[int], bool, bool]:
+        """Balance-index positions of the General Ledger page, oldest first,
+        and whether earlier/later pages exist."""
+        account_id = self.general_ledger_account_id
+        cursor = self._general_ledger_cursor
+        cursor = cursor[1:] if cursor and cursor[0] == account_id else ()
+        return self._memoized(
+            "general_ledger_page",
+            (account_id, *cursor),
+            lambda: self._build_general_ledger_page(account_id, cursor),
+        )
+
+    def _build_general_ledger_page(self, account_id: str, cursor: tuple) -> tuple[list[int], bool, bool]:
+        # Pages walk the account's postings in the balance index with the
+        # transaction list's keyset paging. A posting's key is (date ordinal,
+        # row, position); the cursor names it by transaction id and its offset
+        # among that transaction's entries, which survive rows being renumbered.
+        slot = self._account_index.slot(account_id)
+        if slot is None or self._account_index.position(account_id) < 0:
+            return [], False, False
+        dates, rows = self._balance_index.dates_and_rows(slot)
+        plan = RowPlan(range(len(dates)), 0, len(dates), lambda position: True)
+
+        def key(position: int) -> tuple[int, int, int]:
+            return dates[position], rows[position], position
+
+        positions: list[int] = []
+        if cursor:
+            date, transaction_id, offset, newer = cursor
+            row = self._row_by_id.get(transaction_id)
+            # A cursor whose transaction was since deleted falls back to the latest page.
+            if row is not None and self._transactions[row]["date"] == date:
+                first = self._balance_index.first_position(slot, date_ordinal(date), row)
+                cursor_key = (date_ordinal(date), row, first + offset)
+                positions = keyset_page(plan, key, GENERAL_LEDGER_PAGE_SIZE, cursor_key, newer)
+                if newer and len(positions) < GENERAL_LEDGER_PAGE_SIZE:
+                    positions = []
+        if not positions:
+            positions = keyset_page(plan, key, GENERAL_LEDGER_PAGE_SIZE)
+        if not positions:
+            return [], False, False
+        positions.reverse()
+        return positions, positions[0] > 0, positions[-1] < len(dates) - 1
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def general_ledger_entries(self) -> list[dict]:
-        """Returns entries for the selected account with running balance."""
+        """One page of the selected account's entries, oldest first, with running balances."""
         if not self.general_ledger_account_id:
             return []
-        
-        entries = []
-        running_balance = 0.0
-        
-        # Get account type to determine balance calculation
-        account = next((acc for acc in self.accounts if acc["id"] == self.general_ledger_account_id), None)
-        if not account:
+        positions = self._general_ledger_page()[0]
+        return self._memoized(
+            "general_ledger_entries",
+            (self.general_ledger_account_id, *positions[:1], *positions[-1:]),
+            lambda: self._build_general_ledger_entries(positions),
+        )
+
+    @rx.var(deps=[LedgerState.ledger_version])
+    def has_earlier_general_ledger_page(self) -> bool:
+        return bool(self.general_ledger_account_id) and self._general_ledger_page()[1]
+
+    @rx.var(deps=[LedgerState.ledger_version])
+    def has_later_general_ledger_page(self) -> bool:
+        return bool(self.general_ledger_account_id) and self._general_ledger_page()[2]
+
+    def _build_general_ledger_entries(self, positions: list[int]) -> list[dict]:
+        position = self._account_index.position(self.general_ledger_account_id)
+        if position < 0:
             return []
-        
-        account_type = account["type"]
-        
-        # Collect all entries for this account
-        for txn in sorted(self.transactions, key=lambda t: t["date"]):
-            for entry in txn["entries"]:
-                if entry["account_id"] == self.general_ledger_account_id:
-                    # Calculate running balance based on account type
-                    if account_type in ["Asset", "Expense"]:
-                        running_balance += entry["debit"] - entry["credit"]
-                    else:
-                        running_balance += entry["credit"] - entry["debit"]
-                    
-                    entries.append({
-                        "date": txn["date"],
-                        "description": txn["description"],
-                        "debit": entry["debit"],
-                        "credit": entry["credit"],
-                        "running_balance": running_balance,
-                    })
-        
+        account = self._accounts[position]
+        slot = self._account_index.intern(account["id"])
+
+        # Running balances are kept as debit - credit; flip for credit-normal accounts
+        sign = 1 if account["type"] in ["Asset", "Expense"] else -1
+        entries = []
+        for row, debit, credit, cumulative in self._balance_index.postings_at(slot, positions):
+            txn = self._transactions[row]
+            entries.append({
+                "date": txn["date"],
+                "description": txn["description"],
+                "debit": from_cents(debit),
+                "credit": from_cents(credit),
+                "running_balance": from_cents(sign * cumulative),
+            })
+
         return entries
-    
+
+    def _set_general_ledger_cursor(self, position: int, newer: bool):
+        slot = self._account_index.intern(self.general_ledger_account_id)
+        dates, rows = self._balance_index.dates_and_rows(slot)
+        txn = self._transactions[rows[position]]
+        first = self._balance_index.first_position(slot, dates[position], rows[position])
+        self._general_ledger_cursor = (
+            self.general_ledger_account_id, txn["date"], txn["id"], position - first, newer
+        )
+
+    @rx.event
+    def earlier_general_ledger_page(self):
+        positions, has_earlier, _ = self._general_ledger_page()
+        if has_earlier:
+            self._set_general_ledger_cursor(positions[0], newer=False)
+
+    @rx.event
+    def later_general_ledger_page(self):
+        positions, _, has_later = self._general_ledger_page()
+        if has_later:
+            self._set_general_ledger_cursor(positions[-1], newer=True)
+
     @rx.event
     def export_report_csv(self) -> rx.event.EventSpec:
-        """Export current report as CSV."""
-        import csv
-        import io
-        
-        output = io.StringIO()
-        
+        """Export the current report as a CSV streamed from the export route."""
+        summary = self._report_summary()
         if self.active_report_tab == "trial_balance":
-            writer = csv.writer(output)
-            writer.writerow(["Code", "Account Name", "Debit", "Credit"])
-            for item in self.trial_balance_data:
-                writer.writerow([
-                    item["code"],
-                    item["name"],
-                    f"{item['debit']:.2f}" if item["debit"] > 0 else "",
-                    f"{item['credit']:.2f}" if item["credit"] > 0 else "",
-                ])
-            writer.writerow(["", "Total", f"{self.trial_balance_total_debits:.2f}", f"{self.trial_balance_total_credits:.2f}"])
             filename = f"trial_balance_{self.report_date}.csv"
-        
+            rows = self._trial_balance_csv(summary)
         elif self.active_report_tab == "balance_sheet":
-            writer = csv.writer(output)
-            writer.writerow(["Balance Sheet", f"As of {self.report_date}"])
-            writer.writerow([])
-            writer.writerow(["ASSETS"])
-            for acc in self.balance_sheet_assets:
-                writer.writerow([f"{acc['code']} - {acc['name']}", f"{acc['balance']:.2f}"])
-            writer.writerow(["Total Assets", f"{self.total_assets:.2f}"])
-            writer.writerow([])
-            writer.writerow(["LIABILITIES"])
-            for acc in self.balance_sheet_liabilities:
-                writer.writerow([f"{acc['code']} - {acc['name']}", f"{abs(acc['balance']):.2f}"])
-            writer.writerow(["Total Liabilities", f"{self.total_liabilities:.2f}"])
-            writer.writerow([])
-            writer.writerow(["EQUITY"])
-            for acc in self.balance_sheet_equity:
-                writer.writerow([f"{acc['code']} - {acc['name']}", f"{abs(acc['balance']):.2f}"])
-            writer.writerow(["Total Equity", f"{self.total_equity:.2f}"])
-            writer.writerow([])
-            writer.writerow(["Total Liabilities & Equity", f"{self.total_liabilities_equity:.2f}"])
             filename = f"balance_sheet_{self.report_date}.csv"
-        
+            rows = self._balance_sheet_csv(summary, self.report_date)
         elif self.active_report_tab == "income_statement":
-            writer = csv.writer(output)
-            writer.writerow(["Income Statement", f"{self.report_start_date} to {self.report_end_date}"])
-            writer.writerow([])
-            writer.writerow(["REVENUE"])
-            for acc in self.income_statement_revenue:
-                writer.writerow([f"{acc['code']} - {acc['name']}", f"{abs(acc['balance']):.2f}"])
-            writer.writerow(["Total Revenue", f"{self.total_revenue:.2f}"])
-            writer.writerow([])
-            writer.writerow(["EXPENSES"])
-            for acc in self.income_statement_expenses:
-                writer.writerow([f"{acc['code']} - {acc['name']}", f"{acc['balance']:.2f}"])
-            writer.writerow(["Total Expenses", f"{self.total_expenses:.2f}"])
-            writer.writerow([])
-            writer.writerow(["Net Income", f"{self.net_income:.2f}"])
             filename = f"income_statement_{self.report_start_date}_{self.report_end_date}.csv"
-        
+            rows = self._income_statement_csv(summary, self.report_start_date, self.report_end_date)
         else:  # general_ledger
-            writer = csv.writer(output)
-            writer.writerow(["Date", "Description", "Debit", "Credit", "Balance"])
-            for entry in self.general_ledger_entries:
-                writer.writerow([
-                    entry["date"],
-                    entry["description"],
-                    f"{entry['debit']:.2f}" if entry["debit"] > 0 else "",
-                    f"{entry['credit']:.2f}" if entry["credit"] > 0 else "",
-                    f"{entry['running_balance']:.2f}",
-                ])
             filename = f"general_ledger_{self.general_ledger_account_id}_{datetime.date.today().isoformat()}.csv"
-        
-        csv_data = output.getvalue()
-        return rx.download(data=csv_data, filename=filename)
-    
-    # Dashboard computed properties
-    @rx.var
-    def recent_transactions(self) -> list[Transaction]:
-        """Returns the 10 most recent transactions."""
-        return sorted(self.transactions, key=lambda t: t["date"], reverse=True)[:10]
-    
-    @rx.var
+            rows = self._general_ledger_csv(self.general_ledger_account_id)
+        path = register_export(filename, rows)
+        # The route is served by the backend, on another origin than the page;
+        # rx.download rejects a plain string that is not a root-relative path.
+        url = rx.Var.create(f"{rx.config.get_config().api_url}{path}")
+        return rx.download(url=url, filename=filename)
+
+    # CSV row generators. Their arguments are fixed when the export is
+    # requested; rows are produced only as the download is streamed.
+    @staticmethod
+    def _trial_balance_csv(summary: ReportSummary) -> Iterator[list]:
+        yield ["Code", "Account Name", "Debit", "Credit"]
+        for item in summary["trial_balance"]:
+            yield [
+                item["code"],
+                item["name"],
+                f"{item['debit']:.2f}" if item["debit"] > 0 else "",
+                f"{item['credit']:.2f}" if item["credit"] > 0 else "",
+            ]
+        yield [
+            "",
+            "Total",
+            f"{from_cents(summary['trial_debits']):.2f}",
+            f"{from_cents(summary['trial_credits']):.2f}",
+        ]
+
+    @staticmethod
+    def _balance_sheet_csv(summary: ReportSummary, report_date: str) -> Iterator[list]:
+        totals = summary["as_of_totals"]
+        yield ["Balance Sheet", f"As of {report_date}"]
+        # Assets are shown signed; liabilities and equity as magnitudes
+        for heading, account_type, label, shown in [
+            ("ASSETS", "Asset", "Total Assets", int),
+            ("LIABILITIES", "Liability", "Total Liabilities", abs),
+            ("EQUITY", "Equity", "Total Equity", abs),
+        ]:
+            yield []
+            yield [heading]
+            for acc in summary["as_of"][account_type]:
+                yield [f"{acc['code']} - {acc['name']}", f"{from_cents(shown(acc['balance'])):.2f}"]
+            yield [label, f"{from_cents(shown(totals[account_type])):.2f}"]
+        yield []
+        yield [
+            "Total Liabilities & Equity",
+            f"{from_cents(abs(totals['Liability']) + abs(totals['Equity'])):.2f}",
+        ]
+
+    @staticmethod
+    def _income_statement_csv(summary: ReportSummary, start_date: str, end_date: str) -> Iterator[list]:
+        totals = summary["period_totals"]
+        yield ["Income Statement", f"{start_date} to {end_date}"]
+        yield []
+        yield ["REVENUE"]
+        for acc in summary["period"]["Revenue"]:
+            yield [f"{acc['code']} - {acc['name']}", f"{from_cents(abs(acc['balance'])):.2f}"]
+        yield ["Total Revenue", f"{from_cents(abs(totals['Revenue'])):.2f}"]
+        yield []
+        yield ["EXPENSES"]
+        for acc in summary["period"]["Expense"]:
+            yield [f"{acc['code']} - {acc['name']}", f"{from_cents(acc['balance']):.2f}"]
+        yield ["Total Expenses", f"{from_cents(totals['Expense']):.2f}"]
+        yield []
+        yield ["Net Income", f"{from_cents(abs(totals['Revenue']) - totals['Expense']):.2f}"]
+
+    def _general_ledger_csv(self, account_id: str) -> Iterator[list]:
+        """General Ledger rows for ``account_id``.
+
+        The account's postings are copied when the export is requested, with
+        the transaction each belongs to (transactions are replaced, never
+        changed in place), so later edits do not reach the download.
+        """
+        position = self._account_index.position(account_id)
+        if position < 0:
+            return self._general_ledger_rows([], 1)
+        account = self._accounts[position]
+        slot = self._account_index.intern(account["id"])
+        transactions = _unproxied(self._transactions)
+        postings = [
+            (transactions[row], debit, credit, cumulative)
+            for row, debit, credit, cumulative in self._balance_index.iter_postings(slot)
+        ]
+        return self._general_ledger_rows(postings, 1 if account["type"] in ["Asset", "Expense"] else -1)
+
+    @staticmethod
+    def _general_ledger_rows(postings: list[tuple[Transaction, int, int, int]], sign: int) -> Iterator[list]:
+        yield ["Date", "Description", "Debit", "Credit", "Balance"]
+        for txn, debit, credit, cumulative in postings:
+            yield [
+                txn["date"],
+                txn["description"],
+                f"{from_cents(debit):.2f}" if debit > 0 else "",
+                f"{from_cents(credit):.2f}" if credit > 0 else "",
+                f"{from_cents(sign * cumulative):.2f}",
+            ]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def asset_count(self) -> int:
-        return len([acc for acc in self.accounts if acc["type"] == "Asset"])
-    
-    @rx.var
+        return self._report_summary()["counts"]["Asset"]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def liability_count(self) -> int:
-        return len([acc for acc in self.accounts if acc["type"] == "Liability"])
-    
-    @rx.var
+        return self._report_summary()["counts"]["Liability"]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def equity_count(self) -> int:
-        return len([acc for acc in self.accounts if acc["type"] == "Equity"])
-    
-    @rx.var
+        return self._report_summary()["counts"]["Equity"]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def revenue_count(self) -> int:
-        return len([acc for acc in self.accounts if acc["type"] == "Revenue"])
-    
-    @rx.var
+        return self._report_summary()["counts"]["Revenue"]
+
+    @rx.var(deps=[LedgerState.ledger_version])
     def expense_count(self) -> int:
-        return len([acc for acc in self.accounts if acc["type"] == "Expense"])
\ No newline at end of file
+        return self._report_summary()["counts"]["Expense"]
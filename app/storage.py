@@ -0,0 +1,348 @@
+"""Ledger storage helpers.
+
+By default the ledger lives only in the browser's LocalStorage, with
+transactions sharded into one key per month (see ``shard_key``) so a write
+only touches the months it changed. Setting
+``LEDGER_STORAGE=sqlite`` keeps an authoritative copy in a local SQLite file
+(``LEDGER_SQLITE_PATH``, default ``ledger.db``) so page loads read it
+instead of parsing the LocalStorage blob, and transaction filters and
+period reports look rows up through its date, account and amount indexes.
+"""
+
+import json
+import os
+import sqlite3
+import zlib
+from contextlib import contextmanager
+from typing import Iterator
+
+# LocalStorage key prefix for per-month transaction shards, e.g. "transactions_2024-05".
+SHARD_KEY_PREFIX = "transactions_"
+
+
+def month_key(date: str) -> str:
+    """Return the ``YYYY-MM`` shard a transaction dated ``date`` belongs to."""
+    return date[:7]
+
+
+def shard_key(month: str) -> str:
+    return f"{SHARD_KEY_PREFIX}{month}"
+
+
+def months_in_range(months, start_date: str = "", end_date: str = "") -> list[str]:
+    """Return the sorted shard months overlapping ``[start_date, end_date]``."""
+    start = month_key(start_date) if start_date else ""
+    end = month_key(end_date) if end_date else ""
+    return sorted(m for m in months if (not start or m >= start) and (not end or m <= end))
+
+
+def shard_digest(data: str) -> str:
+    """Fingerprint of a shard's JSON, recorded in the manifest when it is written."""
+    return format(zlib.crc32(data.encode()), "08x")
+
+
+def read_shards_script(months: list[str]) -> str:
+    """JavaScript returning ``{month: shard_json}`` for ``months``."""
+    return (
+        f"Object.fromEntries({json.dumps(months)}.map((m) => "
+        f"[m, localStorage.getItem({json.dumps(SHARD_KEY_PREFIX)} + m) || '[]']))"
+    )
+
+
+def write_shards_script(shards: dict[str, str], removed: list[str]) -> str:
+    """JavaScript storing ``{month: shard_json}`` and dropping ``removed`` months."""
+    prefix = json.dumps(SHARD_KEY_PREFIX)
+    return (
+        f"for (const [m, data] of Object.entries({json.dumps(shards)})) "
+        f"localStorage.setItem({prefix} + m, data); "
+        f"for (const m of {json.dumps(removed)}) localStorage.removeItem({prefix} + m);"
+    )
+
+
+# Amounts are stored as integer cents, the engine's in-memory representation.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    code TEXT NOT NULL,
+    type TEXT NOT NULL,
+    balance INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,
+    description TEXT NOT NULL,
+    amount INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS entries (
+    transaction_id TEXT NOT NULL REFERENCES transactions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    account_id TEXT NOT NULL,
+    debit INTEGER NOT NULL DEFAULT 0,
+    credit INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (transaction_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
+CREATE INDEX IF NOT EXISTS idx_transactions_amount ON transactions(amount);
+CREATE INDEX IF NOT EXISTS idx_entries_account ON entries(account_id, transaction_id);
+"""
+
+
+class SQLiteLedgerStore:
+    """Ledger persisted in a local SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def is_empty(self) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM accounts) + (SELECT COUNT(*) FROM transactions)"
+            ).fetchone()
+        return row[0] == 0
+
+    def load(self) -> tuple[list[dict], list[dict]]:
+        """Return ``(accounts, transactions)`` in insertion order."""
+        with self._connect() as conn:
+            accounts = [
+                dict(row)
+                for row in conn.execute(
+                    "SELECT id, name, code, type, balance FROM accounts ORDER BY code"
+                )
+            ]
+            transactions = self._fetch_transactions(
+                conn, "SELECT id, date, description FROM transactions ORDER BY seq", ()
+            )
+        return accounts, transactions
+
+    def replace_all(self, accounts: list[dict], transactions: list[dict]):
+        """Overwrite the stored ledger with ``accounts`` and ``transactions``."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM transactions")
+            conn.execute("DELETE FROM accounts")
+            self._insert_accounts(conn, accounts)
+            for txn in transactions:
+                self._insert_transaction(conn, txn)
+
+    def save_accounts(self, accounts: list[dict]):
+        """Insert ``accounts``, or update the name, code and type of existing ones.
+
+        Stored balances are left alone: they only move through postings, so
+        a session holding an older copy of the ledger cannot overwrite them.
+        """
+        with self._connect() as conn:
+            self._insert_accounts(conn, accounts)
+
+    def append_transactions(self, transactions: list[dict]):
+        """Insert ``transactions`` and add their entries to the account balances."""
+        with self._connect() as conn:
+            for txn in transactions:
+                self._insert_transaction(conn, txn)
+                self._apply_entries(conn, txn["entries"])
+
+    def update_transaction(self, txn: dict):
+        """Rewrite ``txn`` in place, moving its balance effects to the new entries."""
+        with self._connect() as conn:
+            self._apply_entries(conn, self._stored_entries(conn, txn["id"]), sign=-1)
+            conn.execute(
+                "UPDATE transactions SET date = ?, description = ?, amount = ? WHERE id = ?",
+                (txn["date"], txn["description"], sum(e["debit"] for e in txn["entries"]), txn["id"]),
+            )
+            conn.execute("DELETE FROM entries WHERE transaction_id = ?", (txn["id"],))
+            self._insert_entries(conn, txn)
+            self._apply_entries(conn, txn["entries"])
+
+    def delete_transaction(self, transaction_id: str):
+        """Delete a transaction (its entries cascade) and reverse its balance effects."""
+        with self._connect() as conn:
+            self._apply_entries(conn, self._stored_entries(conn, transaction_id), sign=-1)
+            conn.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
+
+    def recompute_balances(self):
+        """Set every account balance to the net of its stored entries."""
+        with self._connect() as conn:
+            # One grouped pass over entries rather than a lookup per account.
+            conn.execute(
+                "WITH net AS (SELECT account_id, SUM(debit - credit) AS total "
+                "FROM entries GROUP BY account_id) "
+                "UPDATE accounts SET balance = "
+                "(CASE WHEN type IN ('Asset', 'Expense') THEN 1 ELSE -1 END) * "
+                "COALESCE((SELECT total FROM net WHERE net.account_id = accounts.id), 0)"
+            )
+
+    # Indexed lookups. Each returns transaction ids (or per-account totals);
+    # the caller maps ids to its in-memory rows.
+
+    def transaction_ids_between(self, start_date: str = "", end_date: str = "") -> list[str]:
+        """Ids of transactions dated within ``[start_date, end_date]``, by date (idx_transactions_date)."""
+        clauses, params = self._date_clauses(start_date, end_date)
+        with self._connect() as conn:
+            return [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM transactions {clauses} ORDER BY date, seq", params
+                )
+            ]
+
+    def account_transaction_ids(self, account_id: str) -> list[str]:
+        """Ids of transactions with an entry posting to ``account_id`` (idx_entries_account)."""
+        with self._connect() as conn:
+            return [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT transaction_id FROM entries WHERE account_id = ?",
+                    (account_id,),
+                )
+            ]
+
+    def transaction_ids_by_amount(self, min_amount: int, max_amount: float) -> list[str]:
+        """Ids of transactions totalling ``[min_amount, max_amount]`` cents (idx_transactions_amount)."""
+        with self._connect() as conn:
+            if max_amount == float("inf"):
+                rows = conn.execute(
+                    "SELECT id FROM transactions WHERE amount >= ? ORDER BY amount", (min_amount,)
+                )
+            else:
+                rows = conn.execute(
+                    "SELECT id FROM transactions WHERE amount BETWEEN ? AND ? ORDER BY amount",
+                    (min_amount, max_amount),
+                )
+            return [row[0] for row in rows]
+
+    def net_between(self, start_date: str = "", end_date: str = "") -> dict[str, int]:
+        """Account id -> ``debit - credit`` cents posted within ``[start_date, end_date]``.
+
+        Transactions are found through idx_transactions_date and their
+        entries through the entries primary key.
+        """
+        clauses, params = self._date_clauses(start_date, end_date, "t.")
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT e.account_id, SUM(e.debit - e.credit) FROM transactions t "
+                f"JOIN entries e ON e.transaction_id = t.id {clauses} GROUP BY e.account_id",
+                params,
+            )
+            return {account_id: net for account_id, net in rows}
+
+    @staticmethod
+    def _date_clauses(start_date: str, end_date: str, prefix: str = "") -> tuple[str, list[str]]:
+        clauses: list[str] = []
+        params: list[str] = []
+        if start_date:
+            clauses.append(f"{prefix}date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append(f"{prefix}date <= ?")
+            params.append(end_date)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    @staticmethod
+    def _insert_accounts(conn: sqlite3.Connection, accounts: list[dict]):
+        # Plain tuples: the accounts may be Reflex state proxies, which
+        # sqlite3 cannot read named parameters from.
+        conn.executemany(
+            "INSERT INTO accounts (id, name, code, type, balance) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name, code = excluded.code, "
+            "type = excluded.type",
+            [(a["id"], a["name"], a["code"], a["type"], a["balance"]) for a in accounts],
+        )
+
+    @staticmethod
+    def _stored_entries(conn: sqlite3.Connection, transaction_id: str) -> list[dict]:
+        return [
+            dict(row)
+            for row in conn.execute(
+                "SELECT account_id, debit, credit FROM entries WHERE transaction_id = ?",
+                (transaction_id,),
+            )
+        ]
+
+    @staticmethod
+    def _apply_entries(conn: sqlite3.Connection, entries: list[dict], sign: int = 1):
+        """Add (or with ``sign=-1``, reverse) ``entries``' effect on the stored balances."""
+        net_by_account: dict[str, int] = {}
+        for e in entries:
+            net_by_account[e["account_id"]] = (
+                net_by_account.get(e["account_id"], 0) + sign * (e["debit"] - e["credit"])
+            )
+        conn.executemany(
+            "UPDATE accounts SET balance = balance + "
+            "(CASE WHEN type IN ('Asset', 'Expense') THEN ? ELSE -? END) WHERE id = ?",
+            [(net, net, account_id) for account_id, net in net_by_account.items()],
+        )
+
+    @staticmethod
+    def _insert_transaction(conn: sqlite3.Connection, txn: dict):
+        amount = sum(e["debit"] for e in txn["entries"])
+        conn.execute(
+            "INSERT INTO transactions (id, date, description, amount) VALUES (?, ?, ?, ?)",
+            (txn["id"], txn["date"], txn["description"], amount),
+        )
+        SQLiteLedgerStore._insert_entries(conn, txn)
+
+    @staticmethod
+    def _insert_entries(conn: sqlite3.Connection, txn: dict):
+        conn.executemany(
+            "INSERT INTO entries (transaction_id, position, account_id, debit, credit) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (txn["id"], i, e["account_id"], e["debit"], e["credit"])
+                for i, e in enumerate(txn["entries"])
+            ],
+        )
+
+    @staticmethod
+    def _fetch_transactions(conn: sqlite3.Connection, sql: str, params) -> list[dict]:
+        transactions = [
+            {**dict(row), "entries": []} for row in conn.execute(sql, params)
+        ]
+        by_id = {t["id"]: t for t in transactions}
+        if not by_id:
+            return transactions
+        # Entries are fetched in chunks to stay under SQLite's variable limit.
+        ids = list(by_id)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            rows = conn.execute(
+                "SELECT transaction_id, account_id, debit, credit FROM entries "
+                f"WHERE transaction_id IN ({', '.join('?' * len(chunk))}) "
+                "ORDER BY transaction_id, position",
+                chunk,
+            )
+            for row in rows:
+                by_id[row["transaction_id"]]["entries"].append(
+                    {
+                        "account_id": row["account_id"],
+                        "debit": row["debit"],
+                        "credit": row["credit"],
+                    }
+                )
+        return transactions
+
+
+_store: SQLiteLedgerStore | None = None
+
+
+def get_ledger_store() -> SQLiteLedgerStore | None:
+    """Return the configured server-side store, or ``None`` for LocalStorage only."""
+    global _store
+    if os.environ.get("LEDGER_STORAGE", "local").lower() != "sqlite":
+        return None
+    if _store is None:
+        _store = SQLiteLedgerStore(os.environ.get("LEDGER_SQLITE_PATH", "ledger.db"))
+    return _store
@@ -0,0 +1,180 @@
+"""Backup export and streaming import (app.backup, LedgerState.import_data)."""
+
+import asyncio
+import base64
+import json
+
+import pytest
+from reflex.state import State
+
+from app.backup import BackupReader
+from app.state import LedgerState
+
+BACKUP = (
+    '{"version": -1.5e3, "accounts": [{"id": "a1", "name": "Caf\u00e9 \u2615", "balance": 1e2},'
+    ' {"id": "a2", "tags": [true, null, 0.25]}], "exported": "2024-01-01",'
+    ' "transactions": [{"id": "t1", "entries": []}], "count": 12}'
+).encode()
+EXPECTED = [
+    ("accounts", {"id": "a1", "name": "Café ☕", "balance": 100.0}),
+    ("accounts", {"id": "a2", "tags": [True, None, 0.25]}),
+    ("transactions", {"id": "t1", "entries": []}),
+]
+
+
+def read(data: bytes, splits: list[int]) -> list[tuple[str, dict]]:
+    """Parse ``data`` fed in the chunks between the ``splits`` offsets."""
+    reader = BackupReader()
+    records = []
+    for start, end in zip([0, *splits], [*splits, len(data)]):
+        records += reader.feed(data[start:end])
+    return records + reader.close()
+
+
+class Upload:
+    """Stand-in for ``rx.UploadFile``: ``read(size)`` over fixed bytes."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    async def read(self, size: int) -> bytes:
+        chunk = self.data[self.offset : self.offset + size]
+        self.offset += size
+        return chunk
+
+
+def new_session() -> LedgerState:
+    root = State(_reflex_internal_init=True)
+    ledger = root.get_substate(LedgerState.get_full_name().split(".")[1:])
+    asyncio.run(LedgerState.load_shards.fn(ledger, {}))
+    return ledger
+
+
+def account_id(ledger: LedgerState, code: str) -> str:
+    return next(acc["id"] for acc in ledger._accounts if acc["code"] == code)
+
+
+def balances(ledger: LedgerState) -> dict[str, int]:
+    return {acc["code"]: acc["balance"] for acc in ledger._accounts}
+
+
+def export(ledger: LedgerState) -> dict:
+    url = LedgerState.export_data.fn(ledger).args[0][1]._var_value
+    return json.loads(base64.b64decode(url.split(",", 1)[1]))
+
+
+def import_backup(ledger: LedgerState, backup: dict) -> list:
+    async def run():
+        data = json.dumps(backup).encode()
+        return [update async for update in LedgerState.import_data.fn(ledger, [Upload(data)])]
+
+    return asyncio.run(run())
+
+
+def post_sale(ledger: LedgerState, amount: float):
+    ledger.post_transactions([{
+        "date": "2024-03-01",
+        "description": "Sale",
+        "entries": [
+            {"account_id": account_id(ledger, "1010"), "debit": amount, "credit": 0},
+            {"account_id": account_id(ledger, "4010"), "debit": 0, "credit": amount},
+        ],
+    }])
+
+
+def test_export_import_round_trip_keeps_opening_balances():
+    ledger = new_session()
+    post_sale(ledger, 12.5)
+    backup = export(ledger)
+    cash = next(acc for acc in backup["accounts"] if acc["code"] == "1010")
+    assert cash["balance"] == cash["opening_balance"] + 12.5
+
+    restored = new_session()
+    import_backup(restored, backup)
+    assert balances(restored) == balances(ledger)
+
+
+def test_import_rejects_balances_that_disagree_with_entries():
+    ledger = new_session()
+    post_sale(ledger, 12.5)
+    backup = export(ledger)
+    next(acc for acc in backup["accounts"] if acc["code"] == "1010")["balance"] += 1000
+
+    target = new_session()
+    before = balances(target)
+    import_backup(target, backup)
+    assert balances(target) == before
+    assert target._transactions == []
+
+
+def test_import_rebuilds_balances_from_entries():
+    ledger = new_session()
+    post_sale(ledger, 12.5)
+    backup = export(ledger)
+    for acc in backup["accounts"]:
+        del acc["balance"]
+
+    restored = new_session()
+    import_backup(restored, backup)
+    assert balances(restored) == balances(ledger)
+
+
+def test_reader_one_byte_chunks():
+    assert read(BACKUP, list(range(1, len(BACKUP)))) == EXPECTED
+
+
+def test_reader_every_chunk_boundary():
+    # Covers numbers cut after "-", "1.", "e" and multi-byte characters cut mid-sequence.
+    for split in range(1, len(BACKUP)):
+        assert read(BACKUP, [split]) == EXPECTED, split
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '{"accounts": [{}, , {}], "transactions": []}',
+        '{"accounts": [{} {}], "transactions": []}',
+        '{"accounts": [, {}], "transactions": []}',
+        '{"accounts": [{},], "transactions": []}',
+        '{"accounts": [] "transactions": []}',
+        '{, "accounts": [], "transactions": []}',
+        '{"accounts": [], "transactions": [],}',
+        '{"accounts": [], "transactions": [], "accounts": []}',
+        '{"accounts": [1], "transactions": []}',
+        '{"n": 1.5.2, "accounts": [], "transactions": []}',
+        '{"accounts": [], "transactions": []} {}',
+    ],
+)
+def test_reader_rejects_malformed_structure(data):
+    data = data.encode()
+    for splits in ([], list(range(1, len(data)))):
+        with pytest.raises(ValueError):
+            read(data, splits)
+
+
+def test_import_rejects_transactions_before_accounts():
+    ledger = new_session()
+    accounts = export(ledger)["accounts"]
+    for acc in accounts:
+        # Stated balances agree with the entries, so only the section order is wrong.
+        if acc["code"] in ("1010", "4010"):
+            acc["balance"] += 1
+    backup = {
+        "transactions": [{
+            "id": "t1",
+            "date": "2024-03-01",
+            "description": "Sale",
+            "entries": [
+                {"account_id": account_id(ledger, "1010"), "debit": 1, "credit": 0},
+                {"account_id": account_id(ledger, "4010"), "debit": 0, "credit": 1},
+            ],
+        }],
+        "accounts": accounts,
+    }
+
+    target = new_session()
+    before = balances(target)
+    import_backup(target, backup)
+    assert balances(target) == before
+    assert target._transactions == []
@@ -0,0 +1,84 @@
+"""Streaming CSV exports (app.export, ReportState.export_report_csv)."""
+
+import asyncio
+import csv
+import io
+
+from reflex.state import State
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+import app.export
+from app.export import csv_chunks, mount_export_route, register_export
+from app.state import LedgerState, ReportState
+
+
+def client() -> TestClient:
+    return TestClient(mount_export_route(Starlette()))
+
+
+def parse(text: str) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(text)))
+
+
+def test_csv_chunks_hold_chunk_rows_each():
+    rows = [["Date", "Description"], *([f"2024-01-{day:02d}", f'Sale, "no. {day}"'] for day in range(1, 8))]
+    chunks = list(csv_chunks(rows, chunk_rows=3))
+    assert [len(parse(chunk)) for chunk in chunks] == [3, 3, 2]
+    assert parse("".join(chunks)) == rows
+    assert list(csv_chunks([], chunk_rows=3)) == []
+    assert len(list(csv_chunks(rows[:6], chunk_rows=3))) == 2
+
+
+def test_export_ticket_is_single_use():
+    path = register_export("report.csv", iter([["a", "b"], ["1", "2"]]))
+    with client() as http:
+        response = http.get(path)
+        assert response.status_code == 200
+        assert parse(response.text) == [["a", "b"], ["1", "2"]]
+        assert 'filename="report.csv"' in response.headers["content-disposition"]
+        assert http.get(path).status_code == 404
+        assert http.get("/export/unknown").status_code == 404
+
+
+def test_expired_export_is_refused(monkeypatch):
+    path = register_export("report.csv", [["a"]])
+    monkeypatch.setattr(app.export, "EXPORT_TTL_SECONDS", -1)
+    with client() as http:
+        assert http.get(path).status_code == 404
+
+
+def test_general_ledger_export_ignores_later_edits():
+    root = State(_reflex_internal_init=True)
+    ledger = root.get_substate(LedgerState.get_full_name().split(".")[1:])
+    asyncio.run(LedgerState.load_shards.fn(ledger, {}))
+    report = root.get_substate(ReportState.get_full_name().split(".")[1:])
+    cash, sales = (next(acc["id"] for acc in ledger._accounts if acc["code"] == code) for code in ("1010", "4010"))
+
+    def post(amount: float):
+        ledger.post_transactions([{
+            "date": "2024-03-01",
+            "description": "Sale",
+            "entries": [
+                {"account_id": cash, "debit": amount, "credit": 0},
+                {"account_id": sales, "debit": 0, "credit": amount},
+            ],
+        }])
+
+    post(12.5)
+    post(3)
+    report.active_report_tab = "general_ledger"
+    report.general_ledger_account_id = cash
+    before = set(app.export._pending)
+    ReportState.export_report_csv.fn(report)
+    (ticket,) = set(app.export._pending) - before
+
+    post(100)
+    LedgerState.delete_transaction.fn(ledger, ledger._transactions[0]["id"])
+    with client() as http:
+        response = http.get(app.export.EXPORT_ROUTE.format(ticket=ticket))
+    assert parse(response.text) == [
+        ["Date", "Description", "Debit", "Credit", "Balance"],
+        ["2024-03-01", "Sale", "12.50", "", "12.50"],
+        ["2024-03-01", "Sale", "3.00", "", "15.50"],
+    ]
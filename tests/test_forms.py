@@ -0,0 +1,51 @@
+"""Account and transaction forms validating against their copy of the chart."""
+
+import asyncio
+
+from reflex.state import State
+
+from app.state import AccountFormState, LedgerState, TransactionFormState
+
+NEW_ACCOUNT = {"id": "acc-1999", "name": "Petty Cash", "code": "1999", "type": "Asset", "balance": 0}
+
+
+def open_forms() -> tuple[LedgerState, AccountFormState, TransactionFormState]:
+    """A loaded session with both forms open, so each holds a copy of the chart."""
+    root = State(_reflex_internal_init=True)
+
+    def substate(cls):
+        return root.get_substate(cls.get_full_name().split(".")[1:])
+
+    ledger = substate(LedgerState)
+    asyncio.run(LedgerState.load_shards.fn(ledger, {}))
+    accounts, transactions = substate(AccountFormState), substate(TransactionFormState)
+    asyncio.run(AccountFormState.toggle_account_form.fn(accounts))
+    asyncio.run(TransactionFormState.toggle_transaction_form.fn(transactions))
+    return ledger, accounts, transactions
+
+
+def test_account_form_rechecks_codes_added_after_it_opened():
+    ledger, form, _ = open_forms()
+    ledger._add_account(dict(NEW_ACCOUNT))
+    form.new_account_name = "Duplicate"
+    form.new_account_code = "1999"
+    asyncio.run(AccountFormState.create_account.fn(form))
+    assert [acc["name"] for acc in ledger._accounts if acc["code"] == "1999"] == ["Petty Cash"]
+    assert form.account_code_error == form.t["error_code_exists"]
+
+
+def test_transaction_form_accepts_accounts_added_after_it_opened():
+    ledger, _, form = open_forms()
+    ledger._add_account(dict(NEW_ACCOUNT))
+    cash = next(acc["id"] for acc in ledger._accounts if acc["code"] == "1010")
+    form.new_transaction_description = "Fund petty cash"
+    for index, field, value in [
+        (0, "account_id", NEW_ACCOUNT["id"]),
+        (0, "debit", "5"),
+        (1, "account_id", cash),
+        (1, "credit", "5"),
+    ]:
+        asyncio.run(TransactionFormState.update_entry.fn(form, index, field, value))
+    assert form.is_transaction_form_valid
+    asyncio.run(TransactionFormState.create_transaction.fn(form))
+    assert [txn["description"] for txn in ledger._transactions] == ["Fund petty cash"]
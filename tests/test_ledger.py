@@ -0,0 +1,289 @@
+"""Ledger indexes (app.ledger) checked against brute force.
+
+The index classes are driven directly with random batches, edits and
+deletes; ``LedgerState`` is then driven the same way, through tombstones
+and compaction, with every index and the transaction list query compared to
+what the surviving transactions say it should hold.
+"""
+
+import asyncio
+import random
+
+import pytest
+from reflex.state import State
+
+from app.ledger import (
+    INSERT_BATCH,
+    AmountIndex,
+    BalanceIndex,
+    DateIndex,
+    DescriptionIndex,
+    date_ordinal,
+    keyset_page,
+)
+from app.state import TOMBSTONE_COMPACTION_SHARE, LedgerState
+from app.storage import month_key
+
+WORDS = ["Rent", "Coffee", "Café", "Salary", "Supplies"]
+NEEDLES = ["", "ren", "caf", "café", "co", "salary 1", "xyz"]
+
+
+def random_transaction(rnd: random.Random, accounts: list) -> dict:
+    """A balanced two-entry transaction in cents; ``accounts`` are slots or ids."""
+    amount = rnd.randint(1, 2000)
+    debit_account, credit_account = rnd.sample(accounts, 2)
+    return {
+        "date": f"2024-{rnd.randint(1, 4):02d}-{rnd.randint(1, 3):02d}",
+        "description": f"{rnd.choice(WORDS)} {rnd.randint(1, 20)}",
+        "entries": [
+            {"account_id": debit_account, "debit": amount, "credit": 0},
+            {"account_id": credit_account, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def total(txn: dict) -> int:
+    return sum(e["debit"] for e in txn["entries"])
+
+
+def expected_postings(live: dict[int, dict], account) -> list[tuple[int, int, int, int]]:
+    """``(row, debit, credit, cumulative)`` of ``account``'s entries in date, then row, order."""
+    postings = sorted(
+        (date_ordinal(txn["date"]), row, e["debit"], e["credit"])
+        for row, txn in live.items()
+        for e in txn["entries"]
+        if e["account_id"] == account
+    )
+    running, expected = 0, []
+    for _, row, debit, credit in postings:
+        running += debit - credit
+        expected.append((row, debit, credit, running))
+    return expected
+
+
+def assert_indexes_match(
+    live: dict[int, dict],
+    date_index: DateIndex,
+    amount_index: AmountIndex,
+    description_index: DescriptionIndex,
+    balance_index: BalanceIndex,
+    accounts: dict[int, object],
+):
+    """Compare the indexes over ``live`` rows; ``accounts`` maps slot -> entry ``account_id``."""
+    by_date = sorted(live, key=lambda row: (live[row]["date"], -row))
+    assert date_index.rows == by_date
+    assert date_index.dates == [live[row]["date"] for row in by_date]
+    for start, end in [("2024-02-01", "2024-03-02"), ("", "2024-01-02"), ("2024-04-03", "")]:
+        assert date_index.rows_between(start, end) == [
+            row for row in reversed(by_date) if (not start or live[row]["date"] >= start)
+            and (not end or live[row]["date"] <= end)
+        ]
+
+    by_amount = sorted(live, key=lambda row: (total(live[row]), row))
+    assert amount_index.rows == by_amount
+    assert all(amount_index.totals[row] == total(live[row]) for row in live)
+    assert amount_index.rows_between(500, 1500) == [
+        row for row in by_amount if 500 <= total(live[row]) <= 1500
+    ]
+
+    # Deleted rows keep an empty description, so the empty needle is not checked here.
+    for needle in NEEDLES[1:]:
+        candidates = description_index.candidates(needle)
+        if candidates is None:
+            candidates = range(len(description_index.lowered))
+        found = sorted(row for row in candidates if description_index.matches(row, needle))
+        assert found == sorted(row for row in live if needle in live[row]["description"].lower())
+
+    for slot, account in accounts.items():
+        postings = expected_postings(live, account)
+        assert balance_index.postings(slot) == postings
+        assert balance_index.net_total(slot) == (postings[-1][3] if postings else 0)
+        for date in ["2024-01-01", "2024-02-02", "2024-04-03"]:
+            ordinal = date_ordinal(date)
+            assert balance_index.net_as_of(slot, ordinal) == sum(
+                debit - credit
+                for row, debit, credit, _ in postings
+                if date_ordinal(live[row]["date"]) <= ordinal
+            )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_indexes_match_brute_force(seed):
+    rnd = random.Random(seed)
+    slots = list(range(5))
+    live: dict[int, dict] = {}
+    date_index, amount_index = DateIndex(), AmountIndex()
+    description_index, balance_index = DescriptionIndex(), BalanceIndex()
+
+    def index(rows: list[int]):
+        for row in rows:
+            description_index.add(row, live[row]["description"])
+        date_index.add_many([(live[row]["date"], row) for row in rows])
+        amount_index.add_many([(row, live[row]["entries"]) for row in rows])
+        balance_index.add_many([
+            (e["account_id"], date_ordinal(live[row]["date"]), row, e["debit"], e["credit"])
+            for row in rows
+            for e in live[row]["entries"]
+        ])
+
+    def unindex(row: int):
+        txn = live.pop(row)
+        date_index.discard(txn["date"], row)
+        amount_index.discard(row)
+        description_index.discard(row)
+        for slot in {e["account_id"] for e in txn["entries"]}:
+            balance_index.discard(slot, date_ordinal(txn["date"]), row)
+
+    next_row = 0
+    for step in range(120):
+        action = rnd.random()
+        if action < 0.3 or not live:
+            # Mostly small batches; now and then one large enough to be merged.
+            size = INSERT_BATCH + 1 if step % 40 == 39 else rnd.choice([1, 2, 5])
+            rows = list(range(next_row, next_row + size))
+            next_row += size
+            for row in rows:
+                live[row] = random_transaction(rnd, slots)
+            index(rows)
+        elif action < 0.7:
+            row = rnd.choice(list(live))
+            unindex(row)
+            live[row] = random_transaction(rnd, slots)
+            index([row])
+        else:
+            unindex(rnd.choice(list(live)))
+        if step % 10 == 9:
+            assert_indexes_match(
+                live, date_index, amount_index, description_index, balance_index,
+                {slot: slot for slot in slots},
+            )
+
+
+def new_session() -> LedgerState:
+    root = State(_reflex_internal_init=True)
+    ledger = root.get_substate(LedgerState.get_full_name().split(".")[1:])
+    asyncio.run(LedgerState.load_shards.fn(ledger, {}))
+    return ledger
+
+
+def in_units(txn: dict) -> dict:
+    """``txn`` with amounts in currency units, as ``post_transactions`` takes them."""
+    return {
+        **txn,
+        "entries": [
+            {**e, "debit": e["debit"] / 100, "credit": e["credit"] / 100} for e in txn["entries"]
+        ],
+    }
+
+
+def live_rows(ledger: LedgerState) -> dict[int, dict]:
+    return {row: txn for row, txn in enumerate(ledger._transactions) if txn is not None}
+
+
+def assert_ledger_indexes_match(ledger: LedgerState):
+    live = live_rows(ledger)
+    accounts = {ledger._account_index.slot(acc["id"]): acc["id"] for acc in ledger._accounts}
+    assert_indexes_match(
+        live,
+        ledger._date_index,
+        ledger._amount_index,
+        ledger._description_index,
+        ledger._balance_index,
+        accounts,
+    )
+    assert ledger._row_by_id == {txn["id"]: row for row, txn in live.items()}
+    rollup: dict[str, dict[int, int]] = {}
+    for txn in live.values():
+        for e in txn["entries"]:
+            by_slot = rollup.setdefault(month_key(txn["date"]), {})
+            slot = ledger._account_index.slot(e["account_id"])
+            by_slot[slot] = by_slot.get(slot, 0) + e["debit"] - e["credit"]
+    for month in {*rollup, *ledger._monthly_rollup.months()}:
+        totals = ledger._monthly_rollup.month_totals(month)
+        assert {slot: net for slot, net in totals.items() if net} == {
+            slot: net for slot, net in rollup.get(month, {}).items() if net
+        }
+
+
+def query(ledger: LedgerState, params: tuple) -> list[int]:
+    """Rows matching the list filter ``params``, newest first, by brute force."""
+    start, end, description, account_id, min_text, max_text = params
+    low = float(min_text or 0) * 100
+    high = float(max_text) * 100 if max_text else float("inf")
+    live = live_rows(ledger)
+    return [
+        row
+        for row in sorted(live, key=lambda row: (live[row]["date"], -row), reverse=True)
+        if (not start or live[row]["date"] >= start)
+        and (not end or live[row]["date"] <= end)
+        and description.lower() in live[row]["description"].lower()
+        and (not account_id or any(e["account_id"] == account_id for e in live[row]["entries"]))
+        and low <= total(live[row]) <= high
+    ]
+
+
+def assert_pages_match(ledger: LedgerState, params: tuple, size: int = 4):
+    """Walk every keyset page older, then back newer, and compare with ``query``."""
+    plan = ledger._row_plan(params)
+    key = ledger._row_sort_key
+    pages = [keyset_page(plan, key, size)]
+    while pages[-1]:
+        pages.append(keyset_page(plan, key, size, key(pages[-1][-1])))
+    pages.pop()
+    expected = query(ledger, params)
+    assert [row for page in pages for row in page] == expected
+    for older, newer in zip(pages[1:], pages):
+        assert keyset_page(plan, key, size, key(older[0]), newer=True) == newer
+
+
+def test_ledger_state_indexes_through_edits_deletes_and_compaction():
+    rnd = random.Random(7)
+    ledger = new_session()
+    account_ids = [acc["id"] for acc in ledger._accounts[:6]]
+    compactions = 0
+    for step in range(150):
+        action = rnd.random()
+        live = live_rows(ledger)
+        if action < 0.35 or len(live) < 5:
+            ledger.post_transactions([
+                in_units(random_transaction(rnd, account_ids)) for _ in range(rnd.choice([1, 3]))
+            ])
+        elif action < 0.65:
+            row = rnd.choice(list(live))
+            ledger._replace_transaction(row, {
+                "id": live[row]["id"], **random_transaction(rnd, account_ids)
+            })
+        else:
+            tombstones = ledger._deleted_rows
+            LedgerState.delete_transaction.fn(ledger, live[rnd.choice(list(live))]["id"])
+            if ledger._deleted_rows < tombstones + 1:
+                compactions += 1
+                assert None not in ledger._transactions
+        if step % 10 == 9:
+            assert_ledger_indexes_match(ledger)
+            assert_pages_match(ledger, (
+                rnd.choice(["", "2024-02-01"]),
+                rnd.choice(["", "2024-03-02"]),
+                rnd.choice(NEEDLES[:-1]),
+                rnd.choice(["", *account_ids[:2]]),
+                rnd.choice(["", "5"]),
+                rnd.choice(["", "12.5"]),
+            ))
+    assert compactions
+
+
+def test_compaction_renumbers_rows():
+    ledger = new_session()
+    account_ids = [acc["id"] for acc in ledger._accounts[:2]]
+    rnd = random.Random(1)
+    ledger.post_transactions([in_units(random_transaction(rnd, account_ids)) for _ in range(8)])
+    kept = [txn["id"] for txn in ledger._transactions[2:]]
+    LedgerState.delete_transaction.fn(ledger, ledger._transactions[0]["id"])
+    assert ledger._transactions[0] is None
+    assert ledger._deleted_rows == 1 < TOMBSTONE_COMPACTION_SHARE * 8
+    LedgerState.delete_transaction.fn(ledger, ledger._transactions[1]["id"])
+    assert [txn["id"] for txn in ledger._transactions] == kept
+    assert ledger._deleted_rows == 0
+    assert_ledger_indexes_match(ledger)
+    for params in [("", "", "", "", "", ""), ("", "", "", account_ids[0], "", "10")]:
+        assert_pages_match(ledger, params, size=3)
@@ -0,0 +1,131 @@
+"""LedgerState running on the SQLite store (LEDGER_STORAGE=sqlite)."""
+
+import asyncio
+import json
+
+import pytest
+from reflex.state import State
+
+import app.state
+import app.storage
+from app.state import LedgerState
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("LEDGER_STORAGE", "sqlite")
+    monkeypatch.setenv("LEDGER_SQLITE_PATH", str(tmp_path / "ledger.db"))
+    monkeypatch.setattr(app.storage, "_store", None)
+    return app.storage.get_ledger_store()
+
+
+def new_session() -> LedgerState:
+    """A fresh browser session: default LocalStorage values, nothing loaded yet."""
+    root = State(_reflex_internal_init=True)
+    return root.get_substate(LedgerState.get_full_name().split(".")[1:])
+
+
+def load(ledger: LedgerState):
+    return asyncio.run(LedgerState.load_shards.fn(ledger, {}))
+
+
+def account_id(ledger: LedgerState, code: str) -> str:
+    return next(acc["id"] for acc in ledger._accounts if acc["code"] == code)
+
+
+def sale(ledger: LedgerState, date: str, amount: float) -> dict:
+    return {
+        "date": date,
+        "description": f"Sale {date}",
+        "entries": [
+            {"account_id": account_id(ledger, "1010"), "debit": amount, "credit": 0},
+            {"account_id": account_id(ledger, "4010"), "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def stored_balance(store, code: str) -> int:
+    accounts, _ = store.load()
+    return next(acc["balance"] for acc in accounts if acc["code"] == code)
+
+
+def test_sessions_post_balance_deltas(store):
+    first = new_session()
+    load(first)  # seeds the empty store
+    cash = stored_balance(store, "1010")
+    second = new_session()
+    load(second)
+
+    first.post_transactions([sale(first, "2024-01-05", 100)])
+    # The second session still holds the balance from before the first posting.
+    second.post_transactions([sale(second, "2024-01-06", 50)])
+
+    assert stored_balance(store, "1010") == cash + 15000
+    assert len(store.load()[1]) == 2
+
+
+def test_edit_delete_and_recompute(store):
+    ledger = new_session()
+    load(ledger)
+    cash = stored_balance(store, "1010")
+    ledger.post_transactions([sale(ledger, "2024-01-05", 100), sale(ledger, "2024-02-05", 20)])
+    first, second = ledger._transactions[-2:]
+
+    ledger.delete_transaction(second["id"])
+    assert stored_balance(store, "1010") == cash + 10000
+
+    ledger.recompute_balances_from_transactions()
+    assert stored_balance(store, "1010") == 10000
+    assert [t["id"] for t in store.load()[1]] == [first["id"]]
+
+
+def test_offline_cache_matches_manifest(store, monkeypatch):
+    written: dict[str, str] = {}
+    monkeypatch.setattr(
+        app.state, "write_shards_script", lambda shards, removed: written.update(shards) or ""
+    )
+    ledger = new_session()
+    load(ledger)
+    ledger.post_transactions(
+        [sale(ledger, f"2024-{month:02d}-10", 10) for month in range(1, 8)]
+    )
+
+    browser = new_session()
+    load(browser)
+
+    manifest = json.loads(browser.manifest_json)
+    assert sorted(manifest) == [f"2024-{month:02d}" for month in range(1, 8)]
+    assert json.loads(browser.journal_json) == []
+    assert sorted(written) == sorted(manifest)
+    assert sum(len(json.loads(shard)) for shard in written.values()) == 7
+    # Loading again with an up-to-date cache writes nothing.
+    assert load(browser) == []
+
+
+def test_filters_use_indexed_queries(store, monkeypatch):
+    ledger = new_session()
+    load(ledger)
+    rent = {
+        "date": "2024-06-30",
+        "description": "Rent",
+        "entries": [
+            {"account_id": account_id(ledger, "5010"), "debit": 80, "credit": 0},
+            {"account_id": account_id(ledger, "2010"), "debit": 0, "credit": 80},
+        ],
+    }
+    ledger.post_transactions(
+        [*(sale(ledger, f"2024-{month:02d}-10", 10 * month) for month in range(1, 7)), rent]
+    )
+    cash = account_id(ledger, "1010")
+    lookups: list[str] = []
+    for name in ("transaction_ids_between", "account_transaction_ids", "transaction_ids_by_amount"):
+        lookup = getattr(store, name)
+        monkeypatch.setattr(
+            store, name, lambda *args, name=name, lookup=lookup: lookups.append(name) or lookup(*args)
+        )
+
+    # start, end, description, account, min amount, max amount
+    assert ledger._filtered_count(("2024-02-01", "2024-04-30", "", "", "", "")) == 3
+    assert ledger._filtered_count(("", "", "", cash, "25", "45")) == 2
+    assert ledger._filtered_count(("", "", "", cash, "", "")) == 6
+    assert lookups == ["transaction_ids_between", "transaction_ids_by_amount", "account_transaction_ids"]